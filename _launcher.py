@@ -0,0 +1,53 @@
+"""
+Shared startup helper for the main*.py launchers.
+Resolves the application directory once and makes the src packages importable.
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+
+# Resolved once at import time
+APP_DIR = Path(__file__).resolve().parent
+SRC_DIR = str(APP_DIR / "src")
+
+# Modules the recorder cannot start without (import name, pip package)
+REQUIRED_MODULES = (
+    ("tkinter", "tk"),
+    ("numpy", "numpy"),
+    ("cv2", "opencv-python"),
+    ("mss", "mss"),
+)
+
+
+def bootstrap() -> Path:
+    """
+    Put the src directory on sys.path so ui/core/utils import directly.
+
+    Returns:
+        Application root directory
+    """
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
+    return APP_DIR
+
+
+def preflight() -> list[str]:
+    """
+    Check required modules are installed without importing them.
+
+    Returns:
+        Package names of missing dependencies (empty if all present)
+    """
+    missing = []
+    for module_name, package in REQUIRED_MODULES:
+        if importlib.util.find_spec(module_name) is None:
+            missing.append(package)
+    return missing
+
+
+def report_missing(missing: list[str]) -> None:
+    """Print install instructions for missing dependencies."""
+    print(f"❌ Missing dependencies: {', '.join(missing)}")
+    print("💡 Please ensure all dependencies are installed:")
+    print("   pip install -r requirements.txt")
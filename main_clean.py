@@ -5,18 +5,19 @@ Essential features only for a clean user experience.
 """
 
 import sys
-import os
+
+from _launcher import bootstrap, preflight, report_missing
 
 def main():
     """Launch the clean screen recorder application."""
-    # Set working directory and Python path
-    app_dir = os.path.dirname(os.path.abspath(__file__))
-    src_dir = os.path.join(app_dir, 'src')
+    # Make src packages importable
+    bootstrap()
     
-    # Change to app directory and add src to path
-    os.chdir(app_dir)
-    if src_dir not in sys.path:
-        sys.path.insert(0, src_dir)
+    # Check dependencies before paying for the Tk and OpenCV imports
+    missing = preflight()
+    if missing:
+        report_missing(missing)
+        sys.exit(1)
     
     try:
         # Import after path setup
@@ -5,28 +5,31 @@ Launches the professional UI with attractive design and multiple tabs.
 
 import os
 import sys
-import tkinter as tk
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-try:
-    from src.ui.modern_window import create_modern_app
-except ImportError:
-    # Fallback for direct execution
-    from ui.modern_window import create_modern_app
+from _launcher import APP_DIR, bootstrap, preflight, report_missing
 
 
 def main():
     """Main entry point for the modern screen recorder application."""
+    # Make src packages importable
+    bootstrap()
+    
+    # Check dependencies before paying for the Tk and OpenCV imports
+    missing = preflight()
+    if missing:
+        report_missing(missing)
+        sys.exit(1)
+    
     try:
+        from ui.modern_window import create_modern_app
+        
         # Create and run the modern application
         root = create_modern_app()
         
         # Set application icon if available
         try:
             # Try to set a custom icon (you can replace this with your own icon file)
-            icon_path = os.path.join(os.path.dirname(__file__), 'assets', 'icon.ico')
+            icon_path = os.path.join(APP_DIR, 'assets', 'icon.ico')
             if os.path.exists(icon_path):
                 root.iconbitmap(icon_path)
         except Exception:
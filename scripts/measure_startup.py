@@ -0,0 +1,109 @@
+"""
+Measure cold-start import cost of the Screen Recorder UI modules.
+Runs a fresh interpreter with -X importtime and reports per-module
+self/cumulative import time, slowest first.
+
+Usage:
+    python scripts/measure_startup.py [--module ui.modern_window]
+                                      [--csv startup.csv] [--raw importtime.log]
+
+The --raw log is the unmodified -X importtime output, which `tuna` reads.
+"""
+
+import argparse
+import csv
+import subprocess
+import sys
+from pathlib import Path
+
+# Repository root (holds _launcher.py and the main*.py entry points)
+APP_DIR = Path(__file__).resolve().parent.parent
+
+# Modules the launchers import before building a window
+DEFAULT_MODULE = "ui.modern_window"
+
+
+def run_importtime(module: str) -> str:
+    """
+    Import a module in a fresh interpreter with import timing enabled.
+
+    Args:
+        module: Dotted module name importable once src is on sys.path
+
+    Returns:
+        Raw -X importtime output (stderr of the child interpreter)
+
+    Raises:
+        RuntimeError: If the import failed in the child
+    """
+    code = f"import _launcher; _launcher.bootstrap(); import {module}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=APP_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"Importing {module} failed:\n{tail}")
+    return proc.stderr
+
+
+def parse_importtime(raw: str) -> list[tuple[float, float, str]]:
+    """
+    Parse -X importtime output.
+
+    Args:
+        raw: Output lines like "import time:   812 |   4210 |   cv2"
+
+    Returns:
+        List of (self_ms, cumulative_ms, module) sorted by cumulative time
+    """
+    rows = []
+    for line in raw.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # Column header line
+        rows.append((self_us / 1000.0, cum_us / 1000.0, parts[2].strip()))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows
+
+
+def main() -> None:
+    """Measure startup imports and print or save the breakdown."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default=DEFAULT_MODULE,
+                        help=f"module to import (default: {DEFAULT_MODULE})")
+    parser.add_argument("--csv", type=Path, help="write self_ms,cum_ms,module rows here")
+    parser.add_argument("--raw", type=Path, help="write the raw importtime log here (for tuna)")
+    parser.add_argument("--top", type=int, default=25, help="rows to print (default: 25)")
+    args = parser.parse_args()
+
+    try:
+        raw = run_importtime(args.module)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    rows = parse_importtime(raw)
+
+    if args.raw:
+        args.raw.write_text(raw)
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("self_ms", "cum_ms", "module"))
+            writer.writerows((f"{s:.3f}", f"{c:.3f}", name) for s, c, name in rows)
+
+    total = next((c for _, c, name in rows if name == args.module), 0.0)
+    print(f"⏱️ import {args.module}: {total:.1f} ms total")
+    print(f"{'self ms':>9} {'cum ms':>9}  module")
+    for self_ms, cum_ms, name in rows[:args.top]:
+        print(f"{self_ms:9.1f} {cum_ms:9.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
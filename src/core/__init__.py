@@ -1,7 +1,16 @@
 """Core recording functionality."""
 
 from .config import RecorderConfig
-from .video import ScreenRecorder
-from .audio import AudioRecorder
 
 __all__ = ["RecorderConfig", "ScreenRecorder", "AudioRecorder"]
+
+
+def __getattr__(name):
+    """Import the recorders on first access (they pull in OpenCV, NumPy and mss)."""
+    if name == "ScreenRecorder":
+        from .video import ScreenRecorder
+        return ScreenRecorder
+    if name == "AudioRecorder":
+        from .audio import AudioRecorder
+        return AudioRecorder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,12 +4,14 @@ Handles microphone input and system audio loopback recording.
 """
 
 import os
-import queue
 import tempfile
 import threading
-import datetime as dt
+import time
+import weakref
 from typing import Any, Optional, Callable
 
+import numpy as np
+
 # Optional dependencies - will be checked at runtime
 try:
     import sounddevice as sd
@@ -19,19 +21,42 @@ except ImportError:
     sf = None
 
 
+# Intermediate file formats: name -> (container, subtype, extension)
+AUDIO_FORMATS = {
+    "wav": ("WAV", "PCM_16", ".wav"),
+    "flac": ("FLAC", "PCM_16", ".flac"),   # Lossless, roughly half the size of WAV
+    "opus": ("OGG", "OPUS", ".ogg"),       # Lossy, ~10x smaller
+}
+
+# Sample rates accepted by the Opus encoder
+_OPUS_SAMPLERATES = (8000, 12000, 16000, 24000, 48000)
+
+# Recorders with an open PortAudio stream (re-initializing PortAudio closes them)
+_ACTIVE_RECORDERS: "weakref.WeakSet[AudioRecorder]" = weakref.WeakSet()
+
+
 class AudioRecorder:
     """
     Handles audio recording from microphone or system loopback.
     Supports Windows WASAPI loopback for system audio capture.
+    
+    The PortAudio callback copies samples straight into a preallocated ring
+    buffer; a writer thread drains it to disk. The callback is the only
+    producer and the writer the only consumer, so the indices need no lock;
+    the condition variable is only used to wake the writer.
     """
     
+    RING_SECONDS = 10      # Ring buffer capacity (absorbs multi-second disk stalls)
+    CHUNK_SECONDS = 0.1    # Amount of audio that wakes the writer
+    
     def __init__(
         self, 
         samplerate: int, 
         channels: int, 
         device: Optional[int], 
         loopback: bool = False,
-        status_callback: Optional[Callable[[str], None]] = None
+        status_callback: Optional[Callable[[str], None]] = None,
+        file_format: str = "wav"
     ):
         """
         Initialize audio recorder.
@@ -42,6 +67,7 @@ class AudioRecorder:
             device: Audio device ID (None for default)
             loopback: Whether to use system audio loopback (Windows only)
             status_callback: Optional callback for status updates
+            file_format: Intermediate file format ("wav", "flac" or "opus")
         """
         if sd is None or sf is None:
             raise RuntimeError("Audio dependencies missing (sounddevice, soundfile)")
@@ -53,11 +79,23 @@ class AudioRecorder:
         self.status_callback = status_callback or (lambda msg: None)
         
         # Internal state
-        self._q = queue.Queue(maxsize=64)
         self._stop = threading.Event()
-        self.wav_path = os.path.join(
+        
+        # Ring buffer (indices are monotonic frame counters, wrapped on access)
+        self._ring_frames = max(1, int(self.samplerate * self.RING_SECONDS))
+        self._chunk_frames = max(1, int(self.samplerate * self.CHUNK_SECONDS))
+        self._ring = np.empty((self._ring_frames, self.channels), dtype=np.int16)
+        self._ring_view = memoryview(self._ring)
+        self._write_idx = 0
+        self._read_idx = 0
+        self._data_ready = threading.Condition()
+        self._dropped_frames = 0
+        
+        # Intermediate file format
+        self._format, self._subtype, ext = AUDIO_FORMATS[self._resolve_format(file_format)]
+        self.audio_path = os.path.join(
             tempfile.gettempdir(), 
-            dt.datetime.now().strftime("_audio_%Y%m%d_%H%M%S.wav")
+            time.strftime("_audio_%Y%m%d_%H%M%S") + ext
         )
         
         # Runtime objects (avoid referencing optional modules in annotations)
@@ -65,6 +103,28 @@ class AudioRecorder:
         self._stream = None
         self._writer_thread = None
 
+    def _resolve_format(self, file_format: str) -> str:
+        """Pick a usable intermediate format, falling back towards plain WAV."""
+        name = (file_format or "wav").lower()
+        if name not in AUDIO_FORMATS:
+            name = "wav"
+            
+        # Loopback capture stays on uncompressed PCM to keep encoder latency off the stream
+        if self.loopback:
+            return "wav"
+            
+        if name == "opus" and self.samplerate not in _OPUS_SAMPLERATES:
+            self.status_callback(f"Opus does not support {self.samplerate} Hz, using FLAC")
+            name = "flac"
+            
+        container, subtype, _ = AUDIO_FORMATS[name]
+        try:
+            if not sf.check_format(container, subtype):
+                name = "wav"
+        except Exception:
+            name = "wav"
+        return name
+
     def start(self) -> None:
         """Start audio recording."""
         if sd is None or sf is None:
@@ -73,11 +133,12 @@ class AudioRecorder:
         try:
             # Create audio file writer
             self._sf = sf.SoundFile(
-                self.wav_path, 
+                self.audio_path, 
                 mode='w', 
                 samplerate=self.samplerate, 
                 channels=self.channels, 
-                subtype='PCM_16'
+                format=self._format,
+                subtype=self._subtype
             )
             
             # Configure stream settings
@@ -103,12 +164,13 @@ class AudioRecorder:
                 extra_settings=extra_settings
             )
             self._stream.start()
+            _ACTIVE_RECORDERS.add(self)
             
             # Start writer thread
             self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
             self._writer_thread.start()
             
-            self.status_callback(f"Audio recording started: {self.wav_path}")
+            self.status_callback(f"Audio recording started: {self.audio_path}")
             
         except Exception as ex:
             self._cleanup()
@@ -117,6 +179,8 @@ class AudioRecorder:
     def stop(self) -> None:
         """Stop audio recording and cleanup resources."""
         self._stop.set()
+        with self._data_ready:
+            self._data_ready.notify()
         
         try:
             if self._stream:
@@ -124,10 +188,14 @@ class AudioRecorder:
                 self._stream.close()
         except Exception:
             pass
+        _ACTIVE_RECORDERS.discard(self)
             
         if self._writer_thread:
             self._writer_thread.join(timeout=3)
             
+        if self._dropped_frames:
+            self.status_callback(f"Audio buffer overrun: {self._dropped_frames} frames dropped")
+            
         if self._sf is not None:
             try:
                 self._sf.flush()
@@ -138,32 +206,64 @@ class AudioRecorder:
         self.status_callback("Audio recording stopped")
 
     def _audio_callback(self, indata, frames, time_info, status) -> None:
-        """Audio stream callback - processes incoming audio data."""
+        """Audio stream callback - copies incoming audio into the ring buffer."""
         if status:
             # Log audio stream status issues if needed
             pass
             
-        try:
-            # Queue audio data for writing (non-blocking)
-            self._q.put_nowait(indata.copy())
-        except queue.Full:
-            # Drop frames if queue is full (prevents blocking)
-            pass
+        n = len(indata)
+        write_idx = self._write_idx
+        if write_idx + n - self._read_idx > self._ring_frames:
+            # Writer fell behind by a full ring; drop rather than block the stream
+            self._dropped_frames += n
+            return
+            
+        start = write_idx % self._ring_frames
+        first = min(n, self._ring_frames - start)
+        self._ring[start:start + first] = indata[:first]
+        if first < n:
+            self._ring[:n - first] = indata[first:]
+            
+        # Publish only after the samples are in place
+        self._write_idx = write_idx + n
+        if self._write_idx - self._read_idx >= self._chunk_frames:
+            with self._data_ready:
+                self._data_ready.notify()
 
-    def _writer_loop(self) -> None:
-        """Background thread that writes queued audio data to file."""
-        while not self._stop.is_set() or not self._q.empty():
-            try:
-                data = self._q.get(timeout=0.2)
-            except queue.Empty:
-                continue
-                
+    def _has_pending_chunk(self) -> bool:
+        """Check whether the writer has a full chunk (or a stop request) to handle."""
+        return self._stop.is_set() or self._write_idx - self._read_idx >= self._chunk_frames
+
+    def _drain_ring(self) -> None:
+        """Write all buffered samples to the audio file."""
+        read_idx = self._read_idx
+        write_idx = self._write_idx
+        
+        # At most two contiguous spans (before and after the wrap point), each
+        # handed to libsndfile as raw int16 so it skips NumPy dtype handling
+        while read_idx < write_idx:
+            start = read_idx % self._ring_frames
+            n = min(write_idx - read_idx, self._ring_frames - start)
             if self._sf is not None:
                 try:
-                    self._sf.write(data)
+                    self._sf.buffer_write(self._ring_view[start:start + n], dtype='int16')
                 except Exception:
                     # Continue recording even if individual writes fail
                     pass
+            read_idx += n
+            self._read_idx = read_idx
+
+    def _writer_loop(self) -> None:
+        """Background thread that writes buffered audio data to file."""
+        while not self._stop.is_set():
+            # The predicate is re-checked under the lock, so a notify that lands
+            # before the wait is never lost
+            with self._data_ready:
+                self._data_ready.wait_for(self._has_pending_chunk, timeout=0.2)
+            self._drain_ring()
+            
+        # Flush whatever arrived before the stream was stopped
+        self._drain_ring()
 
     def _cleanup(self) -> None:
         """Internal cleanup method."""
@@ -175,34 +275,40 @@ class AudioRecorder:
             self._sf = None
 
 
+# Device enumeration cache keyed by loopback mode
+_DEVICE_CACHE: dict[bool, list[tuple[str, Optional[int]]]] = {}
+
+
 def get_audio_devices(loopback: bool = False) -> list[tuple[str, Optional[int]]]:
     """
     Get list of available audio devices.
     
+    Results are cached per mode; call invalidate_audio_devices() to re-enumerate.
+    
     Args:
         loopback: If True, get output devices for loopback recording
         
     Returns:
         List of (device_name, device_id) tuples
     """
+    cached = _DEVICE_CACHE.get(loopback)
+    if cached is not None:
+        return list(cached)
+        
     devices: list[tuple[str, Optional[int]]] = [("Default", None)]
     
     if sd is None:
         return devices
         
+    channel_key = 'max_output_channels' if loopback else 'max_input_channels'
     try:
         for idx, device_info in enumerate(sd.query_devices()):
             try:
                 if isinstance(device_info, dict):
                     # Check if device supports input (for microphone) or output (for loopback)
-                    if loopback:
-                        max_channels = int(device_info.get('max_output_channels', 0))
-                    else:
-                        max_channels = int(device_info.get('max_input_channels', 0))
-                        
-                    if max_channels > 0:
-                        name = device_info.get('name', f'Device {idx}')
-                        devices.append((f"{idx}: {name}", idx))
+                    _get = device_info.get
+                    if int(_get(channel_key, 0)) > 0:
+                        devices.append((f"{idx}: {_get('name', f'Device {idx}')}", idx))
                 else:
                     # Fallback for non-dict device info
                     devices.append((f"{idx}: {str(device_info)}", idx))
@@ -212,10 +318,29 @@ def get_audio_devices(loopback: bool = False) -> list[tuple[str, Optional[int]]]
                 continue
                 
     except Exception:
-        # Return default if device enumeration fails
-        pass
+        # Return default if device enumeration fails (not cached, so it is retried)
+        return devices
         
-    return devices
+    _DEVICE_CACHE[loopback] = devices
+    return list(devices)
+
+
+def invalidate_audio_devices() -> None:
+    """
+    Drop cached device lists and re-initialize PortAudio so new devices are seen.
+    
+    While a recording stream is open only the cache is cleared: terminating
+    PortAudio would close the live stream and silently lose its audio.
+    """
+    _DEVICE_CACHE.clear()
+    if sd is None or _ACTIVE_RECORDERS:
+        return
+    try:
+        # PortAudio only rescans host APIs on (re)initialization
+        sd._terminate()
+        sd._initialize()
+    except Exception:
+        pass
 
 
 def is_audio_available() -> bool:
@@ -23,6 +23,7 @@ class RecorderConfig:
     audio_device: int | None = None
     audio_samplerate: int = 44100
     audio_channels: int = 2
+    audio_intermediate_format: str = "flac"
     
     # Essential video settings
     video_quality: str = "high"  # "low", "medium", "high", "ultra"
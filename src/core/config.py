@@ -7,6 +7,11 @@ from dataclasses import dataclass
 from typing import Optional
 
 
+# Choices offered by the UI for the matching RecorderConfig fields
+VIDEO_QUALITIES = ("low", "medium", "high", "ultra")
+PIP_POSITIONS = ("top-left", "top-right", "bottom-left", "bottom-right")
+
+
 @dataclass
 class RecorderConfig:
     """Configuration settings for the screen recorder."""
@@ -30,7 +35,8 @@ class RecorderConfig:
     audio_samplerate: int = 44100  # Standard CD quality
     audio_channels: int = 2        # Stereo for better quality
     system_audio_loopback: bool = False  # Windows WASAPI loopback for system audio
-    save_audio_separately: bool = False  # Save audio as separate WAV file
+    save_audio_separately: bool = False  # Save audio as separate file
+    audio_intermediate_format: str = "flac"  # "wav", "flac", "opus" (loopback always uses WAV)
     
     # Audio-Video synchronization settings
     precise_timing: bool = True    # Use precise frame timing for better sync
@@ -0,0 +1,274 @@
+"""
+FFmpeg pipe encoder for the Screen Recorder application.
+Streams raw frames to an FFmpeg subprocess so encoding (NVENC or libx264)
+runs in its own process instead of through OpenCV's VideoWriter.
+"""
+
+import os
+import subprocess
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+# Optional dependencies
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux fcntl command to resize a pipe (not exported by the fcntl module before 3.10)
+F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031)
+
+# Pipe capacity to request so several frames can be in flight to the encoder
+PIPE_BUFFER_SIZE = 16 * 1024 * 1024
+
+# NVIDIA NVENC settings (low-latency tune, constant-quality VBR: callers add
+# '-cq N -b:v 0', since without -b:v 0 the default 2 Mbit/s average caps quality)
+NVENC_ARGS = ('-c:v', 'h264_nvenc', '-preset', 'p4', '-tune', 'll', '-rc', 'vbr')
+
+# Intel Quick Sync
+QSV_ARGS = ('-c:v', 'h264_qsv', '-preset', 'veryfast')
+
+# AMD AMF (Windows)
+AMF_ARGS = ('-c:v', 'h264_amf', '-usage', 'lowlatency')
+
+# Apple VideoToolbox (macOS)
+VIDEOTOOLBOX_ARGS = ('-c:v', 'h264_videotoolbox', '-realtime', '1')
+
+# Software H.264 (preset/CRF are added from the quality setting)
+X264_ARGS = ('-c:v', 'libx264')
+
+
+@lru_cache(maxsize=None)
+def available_encoders(ffmpeg_path: str) -> frozenset[str]:
+    """
+    List the encoders compiled into an FFmpeg build (one `ffmpeg -encoders` call).
+
+    Args:
+        ffmpeg_path: Path to FFmpeg executable
+
+    Returns:
+        Encoder names, e.g. {'libx264', 'h264_nvenc', ...}
+    """
+    try:
+        proc = subprocess.run([ffmpeg_path, '-hide_banner', '-encoders'],
+                              capture_output=True, text=True, timeout=10)
+    except Exception:
+        return frozenset()
+    names = set()
+    for line in proc.stdout.splitlines():
+        # Encoder lines look like " V....D h264_nvenc   NVIDIA NVENC H.264 encoder"
+        parts = line.split()
+        if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] in 'VAS':
+            names.add(parts[1])
+    return frozenset(names)
+
+
+@lru_cache(maxsize=None)
+def encoder_works(ffmpeg_path: str, codec_args: tuple[str, ...]) -> bool:
+    """
+    Check that FFmpeg can actually encode with the given codec arguments.
+    The result is cached per process since driver support does not change.
+
+    Args:
+        ffmpeg_path: Path to FFmpeg executable
+        codec_args: Encoder arguments, e.g. NVENC_ARGS
+
+    Returns:
+        True if a one-frame test encode succeeded
+    """
+    cmd = [
+        ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', 'color=c=black:s=256x256:r=1',
+        '-frames:v', '1',
+        *codec_args,
+        '-f', 'null', '-'
+    ]
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+        return proc.returncode == 0
+    except Exception:
+        return False
+
+
+def run_ffmpeg(cmd: list[str], timeout: float) -> tuple[int, str]:
+    """
+    Run an FFmpeg command, keeping only the tail of its error output.
+    stderr is drained as it is produced, so long progress logs neither fill
+    the pipe nor get decoded in full.
+
+    Args:
+        cmd: Full FFmpeg command line
+        timeout: Seconds to wait before killing FFmpeg
+
+    Returns:
+        Tuple of (return code, last lines of stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If FFmpeg did not finish in time
+    """
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE)
+    tail: deque[bytes] = deque(maxlen=256)
+    drain = threading.Thread(target=tail.extend, args=(proc.stderr,), daemon=True)
+    drain.start()
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        drain.join(timeout=1.0)
+    return proc.returncode, b"".join(tail).decode(errors='replace').strip()
+
+
+class FFmpegPipeWriter:
+    """
+    Video writer that pipes raw BGR frames into an FFmpeg encoder process.
+    Mirrors the parts of the cv2.VideoWriter interface the recorder uses.
+    """
+
+    def __init__(self, ffmpeg_path: str, output_path: str, width: int, height: int,
+                 fps: float, codec_args: tuple[str, ...]):
+        """
+        Start the FFmpeg encoder process.
+
+        Args:
+            ffmpeg_path: Path to FFmpeg executable
+            output_path: Output video file path
+            width: Frame width
+            height: Frame height
+            fps: Frame rate
+            codec_args: Encoder arguments placed before the output path
+        """
+        cmd = [
+            ffmpeg_path, '-hide_banner', '-loglevel', 'error', '-y',
+            '-f', 'rawvideo',
+            # Keep FFmpeg's input queue at its small default: queued raw frames
+            # (~6 MB each at 1080p) would hide a slow encoder from the pipe, so
+            # the write thread's drop logic would never engage
+            '-thread_queue_size', '8',
+            '-probesize', '32',
+            '-analyzeduration', '0',
+            '-pix_fmt', 'bgr24',
+            '-s', f'{width}x{height}',
+            '-r', str(fps),
+            '-i', '-',
+            '-an',
+            *codec_args,
+            '-pix_fmt', 'yuv420p',
+            output_path
+        ]
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=0  # Frames go straight to the pipe, no extra userspace buffer
+        )
+        self._stdin = self._proc.stdin
+        self._fd = self._stdin.fileno()
+        self._grow_pipe()
+
+        # Drain stderr so FFmpeg never blocks on a full pipe; keep the tail for errors
+        self._stderr_tail: deque[str] = deque(maxlen=20)
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+
+    def _grow_pipe(self) -> None:
+        """
+        Enlarge the stdin pipe so writes do not stall while FFmpeg encodes.
+        Linux only; the kernel caps unprivileged requests at
+        /proc/sys/fs/pipe-max-size, so fall back to that limit.
+        """
+        if fcntl is None:
+            return
+        for size in (PIPE_BUFFER_SIZE, self._pipe_max_size()):
+            try:
+                fcntl.fcntl(self._fd, F_SETPIPE_SZ, size)
+                return
+            except OSError:
+                continue
+
+    @staticmethod
+    def _pipe_max_size() -> int:
+        """Get the largest pipe size an unprivileged process may request."""
+        try:
+            with open('/proc/sys/fs/pipe-max-size') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return 1024 * 1024
+
+    def _drain_stderr(self) -> None:
+        """Collect FFmpeg error output."""
+        for line in self._proc.stderr:
+            self._stderr_tail.append(line.decode(errors='replace').rstrip())
+
+    def isOpened(self) -> bool:
+        """Check the encoder process is running."""
+        return self._proc.poll() is None
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        Send one BGR frame to the encoder.
+
+        Args:
+            frame: HxWx3 uint8 frame (strided views are packed first)
+        """
+        if not frame.flags.c_contiguous:
+            frame = np.ascontiguousarray(frame)
+        view = memoryview(frame).cast('B')
+        try:
+            # os.write releases the GIL; loop in case the pipe accepts a partial write
+            while view:
+                view = view[os.write(self._fd, view):]
+        except (BrokenPipeError, OSError):
+            raise RuntimeError(f"FFmpeg encoder stopped: {self.last_error() or 'pipe closed'}")
+
+    def write_many(self, frames: list[np.ndarray]) -> None:
+        """
+        Send several BGR frames to the encoder with as few syscalls as possible.
+
+        Args:
+            frames: HxWx3 uint8 frames in display order
+        """
+        if not hasattr(os, 'writev'):  # Windows: no scatter/gather pipe writes
+            for frame in frames:
+                self.write(frame)
+            return
+        views = [memoryview(np.ascontiguousarray(frame)).cast('B') for frame in frames]
+        try:
+            while views:
+                written = os.writev(self._fd, views)
+                # Drop fully written frames and trim a partially written one
+                while views and written >= len(views[0]):
+                    written -= len(views[0])
+                    views.pop(0)
+                if written:
+                    views[0] = views[0][written:]
+        except (BrokenPipeError, OSError):
+            raise RuntimeError(f"FFmpeg encoder stopped: {self.last_error() or 'pipe closed'}")
+
+    def release(self) -> None:
+        """Close the pipe and wait for FFmpeg to finish the file."""
+        if self._stdin is None:
+            return
+        try:
+            self._stdin.close()
+        except Exception:
+            pass
+        self._stdin = None
+        try:
+            self._proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._stderr_thread.join(timeout=1.0)
+
+    def last_error(self) -> Optional[str]:
+        """Get the most recent FFmpeg error output, if any."""
+        return "\n".join(self._stderr_tail) or None
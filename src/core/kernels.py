@@ -0,0 +1,91 @@
+"""
+Optional compiled kernels for the Screen Recorder capture pipeline.
+Numba is not a hard dependency: callers check NUMBA_AVAILABLE and keep their
+OpenCV/NumPy path when it is missing.
+"""
+
+import numpy as np
+
+# Optional dependencies
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Cursor position that never intersects a frame
+NO_MOUSE = (-1_000_000, -1_000_000)
+
+# Placeholder passed as the PIP canvas when the webcam overlay is off
+EMPTY_PIP = np.zeros((0, 0, 3), dtype=np.uint8)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def fuse_frame(bgra, out, mx, my, radius, alpha_q8, color, pip, pip_y, pip_x):
+        """
+        Pack a BGRA capture into a BGR frame with overlays in a single pass.
+
+        Args:
+            bgra: HxWx4 uint8 capture (read only)
+            out: HxWx3 uint8 destination frame
+            mx, my: Capture-relative cursor position (NO_MOUSE to skip)
+            radius: Highlight circle radius in pixels
+            alpha_q8: Highlight opacity in 1/256 steps
+            color: BGR highlight colour as a 3-element uint8 array
+            pip: Bordered webcam canvas (EMPTY_PIP to skip)
+            pip_y, pip_x: Top-left corner of the canvas in the frame
+        """
+        h = out.shape[0]
+        w = out.shape[1]
+        ph = pip.shape[0]
+        pw = pip.shape[1]
+        r2 = radius * radius
+        keep = 256 - alpha_q8
+        cb = np.int32(color[0]) * alpha_q8
+        cg = np.int32(color[1]) * alpha_q8
+        cr = np.int32(color[2]) * alpha_q8
+
+        for y in prange(h):
+            dy = y - my
+            circle_row = dy * dy <= r2
+            pip_row = pip_y <= y < pip_y + ph
+            for x in range(w):
+                # Webcam PIP is drawn over everything else
+                if pip_row and pip_x <= x < pip_x + pw:
+                    out[y, x, 0] = pip[y - pip_y, x - pip_x, 0]
+                    out[y, x, 1] = pip[y - pip_y, x - pip_x, 1]
+                    out[y, x, 2] = pip[y - pip_y, x - pip_x, 2]
+                    continue
+
+                b = np.int32(bgra[y, x, 0])
+                g = np.int32(bgra[y, x, 1])
+                r = np.int32(bgra[y, x, 2])
+                if circle_row:
+                    dx = x - mx
+                    if dx * dx + dy * dy <= r2:
+                        b = (b * keep + cb) >> 8
+                        g = (g * keep + cg) >> 8
+                        r = (r * keep + cr) >> 8
+                out[y, x, 0] = b
+                out[y, x, 1] = g
+                out[y, x, 2] = r
+
+else:
+    fuse_frame = None
+
+
+def warm_up() -> None:
+    """
+    Compile the kernels ahead of the first frame.
+    Without this the JIT (or cache load) would stall the capture thread
+    on its first frame; a tiny frame triggers the same specialization.
+    """
+    if fuse_frame is None:
+        return
+    bgra = np.zeros((4, 4, 4), dtype=np.uint8)
+    out = np.empty((4, 4, 3), dtype=np.uint8)
+    color = np.zeros(3, dtype=np.uint8)
+    pip = np.zeros((2, 2, 3), dtype=np.uint8)
+    fuse_frame(bgra, out, 1, 1, 1, 128, color, pip, 0, 0)
@@ -4,15 +4,24 @@ Handles screen capture, webcam overlay, mouse highlighting, and video file writi
 """
 
 import os
+import sys
 import time
 import threading
 import tempfile
 import subprocess
-from typing import Optional, Callable, Any
-from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Callable, Any, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 import queue
+from collections import deque
 
 import numpy as np
+
+# MSMF hardware transforms make each webcam open take seconds on many Windows
+# drivers; must be set before OpenCV first opens a capture device
+if os.name == 'nt':
+    os.environ.setdefault("OPENCV_VIDEOIO_MSMF_ENABLE_HW_TRANSFORMS", "0")
+
 import cv2
 from mss import mss
 
@@ -26,14 +35,221 @@ except ImportError:
 try:
     from ..core.config import RecorderConfig
     from ..core.audio import AudioRecorder
-    from ..utils.helpers import fourcc_code, find_ffmpeg_path, test_ffmpeg, get_ffmpeg_error_message
+    from ..core.encoder import (
+        FFmpegPipeWriter, NVENC_ARGS, QSV_ARGS, AMF_ARGS, VIDEOTOOLBOX_ARGS, X264_ARGS,
+        available_encoders, encoder_works, run_ffmpeg
+    )
+    from ..core.kernels import NUMBA_AVAILABLE, NO_MOUSE, EMPTY_PIP, fuse_frame, warm_up
+    from ..utils.helpers import fourcc_code, cached_ffmpeg_path, cached_test_ffmpeg, get_ffmpeg_error_message
 except ImportError:
     # Direct execution fallback
-    import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from core.config import RecorderConfig
     from core.audio import AudioRecorder
-    from utils.helpers import fourcc_code, find_ffmpeg_path, test_ffmpeg, get_ffmpeg_error_message
+    from core.encoder import (
+        FFmpegPipeWriter, NVENC_ARGS, QSV_ARGS, AMF_ARGS, VIDEOTOOLBOX_ARGS, X264_ARGS,
+        available_encoders, encoder_works, run_ffmpeg
+    )
+    from core.kernels import NUMBA_AVAILABLE, NO_MOUSE, EMPTY_PIP, fuse_frame, warm_up
+    from utils.helpers import fourcc_code, cached_ffmpeg_path, cached_test_ffmpeg, get_ffmpeg_error_message
+
+
+# Solid frame shared by all codec probes
+_TEST_FRAME = np.full((480, 640, 3), (50, 100, 150), dtype=np.uint8)
+
+
+@lru_cache(maxsize=1)
+def _probe_gpu() -> str:
+    """
+    Probe OpenCV GPU support once per process.
+    
+    Returns:
+        "opencl", "cuda" or "cpu"
+    """
+    try:
+        # Check for OpenCL support (more widely available)
+        if hasattr(cv2, 'ocl') and cv2.ocl.haveOpenCL():
+            cv2.ocl.setUseOpenCL(True)
+            return "opencl"
+    except Exception:
+        pass
+        
+    try:
+        # Check for CUDA support if available
+        if hasattr(cv2, 'cuda') and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+            return "cuda"
+    except Exception:
+        pass
+        
+    return "cpu"
+
+
+@lru_cache(maxsize=1)
+def _probe_gpu_vendors() -> frozenset[str]:
+    """
+    Identify installed GPU vendors once per process.
+    
+    Returns:
+        Subset of {"nvidia", "intel", "amd"}
+    """
+    vendors = set()
+    
+    if os.name == 'nt':
+        # One WMI query covers every vendor
+        try:
+            result = subprocess.run(['wmic', 'path', 'win32_VideoController', 'get', 'name'], 
+                                  capture_output=True, text=True, timeout=5)
+            names = result.stdout.lower()
+            if 'nvidia' in names:
+                vendors.add("nvidia")
+            if 'intel' in names:
+                vendors.add("intel")
+            if 'amd' in names or 'radeon' in names:
+                vendors.add("amd")
+        except Exception:
+            pass
+            
+    if "nvidia" not in vendors:
+        # nvidia-smi works where WMI is unavailable (Linux, newer Windows)
+        try:
+            result = subprocess.run(['nvidia-smi'], capture_output=True, timeout=5)
+            if result.returncode == 0:
+                vendors.add("nvidia")
+        except Exception:
+            pass
+            
+    return frozenset(vendors)
+
+
+class HighResTimer:
+    """
+    Sleep until a frame deadline without spinning.
+    
+    On Windows a high-resolution waitable timer (Windows 10 1803+) gives
+    ~0.1ms accuracy where a plain sleep rounds up to the scheduler tick.
+    Elsewhere time.sleep (nanosleep) is already accurate enough.
+    """
+    
+    CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x2
+    TIMER_ALL_ACCESS = 0x1F0003
+    INFINITE = 0xFFFFFFFF
+    
+    def __init__(self):
+        self._handle = None
+        if os.name == 'nt':
+            try:
+                import ctypes
+                self._kernel32 = ctypes.windll.kernel32
+                # HANDLEs are pointer-sized; the default c_int restype would truncate them
+                self._kernel32.CreateWaitableTimerExW.restype = ctypes.c_void_p
+                self._kernel32.SetWaitableTimer.argtypes = [
+                    ctypes.c_void_p, ctypes.POINTER(ctypes.c_longlong), ctypes.c_long,
+                    ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int
+                ]
+                self._kernel32.WaitForSingleObject.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+                self._kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+                self._due = ctypes.c_longlong()
+                self._due_ref = ctypes.byref(self._due)
+                self._handle = self._kernel32.CreateWaitableTimerExW(
+                    None, None, self.CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, self.TIMER_ALL_ACCESS
+                ) or None
+            except Exception:
+                self._handle = None
+    
+    def sleep(self, seconds: float) -> None:
+        """Block for the given time (returns immediately if not positive)."""
+        if seconds <= 0:
+            return
+        if self._handle is None:
+            time.sleep(seconds)
+            return
+        # Negative due time = relative, in 100ns units
+        self._due.value = -max(1, int(seconds * 10_000_000))
+        if self._kernel32.SetWaitableTimer(self._handle, self._due_ref, 0, None, None, False):
+            self._kernel32.WaitForSingleObject(self._handle, self.INFINITE)
+        else:
+            time.sleep(seconds)
+    
+    def close(self) -> None:
+        """Release the OS timer."""
+        if self._handle is not None:
+            self._kernel32.CloseHandle(self._handle)
+            self._handle = None
+
+
+def _remove_quietly(path: str) -> None:
+    """Delete a file, ignoring files that are already gone or still locked."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class SPSCRing:
+    """
+    Single-producer/single-consumer ring for the capture -> write handoff.
+    Only the producer moves the head and only the consumer moves the tail, so
+    with the GIL neither index needs a lock; an Event just wakes the consumer.
+    """
+    
+    def __init__(self, maxsize: int):
+        """
+        Initialize ring.
+        
+        Args:
+            maxsize: Maximum number of queued items
+        """
+        self.maxsize = maxsize
+        self._size = maxsize + 1  # One spare cell tells full from empty
+        self._items: list[Any] = [None] * self._size
+        self._head = 0  # Next cell to write (producer only)
+        self._tail = 0  # Next cell to read (consumer only)
+        self._not_empty = threading.Event()
+        
+    def try_push(self, item: Any) -> bool:
+        """Append an item; returns False without blocking if the ring is full."""
+        head = self._head
+        next_head = head + 1 if head + 1 < self._size else 0
+        if next_head == self._tail:
+            return False
+        self._items[head] = item
+        self._head = next_head
+        self._not_empty.set()
+        return True
+        
+    def try_pop(self) -> Optional[Any]:
+        """Remove the oldest item; returns None if the ring is empty."""
+        tail = self._tail
+        if tail == self._head:
+            return None
+        item = self._items[tail]
+        self._items[tail] = None
+        self._tail = tail + 1 if tail + 1 < self._size else 0
+        return item
+        
+    def pop(self, timeout: float) -> Optional[Any]:
+        """Remove the oldest item, waiting up to timeout; None if still empty."""
+        item = self.try_pop()
+        if item is None:
+            self._not_empty.clear()
+            # Re-check after clearing so a push in between is not missed
+            item = self.try_pop()
+            if item is None:
+                self._not_empty.wait(timeout)
+                item = self.try_pop()
+        return item
+        
+    def wake(self) -> None:
+        """Wake a consumer blocked in pop()."""
+        self._not_empty.set()
+        
+    def qsize(self) -> int:
+        """Approximate number of queued items."""
+        return (self._head - self._tail) % self._size
+        
+    def empty(self) -> bool:
+        """Check whether the ring is empty."""
+        return self._head == self._tail
 
 
 class ScreenRecorder:
@@ -43,6 +259,11 @@ class ScreenRecorder:
     Optimized for extended recording sessions with minimal lag.
     """
     
+    WRITE_BATCH_SIZE = 5  # Frames written per batch by the write thread
+    STATUS_BACKLOG = 3  # Queued status messages forwarded per monitor tick
+    
+    _teardown_executor: Optional[ThreadPoolExecutor] = None  # Shared across stops
+    
     def __init__(self, cfg: RecorderConfig, status_callback: Optional[Callable[[str], None]] = None):
         """
         Initialize screen recorder.
@@ -53,13 +274,15 @@ class ScreenRecorder:
         """
         self.cfg = cfg
         self.status_callback = status_callback or (lambda msg: None)
+        self._status_queue: queue.SimpleQueue[str] = queue.SimpleQueue()  # From hot threads
         
         # Threading control
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         
         # Video recording objects
-        self._writer: Optional[cv2.VideoWriter] = None
+        self._writer: Optional[Any] = None  # cv2.VideoWriter or FFmpegPipeWriter
+        self._video_is_h264 = False  # Written by the FFmpeg pipe (every segment), so muxing can stream-copy
         self._sct: Optional[Any] = None  # mss screen capture object
         self._monitor: Optional[dict] = None
         
@@ -69,36 +292,71 @@ class ScreenRecorder:
         
         # Performance optimization
         self._frame_pool = queue.Queue(maxsize=self.cfg.buffer_size)  # Pre-allocated frame buffers
-        self._thread_pool = ThreadPoolExecutor(max_workers=self.cfg.thread_pool_size, thread_name_prefix="recorder")
+        # Helper pool for background segment open/close work, created on first use.
+        # Capture and write run on their own dedicated threads, not on this pool.
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
         
         # Audio recording
         self._audio_recorder: Optional[AudioRecorder] = None
         self._video_tmp_path: Optional[str] = None
+        self._video_concat_list: Optional[str] = None  # Segment list muxed directly with audio
         
         # Webcam for picture-in-picture
         self._cam: Optional[cv2.VideoCapture] = None
-        self._cam_buffer = None  # Buffer for stable webcam frames
-        self._cam_frame_count = 0
-        self._cam_update_interval = 3  # Update webcam every 3 frames to reduce blinking
+        self._cam_buffer = None  # Latest webcam frame, replaced by the reader thread
+        self._cam_thread: Optional[threading.Thread] = None
+        
+        # Webcam PIP layout (precomputed when the webcam opens)
+        self._pip_region: Optional[tuple[slice, slice]] = None
+        self._pip_size = (0, 0)
+        self._pip_buf: Optional[np.ndarray] = None
+        self._pip_canvas: Optional[np.ndarray] = None
+        self._pip_inner: Optional[np.ndarray] = None
+        self._pip_source: Optional[np.ndarray] = None
+        self._ocl_overlay_ok = False  # Webcam resize runs on OpenCL (set by startup benchmark)
+        
+        # Mouse highlight parameters (fixed for the session)
+        self._mouse_radius = max(5, cfg.mouse_radius)
+        self._mouse_color = tuple(int(c) for c in cfg.mouse_color)  # BGR format
+        self._mouse_alpha = cfg.mouse_alpha
+        side = 2 * self._mouse_radius + 1
+        self._mouse_scratch = np.empty((side, side, 3), dtype=np.uint8)  # Reused blend buffer
+        self._mouse_alpha_q8 = int(round(self._mouse_alpha * 256))
+        self._mouse_color_arr = np.array(self._mouse_color, dtype=np.uint8)
+        self._mouse_xy: Optional[tuple[int, int]] = None  # Capture-relative, set by the poller
+        self._mouse_thread: Optional[threading.Thread] = None
         
         # Segment recording for long sessions
         self._current_segment = 0
-        self._segment_start_time = 0
         self._segment_paths: list[str] = []
+        self._segment_seconds = max(1.0, cfg.segment_duration_minutes * 60.0)
+        self._segment_end_time = 0.0  # perf_counter() deadline of the current segment
+        self._next_writer_future: Optional[Future] = None  # Next segment, opened ahead of time
+        self._frame_size = (0, 0)
         
         # Audio-Video synchronization
         self._recording_start_time = 0  # Precise timing for sync
-        self._video_frame_times: list[float] = []  # Track frame timestamps
+        self._recording_start_ns = 0  # Same instant on the perf_counter_ns clock
+        self._frames_written = 0  # Frames handed to the writer
+        self._last_frame_time = 0.0  # Capture timestamp of the last written frame
         self._target_fps = float(cfg.fps)
         self._frame_interval = 1.0 / self._target_fps
+        self._frame_interval_ns = round(1_000_000_000 / self._target_fps)  # Integer pacing, no float drift
         
         # Production-grade frame reliability system
-        self._frame_queue = queue.Queue(maxsize=self.cfg.buffer_size * 2)  # Double buffer for reliability
-        self._write_queue = queue.Queue(maxsize=self.cfg.buffer_size)
+        self._frame_queue = SPSCRing(self.cfg.buffer_size * 2)  # Double buffer for reliability
         self._capture_thread: Optional[threading.Thread] = None
         self._write_thread: Optional[threading.Thread] = None
         self._priority_mode = False  # Enable high-priority capture
         
+        # Frame arena (allocated once the capture size is known)
+        self._ring: Optional[np.ndarray] = None
+        self._ring_ts: Optional[np.ndarray] = None
+        self._free_slots: deque[int] = deque()
+        
+        # Overlays compiled into the capture pack (Numba) instead of a write-thread pass
+        self._fused_overlays = False
+        
         # Frame dropping prevention
         self._adaptive_quality = True  # Enable adaptive quality reduction
         self._frame_skip_threshold = 3  # Skip overlay processing if behind
@@ -121,28 +379,14 @@ class ScreenRecorder:
         Returns:
             True if GPU acceleration is supported
         """
-        try:
-            # Check for OpenCL support (more widely available)
-            if hasattr(cv2, 'ocl') and cv2.ocl.haveOpenCL():
-                cv2.ocl.setUseOpenCL(True)
-                # Test GPU memory allocation
-                test_mat = cv2.UMat(100, 100, cv2.CV_8UC3)
-                if test_mat is not None:
-                    self._emit_status("GPU acceleration enabled (OpenCL)")
-                    return True
-        except Exception:
-            pass
-            
-        try:
-            # Check for CUDA support if available
-            if hasattr(cv2, 'cuda') and cv2.cuda.getCudaEnabledDeviceCount() > 0:
-                self._emit_status("GPU acceleration available (CUDA)")
-                return True
-        except Exception:
-            pass
-            
-        self._emit_status("Using CPU processing (GPU not available)")
-        return False
+        backend = _probe_gpu()
+        if backend == "opencl":
+            self._emit_status("GPU acceleration enabled (OpenCL)")
+        elif backend == "cuda":
+            self._emit_status("GPU acceleration available (CUDA)")
+        else:
+            self._emit_status("Using CPU processing (GPU not available)")
+        return backend != "cpu"
 
     def _get_optimized_codec(self) -> tuple[int, str]:
         """
@@ -192,69 +436,31 @@ class ScreenRecorder:
     
     def _test_nvenc(self) -> bool:
         """Test if NVIDIA NVENC is available."""
-        try:
-            # Simple test for NVIDIA GPU
-            result = subprocess.run(['nvidia-smi'], capture_output=True, timeout=5)
-            return result.returncode == 0
-        except:
-            return False
+        return "nvidia" in _probe_gpu_vendors()
     
     def _test_quicksync(self) -> bool:
         """Test if Intel Quick Sync is available."""
-        try:
-            # Check for Intel GPU presence via WMI or simple heuristics
-            import platform
-            if platform.system() == "Windows":
-                try:
-                    result = subprocess.run(['wmic', 'path', 'win32_VideoController', 'get', 'name'], 
-                                          capture_output=True, text=True, timeout=5)
-                    if 'intel' in result.stdout.lower():
-                        return True
-                except:
-                    pass
-        except:
-            pass
-        return False
+        return "intel" in _probe_gpu_vendors()
     
     def _test_amf(self) -> bool:
         """Test if AMD AMF is available."""
-        try:
-            # Check for AMD GPU presence
-            import platform
-            if platform.system() == "Windows":
-                try:
-                    result = subprocess.run(['wmic', 'path', 'win32_VideoController', 'get', 'name'], 
-                                          capture_output=True, text=True, timeout=5)
-                    output = result.stdout.lower()
-                    if 'amd' in output or 'radeon' in output:
-                        return True
-                except:
-                    pass
-        except:
-            pass
-        return False
+        return "amd" in _probe_gpu_vendors()
     
     def _test_codec(self, fourcc: int, codec_str: str) -> bool:
-        """Test if a codec actually works by creating a test file."""
+        """Test if a codec actually works by writing one frame to a test file."""
         temp_path = tempfile.mktemp(suffix='.mp4')
         try:
             test_writer = cv2.VideoWriter(temp_path, fourcc, 10.0, (640, 480))
             if test_writer.isOpened():
-                # Write test frames
-                test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-                test_frame[:] = (50, 100, 150)
-                
-                for _ in range(10):
-                    success = test_writer.write(test_frame)
-                    if not success:
-                        test_writer.release()
-                        return False
-                
+                success = test_writer.write(_TEST_FRAME)
                 test_writer.release()
                 
-                # Verify file was created and has reasonable size
-                if os.path.exists(temp_path) and os.path.getsize(temp_path) > 1000:
-                    return True
+                # write() returns None on older OpenCV builds, so only an explicit False fails
+                if success is False:
+                    return False
+                    
+                # Verify the encoder actually produced output
+                return os.path.exists(temp_path) and os.path.getsize(temp_path) > 0
                     
             return False
                     
@@ -267,163 +473,6 @@ class ScreenRecorder:
             except:
                 pass
 
-    def _dedicated_capture_thread(self) -> None:
-        """Dedicated thread for screen capture to prevent frame drops."""
-        try:
-            import os
-            
-            # Set thread priority if possible
-            try:
-                if os.name == 'nt':  # Windows
-                    import ctypes
-                    ctypes.windll.kernel32.SetThreadPriority(
-                        ctypes.windll.kernel32.GetCurrentThread(), 2  # THREAD_PRIORITY_HIGHEST
-                    )
-            except:
-                pass
-                
-            frame_buffer_pool = []
-            for _ in range(5):
-                frame_buffer_pool.append(np.zeros((self._monitor['height'], self._monitor['width'], 3), dtype=np.uint8))
-            
-            buffer_index = 0
-            next_frame_time = self._frame_interval
-            
-            while not self._stop_event.is_set():
-                current_time = time.perf_counter() - self._recording_start_time
-                
-                if current_time >= next_frame_time - 0.001:  # 1ms tolerance
-                    try:
-                        # Use pre-allocated buffer
-                        frame_buffer = frame_buffer_pool[buffer_index]
-                        buffer_index = (buffer_index + 1) % len(frame_buffer_pool)
-                        
-                        # Fast screen capture
-                        img = self._sct.grab(self._monitor)
-                        np.copyto(frame_buffer, np.array(img)[:, :, :3])
-                        frame_buffer = cv2.cvtColor(frame_buffer, cv2.COLOR_RGB2BGR)
-                        
-                        # Queue frame with timestamp
-                        frame_data = {
-                            'frame': frame_buffer.copy(),
-                            'timestamp': current_time,
-                            'frame_number': self._frame_count
-                        }
-                        
-                        # Non-blocking queue put with emergency handling
-                        try:
-                            self._frame_queue.put_nowait(frame_data)
-                            self._frame_count += 1
-                        except queue.Full:
-                            # Emergency: Drop oldest frame and add new one
-                            try:
-                                self._frame_queue.get_nowait()  # Remove oldest
-                                self._frame_queue.put_nowait(frame_data)
-                                self._dropped_frames += 1
-                                
-                                # Enable emergency mode if dropping frequently
-                                if self._dropped_frames % 5 == 0:
-                                    self._emergency_mode = True
-                                    self._emit_status(f"⚡ Emergency mode: {self._dropped_frames} frames dropped")
-                            except:
-                                self._dropped_frames += 1
-                        
-                        next_frame_time += self._frame_interval
-                        
-                    except Exception as ex:
-                        self._emit_status(f"Capture error: {ex}")
-                        break
-                else:
-                    # Precise sleep until next frame
-                    sleep_time = next_frame_time - current_time
-                    if sleep_time > 0:
-                        time.sleep(min(sleep_time, 0.001))
-                        
-        except Exception as ex:
-            self._last_exception = ex
-            self._emit_status(f"Capture thread error: {ex}")
-
-    def _dedicated_write_thread(self) -> None:
-        """Dedicated thread for video writing to prevent I/O blocking."""
-        try:
-            import os
-            
-            # Lower priority for write thread (capture has priority)
-            try:
-                if os.name == 'nt':
-                    import ctypes
-                    ctypes.windll.kernel32.SetThreadPriority(
-                        ctypes.windll.kernel32.GetCurrentThread(), 1  # THREAD_PRIORITY_ABOVE_NORMAL
-                    )
-            except:
-                pass
-            
-            frames_behind = 0
-            
-            while not self._stop_event.is_set() or not self._frame_queue.empty():
-                try:
-                    # Get frame from capture queue
-                    frame_data = self._frame_queue.get(timeout=1.0)
-                    
-                    if frame_data is None:  # Sentinel to stop
-                        break
-                    
-                    frame = frame_data['frame']
-                    timestamp = frame_data['timestamp']
-                    frame_number = frame_data['frame_number']
-                    
-                    # Check if we're falling behind
-                    queue_size = self._frame_queue.qsize()
-                    if queue_size > self.cfg.buffer_size // 2:
-                        frames_behind += 1
-                        if frames_behind > self._frame_skip_threshold:
-                            # Skip expensive overlay processing
-                            if not self._emergency_mode:
-                                self._emergency_mode = True
-                                self._emit_status("⚡ Skipping overlays to catch up")
-                    else:
-                        frames_behind = max(0, frames_behind - 1)
-                        if frames_behind == 0 and self._emergency_mode:
-                            self._emergency_mode = False
-                            self._emit_status("✅ Normal processing resumed")
-                    
-                    # Apply overlays only if not in emergency mode
-                    if not self._emergency_mode and (self.cfg.mouse_highlight or self.cfg.use_webcam):
-                        frame = self._process_frame_overlays(frame)
-                    
-                    # Write frame with timestamp tracking
-                    if self._writer:
-                        self._video_frame_times.append(timestamp)
-                        self._writer.write(frame)
-                    
-                    # Queue for writing pipeline
-                    try:
-                        self._write_queue.put_nowait({
-                            'written': True,
-                            'timestamp': timestamp,
-                            'frame_number': frame_number
-                        })
-                    except queue.Full:
-                        try:
-                            self._write_queue.get_nowait()  # Remove oldest
-                            self._write_queue.put_nowait({
-                                'written': True,
-                                'timestamp': timestamp,
-                                'frame_number': frame_number
-                            })
-                        except:
-                            pass
-                    
-                except queue.Empty:
-                    continue
-                except Exception as ex:
-                    self._emit_status(f"Write thread error: {ex}")
-                    break
-                    
-        except Exception as ex:
-            self._last_exception = ex
-            self._emit_status(f"Write thread error: {ex}")
-
     def _get_ffmpeg_quality_settings(self) -> dict[str, str | int]:
         """Get FFmpeg encoding settings based on quality preference."""
         quality_map = {
@@ -445,11 +494,30 @@ class ScreenRecorder:
                         self._gpu_mat_pool.put(gpu_frame)
                 else:
                     # CPU memory allocation
-                    cpu_frame = np.zeros((height, width, 3), dtype=np.uint8)
+                    cpu_frame = np.empty((height, width, 3), dtype=np.uint8)  # Overwritten before use
                     self._frame_pool.put(cpu_frame)
         except Exception as ex:
             self._emit_status(f"Warning: Could not create frame buffers: {ex}")
 
+    def _setup_frame_ring(self, width: int, height: int) -> None:
+        """
+        Allocate the frame arena shared by the capture and write threads.
+        
+        Frames live in one contiguous (slots, H, W, 3) array with timestamps in a
+        parallel array; the threads pass slot indices only.
+        There is a slot for every frame that can be queued or batched at once,
+        so a slot is never overwritten before its frame is written.
+        
+        Args:
+            width: Video frame width
+            height: Video frame height
+        """
+        slots = self._frame_queue.maxsize + self.WRITE_BATCH_SIZE + 2
+        self._ring = np.empty((slots, height, width, 3), dtype=np.uint8)
+        self._ring_ts = np.zeros(slots, dtype=np.int64)  # Capture time in ns since start
+        # LIFO free-list keeps reusing the same few slots, so idle ones are never paged in
+        self._free_slots = deque(range(slots))
+
     def start(self) -> None:
         """Start screen recording in background thread."""
         if self._thread and self._thread.is_alive():
@@ -461,11 +529,30 @@ class ScreenRecorder:
         self._thread.start()
 
     def stop(self) -> None:
-        """Stop screen recording and cleanup resources."""
+        """
+        Ask the recording to stop; returns immediately.
+        
+        Finalization (writer release, segment merge, audio mux and resource
+        cleanup) runs on the recording thread, which is the only thread that
+        touches the writer; use wait_finished() to know when the file is saved.
+        """
         self._stop_event.set()
-        if self._thread:
-            self._thread.join(timeout=5)
-        self._cleanup()
+
+    def wait_finished(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the recording thread to finish finalizing (writer release,
+        segment merge, audio mux and cleanup all run on it after stop()).
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the recording thread is no longer running
+        """
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
 
     def get_last_error(self) -> Optional[Exception]:
         """Get the last exception that occurred during recording."""
@@ -478,6 +565,25 @@ class ScreenRecorder:
         except Exception:
             pass
 
+    def _post_status(self, msg: str) -> None:
+        """
+        Queue a status message from the capture/write threads.
+        The callback updates the UI, so it is only invoked from the monitor
+        loop (see _drain_status) and never stalls a frame.
+        """
+        self._status_queue.put_nowait(msg)
+
+    def _drain_status(self) -> None:
+        """Forward queued status messages, keeping only the most recent few."""
+        messages = []
+        try:
+            while True:
+                messages.append(self._status_queue.get_nowait())
+        except queue.Empty:
+            pass
+        for msg in messages[-self.STATUS_BACKLOG:]:
+            self._emit_status(msg)
+
     def _enable_high_priority(self) -> None:
         """Enable high-priority processing for production recording."""
         try:
@@ -525,11 +631,15 @@ class ScreenRecorder:
             width: Video frame width
             height: Video frame height
         """
-        # Get optimized codec
-        fourcc, codec_name = self._get_optimized_codec()
-        fps = float(self.cfg.fps)
+        self._frame_size = (width, height)
         
-        if self.cfg.record_audio:
+        if self.cfg.use_segments:
+            # First segment; later ones are opened ahead of each boundary
+            self._current_segment = 1
+            output_path = self._segment_path(self._current_segment)
+            self._segment_paths = [output_path]
+            self._segment_end_time = time.perf_counter() + self._segment_seconds
+        elif self.cfg.record_audio:
             # Write video to temporary file for later audio muxing
             # ALWAYS use .mp4 for consistency
             base, ext = os.path.splitext(self.cfg.output_path)
@@ -538,6 +648,35 @@ class ScreenRecorder:
         else:
             output_path = self.cfg.output_path
             
+        self._writer = self._open_video_writer(output_path, width, height)
+        # Fixed for the whole recording; later segments must use the same encoder
+        self._video_is_h264 = isinstance(self._writer, FFmpegPipeWriter)
+            
+        # Create frame buffer pool for performance
+        self._create_frame_buffer_pool(width, height)
+
+    def _open_video_writer(self, output_path: str, width: int, height: int) -> Any:
+        """
+        Open a video writer, preferring an FFmpeg pipe over OpenCV.
+        
+        Args:
+            output_path: Output video file path
+            width: Video frame width
+            height: Video frame height
+            
+        Returns:
+            Opened FFmpegPipeWriter or cv2.VideoWriter
+        """
+        fps = float(self.cfg.fps)
+
+        # Encode in an FFmpeg child process when FFmpeg is available
+        pipe_writer = self._open_pipe_writer(output_path, width, height, fps)
+        if pipe_writer:
+            return pipe_writer
+
+        # Fall back to OpenCV's built-in writer
+        fourcc, codec_name = self._get_optimized_codec()
+
         # Create video writer with hardware acceleration hints
         if os.name == 'nt':  # Windows
             # Try hardware encoding backends
@@ -545,7 +684,7 @@ class ScreenRecorder:
         else:
             backends = [cv2.CAP_FFMPEG, cv2.CAP_ANY]
             
-        self._writer = None
+        video_writer = None
         for backend in backends:
             try:
                 writer = cv2.VideoWriter()
@@ -554,7 +693,7 @@ class ScreenRecorder:
                     writer.set(cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY)
                 
                 if writer.open(output_path, backend, fourcc, fps, (width, height)):
-                    self._writer = writer
+                    video_writer = writer
                     self._emit_status(f"Video writer initialized with {codec_name}")
                     break
                 writer.release()
@@ -562,14 +701,83 @@ class ScreenRecorder:
                 continue
                 
         # Fallback to basic writer
-        if not self._writer:
-            self._writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+        if not video_writer:
+            video_writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
             
-        if not self._writer or not self._writer.isOpened():
+        if not video_writer or not video_writer.isOpened():
             raise RuntimeError("Failed to open video writer. Check codec and output path.")
             
-        # Create frame buffer pool for performance
-        self._create_frame_buffer_pool(width, height)
+        return video_writer
+
+    def _h264_encoder_candidates(self, ffmpeg_path: str) -> Iterator[tuple[tuple[str, ...], tuple[str, ...], str]]:
+        """
+        Yield working H.264 encoders in order of preference: the GPU media
+        engine present on this machine first, libx264 last.
+        Encoders are test-encoded lazily, so callers that stop at the first
+        one only pay for the ones they try.
+        
+        Args:
+            ffmpeg_path: Path to FFmpeg executable
+            
+        Yields:
+            Tuples of (codec args, rate-control args, display name)
+        """
+        quality_settings = self._get_ffmpeg_quality_settings()
+        crf = int(quality_settings['crf'])
+        candidates = []
+        if self.cfg.hardware_acceleration:
+            if self._test_nvenc():
+                candidates.append((NVENC_ARGS, ('-cq', str(crf), '-b:v', '0'), "NVIDIA NVENC (H.264)"))
+            if self._test_quicksync():
+                candidates.append((QSV_ARGS, ('-global_quality', str(crf)), "Intel Quick Sync (H.264)"))
+            if self._test_amf():
+                candidates.append((AMF_ARGS, ('-rc', 'cqp', '-qp_i', str(crf), '-qp_p', str(crf)), "AMD AMF (H.264)"))
+            if sys.platform == 'darwin':
+                # VideoToolbox quality is 1-100 (higher is better)
+                candidates.append((VIDEOTOOLBOX_ARGS, ('-q:v', str(max(1, min(100, 100 - 2 * crf)))), "Apple VideoToolbox (H.264)"))
+        candidates.append((X264_ARGS, (
+            '-preset', quality_settings['preset'],
+            '-crf', str(crf)
+        ), "H.264 (libx264)"))
+        
+        # Skip encoders missing from this FFmpeg build before test-encoding the rest
+        built_in = available_encoders(ffmpeg_path)
+        for candidate in candidates:
+            codec_args = candidate[0]
+            if built_in and codec_args[1] not in built_in:
+                continue
+            if encoder_works(ffmpeg_path, codec_args):
+                yield candidate
+
+    def _open_pipe_writer(self, output_path: str, width: int, height: int, fps: float) -> Optional[FFmpegPipeWriter]:
+        """
+        Open an FFmpeg pipe writer, preferring a hardware encoder and then libx264.
+
+        Args:
+            output_path: Output video file path
+            width: Video frame width
+            height: Video frame height
+            fps: Frame rate
+
+        Returns:
+            Pipe writer, or None to fall back to OpenCV encoding
+        """
+        ffmpeg_path, _ = cached_ffmpeg_path(self.cfg.ffmpeg_path)
+        if not ffmpeg_path:
+            return None
+
+        for base_args, rate_args, name in self._h264_encoder_candidates(ffmpeg_path):
+            try:
+                writer = FFmpegPipeWriter(ffmpeg_path, output_path, width, height, fps, base_args + rate_args)
+            except Exception as ex:
+                self._emit_status(f"{name} writer unavailable: {ex}")
+                continue
+            if writer.isOpened():
+                self._emit_status(f"Video writer initialized with {name}")
+                return writer
+            writer.release()
+
+        return None
 
     def _setup_webcam(self) -> None:
         """Setup webcam for picture-in-picture if enabled."""
@@ -578,14 +786,24 @@ class ScreenRecorder:
             
         cam_index = self.cfg.webcam_index
         
-        # Try different backends for better compatibility
-        backends = [cv2.CAP_DSHOW, cv2.CAP_MSMF, cv2.CAP_ANY] if os.name == 'nt' else [cv2.CAP_ANY]
+        # The previous recording may still be releasing this device
+        try:
+            self._teardown_pool().submit(lambda: None).result(timeout=5)
+        except Exception:
+            pass
         
-        for backend in backends:
+        # Same backend probe_cameras used, so the index refers to the same device
+        for backend in _CAMERA_BACKENDS:
             try:
                 cam = cv2.VideoCapture(cam_index, backend)
                 if cam.isOpened():
+                    # Keep only the newest frame in the driver and declare MJPEG so the
+                    # backend does not buffer frames to detect the format
+                    cam.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                    cam.set(cv2.CAP_PROP_FOURCC, fourcc_code('MJPG'))
+                    cam.set(cv2.CAP_PROP_FPS, float(self.cfg.fps))
                     self._cam = cam
+                    self._prepare_pip_layout()
                     self._emit_status(f"Webcam {cam_index} opened successfully")
                     return
                 cam.release()
@@ -597,6 +815,75 @@ class ScreenRecorder:
                     
         self._emit_status(f"Warning: Cannot open webcam index {cam_index}")
 
+    def _start_webcam_reader(self) -> None:
+        """Start the background webcam reader if a webcam is open."""
+        if self._cam is None:
+            return
+            
+        self._cam_thread = threading.Thread(
+            target=self._cam_reader_loop,
+            name="WebcamReader",
+            daemon=True
+        )
+        self._cam_thread.start()
+
+    def _cam_reader_loop(self) -> None:
+        """Read webcam frames as they arrive so the write thread never blocks on the camera."""
+        while not self._stop_event.is_set():
+            try:
+                ret, cam_frame = self._cam.read()
+            except Exception:
+                break
+            if ret and cam_frame is not None:
+                # Publishing a new reference is atomic; readers see old or new frame
+                self._cam_buffer = cam_frame
+            else:
+                # Back off instead of spinning while the camera has nothing
+                self._stop_event.wait(0.05)
+
+    def _start_mouse_poller(self) -> None:
+        """Start the background cursor poller if mouse highlight is enabled."""
+        if not self.cfg.mouse_highlight:
+            return
+        if os.name != 'nt' and pyautogui is None:
+            self._emit_status("Mouse highlight disabled: install pyautogui")
+            return
+            
+        self._mouse_thread = threading.Thread(
+            target=self._mouse_poll_loop,
+            name="MousePoller",
+            daemon=True
+        )
+        self._mouse_thread.start()
+
+    def _mouse_poll_loop(self) -> None:
+        """Poll the cursor position at ~60Hz so overlays never query it per frame."""
+        offset_x = self._monitor.get('left', 0)
+        offset_y = self._monitor.get('top', 0)
+        
+        if os.name == 'nt':
+            # Read the cursor straight from user32
+            import ctypes
+            from ctypes import wintypes
+            point = wintypes.POINT()
+            point_ref = ctypes.byref(point)
+            get_cursor_pos = ctypes.windll.user32.GetCursorPos
+            
+            def read_position() -> tuple[int, int]:
+                get_cursor_pos(point_ref)
+                return point.x, point.y
+        else:
+            read_position = pyautogui.position
+            
+        while not self._stop_event.is_set():
+            try:
+                x, y = read_position()
+                self._mouse_xy = (x - offset_x, y - offset_y)
+            except Exception:
+                # Keep the last known position if a poll fails
+                pass
+            self._stop_event.wait(0.016)
+
     def _draw_mouse_highlight(self, frame: np.ndarray, mouse_pos: tuple[int, int]) -> None:
         """
         Draw mouse highlight overlay on frame.
@@ -606,37 +893,42 @@ class ScreenRecorder:
             mouse_pos: Mouse position (x, y)
         """
         x, y = mouse_pos
-        radius = max(5, self.cfg.mouse_radius)
-        color = tuple(int(c) for c in self.cfg.mouse_color)  # BGR format
-        alpha = self.cfg.mouse_alpha
+        r = self._mouse_radius
+        h, w = frame.shape[:2]
         
-        # Create overlay with highlight circle
-        overlay = frame.copy()
-        cv2.circle(overlay, (x, y), radius, color, thickness=-1, lineType=cv2.LINE_AA)
+        # Only the circle's bounding box is touched
+        x0, y0 = max(0, x - r), max(0, y - r)
+        x1, y1 = min(w, x + r + 1), min(h, y + r + 1)
+        if x0 >= x1 or y0 >= y1:
+            return  # Cursor outside the captured area
         
-        # Blend overlay with original frame
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, dst=frame)
+        # Draw the circle on a scratch copy of the ROI and blend it back through the frame view
+        roi = frame[y0:y1, x0:x1]
+        overlay = self._mouse_scratch[:y1 - y0, :x1 - x0]
+        np.copyto(overlay, roi)
+        cv2.circle(overlay, (x - x0, y - y0), r, self._mouse_color, thickness=-1, lineType=cv2.LINE_AA)
+        cv2.addWeighted(overlay, self._mouse_alpha, roi, 1 - self._mouse_alpha, 0, dst=roi)
 
-    def _overlay_webcam_pip(self, base_frame: np.ndarray, cam_frame: np.ndarray) -> np.ndarray:
+    def _prepare_pip_layout(self) -> None:
         """
-        Overlay webcam picture-in-picture on base frame.
-        
-        Args:
-            base_frame: Main video frame
-            cam_frame: Webcam frame to overlay
-            
-        Returns:
-            Frame with webcam overlay
+        Precompute the webcam PIP size, position and bordered canvas.
+        Config, capture size and webcam size are fixed for the session, so
+        the overlay itself only has to resize new webcam frames and blit.
         """
-        h, w = base_frame.shape[:2]
+        # First frame gives the real webcam resolution
+        ret, cam_frame = self._cam.read()
+        if ret and cam_frame is not None:
+            cam_h, cam_w = cam_frame.shape[:2]
+            self._cam_buffer = cam_frame
+        else:
+            cam_w = int(self._cam.get(cv2.CAP_PROP_FRAME_WIDTH)) or 640
+            cam_h = int(self._cam.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 480
+            
+        w, h = self._monitor['width'], self._monitor['height']
         
         # Calculate PIP dimensions
         target_w = max(32, int(w * (self.cfg.pip_width_pct / 100.0)))
-        aspect_ratio = cam_frame.shape[0] / max(1, cam_frame.shape[1])
-        target_h = int(target_w * aspect_ratio)
-        
-        # Resize webcam frame
-        pip_frame = cv2.resize(cam_frame, (target_w, target_h))
+        target_h = int(target_w * cam_h / max(1, cam_w))
         
         # Calculate position based on configuration
         padding = 12
@@ -655,69 +947,149 @@ class ScreenRecorder:
             x0 = (w - target_w) // 2
             
         x1, y1 = x0 + target_w, y0 + target_h
+        if x0 < 0 or y0 < 0 or x1 > w or y1 > h:
+            self._pip_region = None
+            self._emit_status("Warning: Webcam overlay does not fit the capture area")
+            return
+        
+        # Canvas holds the background border with the webcam image inside it
+        border = 2
+        bx0, by0 = max(0, x0 - border), max(0, y0 - border)
+        bx1, by1 = min(w, x1 + border), min(h, y1 + border)
+        self._pip_size = (target_w, target_h)
+        self._pip_buf = np.empty((target_h, target_w, 3), dtype=np.uint8)
+        self._pip_canvas = np.full((by1 - by0, bx1 - bx0, 3), 30, dtype=np.uint8)
+        self._pip_inner = self._pip_canvas[y0 - by0:y1 - by0, x0 - bx0:x1 - bx0]
+        self._pip_region = (slice(by0, by1), slice(bx0, bx1))
+        self._pip_source = None
+        
+        if self._use_gpu and _probe_gpu() == "opencl" and self._cam_buffer is not None:
+            self._ocl_overlay_ok = self._benchmark_ocl_resize(self._cam_buffer)
+            if self._ocl_overlay_ok:
+                self._emit_status("Webcam overlay scaling on GPU (OpenCL)")
+
+    def _benchmark_ocl_resize(self, cam_frame: np.ndarray, rounds: int = 10) -> bool:
+        """
+        Time the webcam resize on the CPU and through OpenCL UMat.
+        OpenCL is not faster for every driver and size, so it is only used
+        when it wins on this machine.
+        
+        Args:
+            cam_frame: Sample webcam frame
+            rounds: Timed resizes per path
+            
+        Returns:
+            True if the OpenCL resize (including transfers) is faster
+        """
+        try:
+            # Warm up both paths; the first OpenCL call compiles its kernel
+            cv2.resize(cam_frame, self._pip_size, dst=self._pip_buf)
+            cv2.resize(cv2.UMat(cam_frame), self._pip_size).get()
+            
+            start = time.perf_counter()
+            for _ in range(rounds):
+                cv2.resize(cam_frame, self._pip_size, dst=self._pip_buf)
+            cpu_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            for _ in range(rounds):
+                cv2.resize(cv2.UMat(cam_frame), self._pip_size).get()
+            ocl_time = time.perf_counter() - start
+            
+            return ocl_time < cpu_time
+        except Exception:
+            return False
+
+    def _refresh_pip_canvas(self, cam_frame: np.ndarray) -> None:
+        """Resize a new webcam frame into the PIP canvas (no-op for the current one)."""
+        if cam_frame is not self._pip_source:
+            if self._ocl_overlay_ok:
+                np.copyto(self._pip_inner, cv2.resize(cv2.UMat(cam_frame), self._pip_size).get())
+            else:
+                cv2.resize(cam_frame, self._pip_size, dst=self._pip_buf)
+                np.copyto(self._pip_inner, self._pip_buf)
+            self._pip_source = cam_frame
+
+    def _fuse_capture(self, bgra: np.ndarray, out: np.ndarray) -> None:
+        """
+        Pack a capture into its slot with all overlays in one compiled pass.
         
-        # Draw background border
-        border = 2
-        cv2.rectangle(
-            base_frame, 
-            (x0 - border, y0 - border), 
-            (x1 + border, y1 + border), 
-            (30, 30, 30), 
-            thickness=-1
-        )
+        Args:
+            bgra: Captured BGRA frame
+            out: Destination BGR slot
+        """
+        mx, my = self._mouse_xy or NO_MOUSE
         
-        # Overlay webcam frame
-        roi = base_frame[y0:y1, x0:x1]
-        if roi.shape[:2] == pip_frame.shape[:2]:
-            base_frame[y0:y1, x0:x1] = pip_frame
-            
-        return base_frame
+        pip, pip_y, pip_x = EMPTY_PIP, 0, 0
+        cam_frame = self._cam_buffer
+        if cam_frame is not None and self._pip_region is not None:
+            self._refresh_pip_canvas(cam_frame)
+            pip = self._pip_canvas
+            pip_y, pip_x = self._pip_region[0].start, self._pip_region[1].start
+            
+        fuse_frame(bgra, out, mx, my, self._mouse_radius, self._mouse_alpha_q8,
+                   self._mouse_color_arr, pip, pip_y, pip_x)
 
-    def _process_frame_overlays(self, frame: np.ndarray) -> np.ndarray:
+    def _overlay_webcam_pip(self, base_frame: np.ndarray, cam_frame: np.ndarray) -> np.ndarray:
         """
-        Process all frame overlays with optimized performance.
+        Overlay webcam picture-in-picture on base frame.
         
         Args:
-            frame: Input frame
+            base_frame: Main video frame
+            cam_frame: Webcam frame to overlay
             
         Returns:
-            Frame with overlays applied
+            Frame with webcam overlay
         """
-        # Use pre-allocated working frame for better memory performance
-        working_frame = frame
-        
-        # Mouse highlight overlay
-        if self.cfg.mouse_highlight and pyautogui is not None:
-            try:
-                mouse_x, mouse_y = pyautogui.position()
-                
-                # Adjust for capture region offset
-                if self._monitor:
-                    offset_x = self._monitor.get('left', 0)
-                    offset_y = self._monitor.get('top', 0)
-                    mouse_x -= offset_x
-                    mouse_y -= offset_y
-                    
-                self._draw_mouse_highlight(working_frame, (mouse_x, mouse_y))
-            except Exception:
-                # Continue if mouse position detection fails
-                pass
-                
-        # Webcam overlay with frame buffering to prevent blinking
-        if self._cam is not None:
-            # Update webcam buffer every few frames to reduce blinking
-            if self._cam_frame_count % self._cam_update_interval == 0:
-                ret, cam_frame = self._cam.read()
-                if ret and cam_frame is not None:
-                    self._cam_buffer = cam_frame.copy()  # Store stable frame
+        if self._pip_region is None:
+            return base_frame
             
-            # Use buffered frame for overlay
-            if self._cam_buffer is not None:
-                working_frame = self._overlay_webcam_pip(working_frame, self._cam_buffer)
+        self._refresh_pip_canvas(cam_frame)
             
-            self._cam_frame_count += 1
-                
-        return working_frame
+        # Single blit of border + webcam image
+        base_frame[self._pip_region] = self._pip_canvas
+        return base_frame
+
+    def _compile_overlay_pipeline(self) -> Optional[Callable[[np.ndarray], None]]:
+        """
+        Build the overlay function for this session.
+        
+        Which overlays are active is fixed once the mouse poller and webcam reader
+        are running, so only those steps are bound into the returned closure and
+        the per-frame call does no config checks.
+        
+        Returns:
+            Function drawing overlays in place, or None if there is nothing to draw
+        """
+        if self._fused_overlays:
+            return None  # Drawn by the capture thread
+            
+        use_mouse = self._mouse_thread is not None
+        use_pip = self._cam is not None and self._pip_region is not None
+        draw_mouse = self._draw_mouse_highlight
+        overlay_pip = self._overlay_webcam_pip
+        
+        if use_mouse and use_pip:
+            def apply(frame: np.ndarray) -> None:
+                mouse_xy = self._mouse_xy
+                if mouse_xy is not None:
+                    draw_mouse(frame, mouse_xy)
+                cam_frame = self._cam_buffer
+                if cam_frame is not None:
+                    overlay_pip(frame, cam_frame)
+        elif use_mouse:
+            def apply(frame: np.ndarray) -> None:
+                mouse_xy = self._mouse_xy
+                if mouse_xy is not None:
+                    draw_mouse(frame, mouse_xy)
+        elif use_pip:
+            def apply(frame: np.ndarray) -> None:
+                cam_frame = self._cam_buffer
+                if cam_frame is not None:
+                    overlay_pip(frame, cam_frame)
+        else:
+            return None
+        return apply
 
     def _start_audio_recording(self) -> None:
         """Start audio recording if enabled."""
@@ -730,7 +1102,8 @@ class ScreenRecorder:
                 channels=self.cfg.audio_channels,
                 device=self.cfg.audio_device,
                 loopback=self.cfg.system_audio_loopback,
-                status_callback=self._emit_status
+                status_callback=self._emit_status,
+                file_format=self.cfg.audio_intermediate_format
             )
             self._audio_recorder.start()
             self._emit_status("Audio recording started")
@@ -740,19 +1113,32 @@ class ScreenRecorder:
 
     def _mux_audio_video(self) -> None:
         """Merge video and audio using FFmpeg with improved error handling."""
-        if not self._audio_recorder or not self._video_tmp_path:
+        if not self._audio_recorder or not (self._video_tmp_path or self._video_concat_list):
             raise RuntimeError("Audio recorder or video path not available for muxing")
             
-        audio_path = self._audio_recorder.wav_path
-        if not os.path.exists(audio_path):
-            raise RuntimeError(f"Audio file not found for muxing: {audio_path}")
-            
-        if not os.path.exists(self._video_tmp_path):
-            raise RuntimeError(f"Video file not found for muxing: {self._video_tmp_path}")
+        audio_path = self._audio_recorder.audio_path
+        
+        # Unmerged segments are read through the concat demuxer in the same pass
+        if self._video_concat_list:
+            video_input = ['-f', 'concat', '-safe', '0', '-i', self._video_concat_list]
+            temp_paths = [*self._segment_paths, self._video_concat_list, audio_path]
+            video_files = self._segment_paths
+        else:
+            video_input = ['-i', self._video_tmp_path]
+            temp_paths = [self._video_tmp_path, audio_path]
+            video_files = [self._video_tmp_path]
+        
+        # One stat per file both checks existence and gives the size
+        try:
+            audio_size = os.stat(audio_path).st_size
+        except FileNotFoundError as ex:
+            raise RuntimeError(f"Audio file not found for muxing: {audio_path}") from ex
+        try:
+            video_size = sum(os.stat(path).st_size for path in video_files)
+        except FileNotFoundError as ex:
+            raise RuntimeError(f"Video file not found for muxing: {ex.filename}") from ex
             
         # Check file sizes to ensure they have content
-        audio_size = os.path.getsize(audio_path)
-        video_size = os.path.getsize(self._video_tmp_path)
         
         if audio_size < 1024:  # Less than 1KB
             raise RuntimeError(f"Audio file too small ({audio_size} bytes), may be corrupted")
@@ -763,30 +1149,46 @@ class ScreenRecorder:
         self._emit_status(f"Muxing: Video {video_size//1024}KB + Audio {audio_size//1024}KB")
         
         # Find FFmpeg executable
-        ffmpeg_path, source = find_ffmpeg_path(self.cfg.ffmpeg_path)
+        ffmpeg_path, source = cached_ffmpeg_path(self.cfg.ffmpeg_path)
         if not ffmpeg_path:
-            raise RuntimeError(get_ffmpeg_error_message(self.cfg.ffmpeg_path))
+            raise RuntimeError(get_ffmpeg_error_message(self.cfg.ffmpeg_path, source))
             
         # Test FFmpeg before using
-        success, message = test_ffmpeg(ffmpeg_path)
+        success, message = cached_test_ffmpeg(ffmpeg_path)
         if not success:
             raise RuntimeError(f"FFmpeg test failed: {message}")
             
-        # Enhanced FFmpeg command optimized for reliability and sync
-        quality_settings = self._get_ffmpeg_quality_settings()
+        # Pipe recordings are already H.264 at the chosen quality: copy the stream.
+        # OpenCV fallback output (mp4v etc.) still needs one encode.
+        if self._video_is_h264:
+            video_args = ['-c:v', 'copy']
+        else:
+            # Re-encode to H.264 for compatibility, on the GPU when one is available
+            encoder = next(self._h264_encoder_candidates(ffmpeg_path), None)
+            if encoder:
+                codec_args, rate_args, name = encoder
+            else:
+                quality_settings = self._get_ffmpeg_quality_settings()
+                codec_args, rate_args, name = X264_ARGS, (
+                    '-preset', quality_settings['preset'],
+                    '-crf', str(quality_settings['crf'])
+                ), "H.264 (libx264)"
+            self._emit_status(f"Re-encoding video with {name}")
+            video_args = [
+                *codec_args,
+                *rate_args,
+                '-vsync', 'cfr',             # Constant frame rate for sync
+            ]
         
         cmd = [
             ffmpeg_path, '-y',
-            '-i', self._video_tmp_path,  # Video input
+            *video_input,                # Video input (file or segment list)
             '-i', audio_path,            # Audio input
-            '-c:v', 'libx264',           # Re-encode video to H.264 for best compatibility
-            '-preset', quality_settings['preset'],  # Quality-based preset
-            '-crf', str(quality_settings['crf']),   # Quality-based CRF
+            *video_args,
             '-c:a', 'aac',               # AAC audio codec
             '-b:a', '128k',              # Audio bitrate
             '-ar', '44100',              # Standard sample rate
             '-ac', '2',                  # Stereo audio
-            '-vsync', 'cfr',             # Constant frame rate for sync
             '-async', '1',               # Audio sync compensation
             '-movflags', '+faststart',   # Optimize for web playback
             '-shortest',                 # Match shortest stream
@@ -795,24 +1197,21 @@ class ScreenRecorder:
         
         self._emit_status(f"Running FFmpeg: {' '.join(cmd[0:3])} ...")
         
+        muxed = False
         try:
-            proc = subprocess.run(
-                cmd, 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            returncode, stderr_tail = run_ffmpeg(cmd, timeout=300)  # 5 minute timeout
             
-            if proc.returncode != 0:
-                error_msg = proc.stderr.strip() if proc.stderr else "Unknown FFmpeg error"
-                raise RuntimeError(f"FFmpeg failed (code {proc.returncode}): {error_msg}")
+            if returncode != 0:
+                error_msg = stderr_tail or "Unknown FFmpeg error"
+                raise RuntimeError(f"FFmpeg failed (code {returncode}): {error_msg}")
                 
             # Verify output file was created and has reasonable size
-            if not os.path.exists(self.cfg.output_path):
+            try:
+                output_size = os.stat(self.cfg.output_path).st_size
+            except FileNotFoundError:
                 raise RuntimeError("FFmpeg completed but output file was not created")
+            muxed = True
                 
-            output_size = os.path.getsize(self.cfg.output_path)
             if output_size < video_size * 0.8:  # Output should be at least 80% of video size
                 self._emit_status(f"Warning: Output file smaller than expected ({output_size//1024}KB)")
             else:
@@ -823,14 +1222,20 @@ class ScreenRecorder:
         except Exception as ex:
             raise RuntimeError(f"FFmpeg execution failed: {ex}")
         finally:
-            # Cleanup temporary files
-            for temp_path in (self._video_tmp_path, audio_path):
-                try:
-                    if temp_path and os.path.exists(temp_path):
-                        os.remove(temp_path)
-                        self._emit_status(f"Cleaned up: {os.path.basename(temp_path)}")
-                except Exception as ex:
-                    self._emit_status(f"Warning: Could not remove {temp_path}: {ex}")
+            if muxed:
+                # Cleanup temporary files
+                for temp_path in temp_paths:
+                    try:
+                        if temp_path and os.path.exists(temp_path):
+                            os.remove(temp_path)
+                            self._emit_status(f"Cleaned up: {os.path.basename(temp_path)}")
+                    except Exception as ex:
+                        self._emit_status(f"Warning: Could not remove {temp_path}: {ex}")
+            else:
+                # The inputs are the only copy of the recording: keep them
+                # (the caller saves the audio separately)
+                kept = [*video_files, self._video_concat_list] if self._video_concat_list else video_files
+                self._emit_status("Mux failed; video kept at: " + ", ".join(kept))
 
     def _recording_loop(self) -> None:
         """Production-grade recording loop with advanced frame drop prevention."""
@@ -845,7 +1250,8 @@ class ScreenRecorder:
             self._setup_webcam()
             
             # CRITICAL: Record precise start time for synchronization
-            self._recording_start_time = time.perf_counter()
+            self._recording_start_ns = time.perf_counter_ns()
+            self._recording_start_time = self._recording_start_ns / 1e9
             
             # Start audio recording FIRST with exact timing
             if self.cfg.record_audio:
@@ -856,12 +1262,21 @@ class ScreenRecorder:
             # Capture first frame to determine exact dimensions
             assert self._sct is not None and self._monitor is not None
             img = self._sct.grab(self._monitor)
-            frame = np.array(img)[:, :, :3]  # Skip alpha channel
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            height, width = frame.shape[:2]
+            width, height = img.width, img.height
             
             # Setup video writer with actual frame dimensions
             self._setup_video_writer(width, height)
+            self._setup_frame_ring(width, height)
+            
+            # With Numba, overlays are applied while packing the capture, so they
+            # cost no extra frame pass and stay on even in emergency mode
+            if NUMBA_AVAILABLE and (self.cfg.mouse_highlight or self.cfg.use_webcam):
+                try:
+                    warm_up()
+                    self._fused_overlays = True
+                    self._emit_status("⚡ Overlays compiled into capture (Numba)")
+                except Exception as ex:
+                    self._emit_status(f"Numba overlays unavailable, using OpenCV: {ex}")
             
             # Start dedicated capture and write threads for production reliability
             self._stop_event.clear()
@@ -879,24 +1294,25 @@ class ScreenRecorder:
             )
             
             self._capture_thread.start()
+            self._start_mouse_poller()
+            self._start_webcam_reader()
             self._write_thread.start()
             
             self._emit_status("🎬 Production recording started with threaded pipeline")
             
             # Monitor performance and provide real-time feedback
-            last_stats_time = time.perf_counter()
+            next_stats_time = time.perf_counter() + 5.0
             
             while not self._stop_event.is_set():
                 current_time = time.perf_counter()
                 
                 # Update performance statistics every 5 seconds
-                if current_time - last_stats_time >= 5.0:
+                if current_time >= next_stats_time:
                     recording_duration = current_time - self._recording_start_time
                     
                     if recording_duration > 0:
                         actual_fps = self._frame_count / recording_duration
                         queue_size = self._frame_queue.qsize()
-                        write_queue_size = self._write_queue.qsize()
                         
                         # Performance status
                         if self._dropped_frames == 0:
@@ -910,7 +1326,7 @@ class ScreenRecorder:
                             f"{status} | {actual_fps:.1f} FPS | "
                             f"Frames: {self._frame_count} | "
                             f"Dropped: {self._dropped_frames} | "
-                            f"Queues: {queue_size}/{write_queue_size}"
+                            f"Queue: {queue_size}/{self._frame_queue.maxsize}"
                         )
                         
                         # Adaptive quality adjustment if dropping frames
@@ -919,7 +1335,9 @@ class ScreenRecorder:
                                 self._emergency_mode = True
                                 self._emit_status("⚡ Activating emergency mode - reducing quality")
                     
-                    last_stats_time = current_time
+                    next_stats_time = current_time + 5.0
+                
+                self._drain_status()
                 
                 # Check thread health
                 if not self._capture_thread.is_alive():
@@ -956,87 +1374,82 @@ class ScreenRecorder:
             except:
                 pass
                 
-            # Pre-allocate frame buffers for zero-allocation capture
-            frame_buffer_pool = []
-            for _ in range(10):  # Larger pool for production
-                frame_buffer_pool.append(np.zeros((self._monitor['height'], self._monitor['width'], 3), dtype=np.uint8))
-            
-            buffer_index = 0
-            next_frame_time = self._frame_interval
-            last_emergency_log = 0
-            
-            while not self._stop_event.is_set():
-                current_time = time.perf_counter() - self._recording_start_time
+            frame_shape = (self._monitor['height'], self._monitor['width'], 4)
+            ring = self._ring
+            ring_ts = self._ring_ts
+            free_slots = self._free_slots
+            fused = self._fused_overlays
+            start_ns = self._recording_start_ns
+            interval_ns = self._frame_interval_ns
+            next_frame_ns = interval_ns
+            last_emergency_log_ns = 0
+            timer = HighResTimer()
+            
+            # Bind everything the loop calls once, so each frame skips the
+            # global/attribute lookups
+            stop_is_set = self._stop_event.is_set
+            perf_counter_ns = time.perf_counter_ns
+            grab = thread_sct.grab
+            monitor = self._monitor
+            frombuffer = np.frombuffer
+            uint8 = np.uint8
+            cvt_color = cv2.cvtColor
+            BGRA2BGR = cv2.COLOR_BGRA2BGR
+            fuse_capture = self._fuse_capture
+            claim_slot = free_slots.pop
+            release_slot = free_slots.append
+            try_push = self._frame_queue.try_push
+            
+            while not stop_is_set():
+                current_ns = perf_counter_ns() - start_ns
                 
-                if current_time >= next_frame_time - 0.0005:  # 0.5ms tolerance for production
+                if current_ns >= next_frame_ns - 500_000:  # 0.5ms tolerance for production
                     try:
-                        # Use pre-allocated buffer (zero memory allocation)
-                        frame_buffer = frame_buffer_pool[buffer_index]
-                        buffer_index = (buffer_index + 1) % len(frame_buffer_pool)
-                        
-                        # Fastest possible screen capture with thread-local mss
-                        img = thread_sct.grab(self._monitor)
-                        np.copyto(frame_buffer, np.array(img)[:, :, :3])
-                        frame_buffer = cv2.cvtColor(frame_buffer, cv2.COLOR_RGB2BGR)
-                        
-                        # Queue frame with metadata
-                        frame_data = {
-                            'frame': frame_buffer.copy(),
-                            'timestamp': current_time,
-                            'frame_number': self._frame_count,
-                            'is_key_frame': self._frame_count % 30 == 0  # Every second at 30fps
-                        }
-                        
-                        # Production-grade queue management
+                        next_frame_ns += interval_ns
+
+                        # Claim a free arena slot; if the writer holds all of them, drop at the source
                         try:
-                            self._frame_queue.put_nowait(frame_data)
+                            slot = claim_slot()
+                        except IndexError:
+                            self._dropped_frames += 1
+                            continue
+
+                        # Fastest possible screen capture with thread-local mss.
+                        # mss returns BGRA, so dropping alpha while packing into the slot gives BGR.
+                        img = grab(monitor)
+                        bgra = frombuffer(img.raw, dtype=uint8).reshape(frame_shape)
+                        if fused:
+                            fuse_capture(bgra, ring[slot])
+                        else:
+                            # SIMD alpha drop straight into the (contiguous) slot
+                            cvt_color(bgra, BGRA2BGR, dst=ring[slot])
+                        ring_ts[slot] = current_ns
+                        
+                        # Production-grade queue management: the writer owns the
+                        # queued frames, so when it is full the new frame is dropped
+                        if try_push(slot):
                             self._frame_count += 1
-                        except queue.Full:
-                            # Smart frame dropping - keep key frames, drop others
-                            dropped_old = False
-                            try:
-                                # Try to remove a non-key frame first
-                                temp_frames = []
-                                while not self._frame_queue.empty() and len(temp_frames) < 5:
-                                    old_frame = self._frame_queue.get_nowait()
-                                    if not old_frame.get('is_key_frame', False):
-                                        dropped_old = True
-                                        break
-                                    temp_frames.append(old_frame)
-                                
-                                # Put back the key frames
-                                for temp_frame in temp_frames:
-                                    self._frame_queue.put_nowait(temp_frame)
-                                
-                                # Add new frame
-                                self._frame_queue.put_nowait(frame_data)
-                                if dropped_old:
-                                    self._dropped_frames += 1
-                                else:
-                                    self._dropped_frames += 1
-                                
-                            except:
-                                self._dropped_frames += 1
+                        else:
+                            release_slot(slot)
+                            self._dropped_frames += 1
                                 
                             # Emergency mode detection
-                            if self._dropped_frames % 10 == 0 and current_time - last_emergency_log > 5:
-                                self._emit_status(f"⚡ Production mode: {self._dropped_frames} frames optimized")
-                                last_emergency_log = current_time
-                        
-                        next_frame_time += self._frame_interval
+                            if self._dropped_frames % 10 == 0 and current_ns - last_emergency_log_ns > 5_000_000_000:
+                                self._post_status(f"⚡ Production mode: {self._dropped_frames} frames optimized")
+                                last_emergency_log_ns = current_ns
                         
                     except Exception as ex:
-                        self._emit_status(f"Capture error: {ex}")
+                        self._post_status(f"Capture error: {ex}")
                         break
                 else:
-                    # Ultra-precise sleep for production timing
-                    sleep_time = next_frame_time - current_time
-                    if sleep_time > 0:
-                        time.sleep(min(sleep_time, 0.0005))  # Max 0.5ms sleep
+                    # Block until the next deadline instead of polling every 0.5ms
+                    timer.sleep((next_frame_ns - current_ns) / 1e9)
+            
+            timer.close()
                         
         except Exception as ex:
             self._last_exception = ex
-            self._emit_status(f"Capture thread error: {ex}")
+            self._post_status(f"Capture thread error: {ex}")
 
     def _dedicated_write_thread(self) -> None:
         """Dedicated thread for video writing with production optimizations."""
@@ -1054,82 +1467,93 @@ class ScreenRecorder:
                 pass
             
             frames_behind = 0
-            batch_write_buffer = []
-            max_batch_size = 5
-            
-            while not self._stop_event.is_set() or not self._frame_queue.empty():
+            batch_write_buffer: list[int] = []
+            apply_overlays = self._compile_overlay_pipeline()
+            
+            # Session-constant lookups bound once (the writer itself is not bound:
+            # segment rotation swaps it)
+            stop_is_set = self._stop_event.is_set
+            frame_queue = self._frame_queue
+            pop_slot = frame_queue.pop
+            queue_empty = frame_queue.empty
+            queue_size_of = frame_queue.qsize
+            ring = self._ring
+            flush = self._flush_write_batch
+            high_water = self.cfg.buffer_size * 0.75  # 75% full
+            batch_size = self.WRITE_BATCH_SIZE
+            use_segments = self.cfg.use_segments
+
+            while not stop_is_set() or not queue_empty():
                 try:
-                    # Get frame from capture queue with timeout
-                    frame_data = self._frame_queue.get(timeout=0.5)
-                    
-                    if frame_data is None:  # Sentinel to stop
-                        break
+                    # Get frame slot from capture queue with timeout
+                    slot = pop_slot(timeout=0.5)
                     
-                    frame = frame_data['frame']
-                    timestamp = frame_data['timestamp']
-                    frame_number = frame_data['frame_number']
+                    if slot is None:
+                        # Idle or woken for shutdown: flush any remaining frames in batch
+                        if batch_write_buffer:
+                            flush(batch_write_buffer)
+                        continue
                     
                     # Monitor queue health for adaptive processing
-                    queue_size = self._frame_queue.qsize()
-                    write_queue_size = self._write_queue.qsize()
+                    queue_size = queue_size_of()
                     
                     # Adaptive quality control based on queue pressure
-                    if queue_size > self.cfg.buffer_size * 0.75:  # 75% full
+                    if queue_size > high_water:
                         frames_behind += 1
                         if frames_behind > 3 and not self._emergency_mode:
                             self._emergency_mode = True
-                            self._emit_status("⚡ Adaptive mode: Optimizing processing pipeline")
+                            self._post_status("⚡ Adaptive mode: Optimizing processing pipeline")
                     else:
                         frames_behind = max(0, frames_behind - 1)
                         if frames_behind == 0 and self._emergency_mode:
                             self._emergency_mode = False
-                            self._emit_status("✅ Full quality mode restored")
+                            self._post_status("✅ Full quality mode restored")
                     
-                    # Process overlays (skip in emergency mode for speed)
-                    processed_frame = frame
-                    if not self._emergency_mode:
-                        if self.cfg.mouse_highlight or self.cfg.use_webcam:
-                            processed_frame = self._process_frame_overlays(frame)
+                    # Process overlays in place on the slot (skip in emergency mode for speed)
+                    if apply_overlays is not None and not self._emergency_mode:
+                        apply_overlays(ring[slot])
                     
                     # Batch writing for better I/O performance
-                    batch_write_buffer.append({
-                        'frame': processed_frame,
-                        'timestamp': timestamp,
-                        'frame_number': frame_number
-                    })
+                    batch_write_buffer.append(slot)
                     
                     # Write batch when full or in emergency mode
-                    if len(batch_write_buffer) >= max_batch_size or self._emergency_mode:
-                        for batch_item in batch_write_buffer:
-                            if self._writer:
-                                self._video_frame_times.append(batch_item['timestamp'])
-                                self._writer.write(batch_item['frame'])
+                    if len(batch_write_buffer) >= batch_size or self._emergency_mode:
+                        flush(batch_write_buffer)
                         
-                        batch_write_buffer.clear()
+                        if use_segments:
+                            self._rotate_segment_if_due()
                     
-                except queue.Empty:
-                    # Flush any remaining frames in batch
-                    if batch_write_buffer:
-                        for batch_item in batch_write_buffer:
-                            if self._writer:
-                                self._video_frame_times.append(batch_item['timestamp'])
-                                self._writer.write(batch_item['frame'])
-                        batch_write_buffer.clear()
-                    continue
                 except Exception as ex:
-                    self._emit_status(f"Write thread error: {ex}")
+                    self._post_status(f"Write thread error: {ex}")
                     break
             
             # Final flush
             if batch_write_buffer:
-                for batch_item in batch_write_buffer:
-                    if self._writer:
-                        self._video_frame_times.append(batch_item['timestamp'])
-                        self._writer.write(batch_item['frame'])
+                self._flush_write_batch(batch_write_buffer)
                         
         except Exception as ex:
             self._last_exception = ex
-            self._emit_status(f"Write thread error: {ex}")
+            self._post_status(f"Write thread error: {ex}")
+
+    def _flush_write_batch(self, batch: list[int]) -> None:
+        """
+        Write batched frames in order and return their slots to the free-list.
+        
+        Args:
+            batch: Arena slot indices, cleared once written
+        """
+        writer = self._writer
+        if writer and batch:
+            if isinstance(writer, FFmpegPipeWriter):
+                # One gathered pipe write for the whole batch
+                writer.write_many([self._ring[slot] for slot in batch])
+            else:
+                for slot in batch:
+                    writer.write(self._ring[slot])
+            self._frames_written += len(batch)
+            self._last_frame_time = int(self._ring_ts[batch[-1]]) / 1e9
+        self._free_slots.extend(batch)
+        batch.clear()
 
     def _finalize_recording(self) -> None:
         """Production-grade finalization with threaded cleanup."""
@@ -1141,26 +1565,41 @@ class ScreenRecorder:
                 self._emit_status("Stopping capture thread...")
                 self._capture_thread.join(timeout=2.0)
             
+            # Webcam must not be mid-read when it is released
+            if self._cam_thread and self._cam_thread.is_alive():
+                self._cam_thread.join(timeout=1.0)
+            
             if hasattr(self, '_write_thread') and self._write_thread and self._write_thread.is_alive():
                 self._emit_status("Stopping write thread...")
-                # Signal write thread to stop by putting None
-                try:
-                    self._frame_queue.put_nowait(None)
-                except:
-                    pass
+                # Wake the write thread so it drains the queue and sees the stop flag
+                self._frame_queue.wake()
                 self._write_thread.join(timeout=5.0)
+            self._drain_status()
             
-            # CRITICAL: Release video writer FIRST before any file operations
+            # CRITICAL: Release video writer FIRST before any file operations.
+            # release() returns once the file is closed (the pipe writer waits
+            # for FFmpeg to exit), so the file is complete for the next reader.
             if self._writer:
                 self._writer.release()
                 self._writer = None
                 self._emit_status("Video writer released")
-                # Give OS time to fully release file handle
-                time.sleep(0.3)
                 
-                # Add current segment if using segments
-                if self.cfg.use_segments and self._video_tmp_path:
-                    self._segment_paths.append(self._video_tmp_path)
+            # Combine segments into the file the rest of finalization expects
+            if self.cfg.use_segments and self._segment_paths:
+                mux_audio = self.cfg.record_audio and self._audio_recorder and not self.cfg.save_audio_separately
+                if mux_audio:
+                    base_path = os.path.splitext(self.cfg.output_path)[0]
+                    self._video_tmp_path = base_path + "_tmp_video.mp4"
+                    segments_target = self._video_tmp_path
+                else:
+                    segments_target = self.cfg.output_path
+                try:
+                    # With audio, the mux concatenates segments itself in the same FFmpeg pass
+                    self._finish_segments(segments_target, defer_concat=bool(mux_audio))
+                    if len(self._segment_paths) > 1 and not self._video_concat_list:
+                        self._emit_status("Video segments merged successfully")
+                except Exception as ex:
+                    self._emit_status(f"Segment merge failed: {ex}")
             
             # Final performance report
             if self._frame_count > 0:
@@ -1171,61 +1610,38 @@ class ScreenRecorder:
                 self._emit_status(
                     f"📊 Final Stats: {self._frame_count} frames, "
                     f"{final_fps:.1f} FPS, {efficiency:.1f}% efficiency, "
-                    f"{self._dropped_frames} optimized frames"
+                    f"{self._dropped_frames} optimized frames, "
+                    f"{self._frames_written} written over {self._last_frame_time:.1f}s"
                 )
             
             if self.cfg.record_audio and self._audio_recorder:
                 self._emit_status("Stopping audio...")
-                self._audio_recorder.stop()
-                
-                # Additional delay to ensure video file is fully written
-                time.sleep(0.3)
+                self._audio_recorder.stop()  # Joins the writer thread and closes the file
                 
                 # Get audio file path
-                audio_path = getattr(self._audio_recorder, 'wav_path', '')
+                audio_path = getattr(self._audio_recorder, 'audio_path', '')
                 
                 if self.cfg.save_audio_separately:
                     # Save audio separately as requested
                     if audio_path and os.path.exists(audio_path):
-                        # Create final audio path alongside video
-                        base_path = os.path.splitext(self.cfg.output_path)[0]
-                        final_audio_path = base_path + "_audio.wav"
-                        
                         try:
-                            import shutil
-                            shutil.copy2(audio_path, final_audio_path)
+                            final_audio_path = self._save_audio_sidecar(audio_path)
                             self._emit_status(f"Audio saved separately: {final_audio_path}")
                         except Exception as ex:
                             self._emit_status(f"Warning: Could not copy audio file: {ex}")
                             self._emit_status(f"Audio available at: {audio_path}")
                     
-                    # Handle segments without audio
-                    if self.cfg.use_segments and len(self._segment_paths) > 1:
-                        try:
-                            self._merge_segments()
-                            self._emit_status("Video segments merged successfully")
-                        except Exception as ex:
-                            self._emit_status(f"Segment merge failed: {ex}")
-                    else:
-                        self._emit_status("Video saved (audio separate)")
+                    self._emit_status("Video saved (audio separate)")
                 else:
                     # Normal mode: merge audio and video
                     try:
-                        # Handle segment merging first if needed
-                        if self.cfg.use_segments and len(self._segment_paths) > 1:
-                            self._merge_segments()
-                        
                         self._mux_audio_video()
                         self._emit_status("Recording saved with audio")
                     except Exception as ex:
                         # Fallback: Save audio separately if muxing fails
                         if audio_path and os.path.exists(audio_path):
-                            base_path = os.path.splitext(self.cfg.output_path)[0]
-                            final_audio_path = base_path + "_audio.wav"
-                            
                             try:
-                                import shutil
-                                shutil.copy2(audio_path, final_audio_path)
+                                final_audio_path = self._save_audio_sidecar(audio_path)
                                 self._emit_status(
                                     f"Video saved. Audio merge failed: {ex}\n"
                                     f"Audio saved separately: {final_audio_path}"
@@ -1238,82 +1654,175 @@ class ScreenRecorder:
                         else:
                             self._emit_status(f"Video saved. Audio merge failed: {ex}")
             else:
-                # Handle segments without audio
-                if self.cfg.use_segments and len(self._segment_paths) > 1:
-                    try:
-                        self._merge_segments()
-                        self._emit_status("Segments merged successfully")
-                    except Exception as ex:
-                        self._emit_status(f"Segment merge failed: {ex}")
-                else:
-                    self._emit_status("Recording saved")
+                self._emit_status("Recording saved")
                 
         except Exception as ex:
             self._emit_status(f"Error finalizing recording: {ex}")
         finally:
             self._cleanup()
 
-    def _should_start_new_segment(self) -> bool:
-        """Check if a new segment should be started based on duration."""
-        if self._segment_start_time == 0:
-            self._segment_start_time = time.time()
-            return False
-            
-        elapsed_minutes = (time.time() - self._segment_start_time) / 60
-        return elapsed_minutes >= self.cfg.segment_duration_minutes
-    
-    def _start_new_segment(self, width: int, height: int) -> None:
-        """Start a new recording segment."""
-        try:
-            # Finalize current segment
-            if self._writer:
-                self._writer.release()
-                self._writer = None
-                
-                # Save current segment path
-                if self._video_tmp_path:
-                    self._segment_paths.append(self._video_tmp_path)
-            
-            # Create new segment
-            self._current_segment += 1
-            base, ext = os.path.splitext(self.cfg.output_path)
-            segment_path = f"{base}_segment_{self._current_segment:03d}{ext}"
+    def _save_audio_sidecar(self, audio_path: str) -> str:
+        """
+        Move the intermediate audio file next to the video.
+        
+        The intermediate file is not needed afterwards, so it is renamed when
+        it is on the same filesystem; otherwise shutil copies it with the
+        kernel fast path (sendfile/fcopyfile) and removes the temp file.
+        
+        Args:
+            audio_path: Intermediate audio file
             
-            if self.cfg.record_audio:
-                self._video_tmp_path = f"{base}_segment_{self._current_segment:03d}_tmp_video.mp4"
-            else:
-                segment_path = self._video_tmp_path = segment_path
+        Returns:
+            Path of the saved audio file
+        """
+        import shutil
+        base_path = os.path.splitext(self.cfg.output_path)[0]
+        final_audio_path = base_path + "_audio" + os.path.splitext(audio_path)[1]
+        shutil.move(audio_path, final_audio_path)
+        return final_audio_path
+
+    def _segment_path(self, index: int) -> str:
+        """Get the file path for a numbered segment."""
+        base, ext = os.path.splitext(self.cfg.output_path)
+        if self.cfg.record_audio:
+            return f"{base}_segment_{index:03d}_tmp_video.mp4"
+        return f"{base}_segment_{index:03d}{ext}"
+
+    def _open_segment_writer(self, index: int) -> tuple[Any, str]:
+        """
+        Open the writer for a segment (runs on the thread pool).
+        
+        Segments are concatenated (and possibly stream-copied) as one video, so
+        a writer that fell back to a different encoder than the first segment
+        is rejected and the current segment keeps growing instead.
+        
+        Args:
+            index: Segment number
             
-            # Create new writer for this segment
-            fourcc, codec_name = self._get_optimized_codec()
-            self._writer = cv2.VideoWriter(self._video_tmp_path or segment_path, fourcc, float(self.cfg.fps), (width, height))
+        Returns:
+            Tuple of (writer, segment_path)
             
-            if not self._writer or not self._writer.isOpened():
-                raise RuntimeError(f"Failed to create video writer for segment {self._current_segment}")
+        Raises:
+            RuntimeError: If the writer could not be opened with the recording's encoder
+        """
+        segment_path = self._segment_path(index)
+        width, height = self._frame_size
+        writer = self._open_video_writer(segment_path, width, height)
+        if isinstance(writer, FFmpegPipeWriter) != self._video_is_h264:
+            writer.release()
+            _remove_quietly(segment_path)
+            raise RuntimeError("encoder differs from the first segment")
+        return writer, segment_path
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """Get the helper thread pool, creating it on first use."""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.cfg.thread_pool_size, thread_name_prefix="recorder"
+            )
+        return self._thread_pool
+
+    def _shutdown_thread_pool(self, wait: bool) -> None:
+        """Shut down the helper thread pool if it was ever started."""
+        pool, self._thread_pool = self._thread_pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _rotate_segment_if_due(self) -> None:
+        """
+        Switch to the next segment at its boundary without stalling the write thread.
+        The next writer is opened on the thread pool shortly before the boundary,
+        so the swap itself is a pointer exchange and the old writer is closed
+        in the background.
+        """
+        now = time.perf_counter()
+        
+        if self._next_writer_future is None:
+            if now >= self._segment_end_time - 2.0:
+                self._next_writer_future = self._get_thread_pool().submit(
+                    self._open_segment_writer, self._current_segment + 1
+                )
+            return
             
-            self._segment_start_time = time.time()
-            self._emit_status(f"Started segment {self._current_segment}: {os.path.basename(segment_path)}")
+        if now < self._segment_end_time or not self._next_writer_future.done():
+            return
             
+        future, self._next_writer_future = self._next_writer_future, None
+        try:
+            next_writer, segment_path = future.result()
         except Exception as ex:
-            self._emit_status(f"Failed to start new segment: {ex}")
-            raise
-    
-    def _merge_segments(self) -> None:
-        """Merge all segments into final output file."""
+            # Keep writing to the current segment and try again next period
+            self._post_status(f"Failed to start new segment: {ex}")
+            self._segment_end_time = now + self._segment_seconds
+            return
+            
+        old_writer, self._writer = self._writer, next_writer
+        self._current_segment += 1
+        self._segment_paths.append(segment_path)
+        self._segment_end_time += self._segment_seconds
+        self._get_thread_pool().submit(old_writer.release)
+        self._post_status(f"Started segment {self._current_segment}: {os.path.basename(segment_path)}")
+
+    def _finish_segments(self, target_path: str, defer_concat: bool = False) -> None:
+        """
+        Close any writer opened ahead of time and combine segments into one file.
+        
+        Args:
+            target_path: Path the combined video should end up at
+            defer_concat: Leave multiple segments in place and only write the
+                concat list (_video_concat_list) for the audio mux to read
+        """
+        # Let background segment releases finish before touching the files
+        if self._next_writer_future is not None:
+            try:
+                spare_writer, spare_path = self._next_writer_future.result()
+                spare_writer.release()
+                os.remove(spare_path)
+            except Exception:
+                pass
+            self._next_writer_future = None
+        self._shutdown_thread_pool(wait=True)
+        
+        if len(self._segment_paths) == 1:
+            os.replace(self._segment_paths[0], target_path)
+        elif defer_concat:
+            self._video_concat_list = self._write_concat_list()
+        elif self._segment_paths:
+            self._merge_segments(target_path)
+
+    def _write_concat_list(self) -> str:
+        """
+        Write the FFmpeg concat demuxer list for the recorded segments.
+        
+        Returns:
+            Path of the list file
+        """
+        concat_file = tempfile.mktemp(suffix='.txt')
+        with open(concat_file, 'w') as f:
+            for segment_path in self._segment_paths:
+                f.write(f"file '{segment_path}'\n")
+        return concat_file
+
+    def _merge_segments(self, output_path: Optional[str] = None) -> None:
+        """
+        Merge all segments into one file.
+        
+        Args:
+            output_path: Merged file path (defaults to the configured output)
+        """
         if not self._segment_paths:
             return
             
+        output_path = output_path or self.cfg.output_path
+            
         try:
             # Find FFmpeg
-            ffmpeg_path, _ = find_ffmpeg_path(self.cfg.ffmpeg_path)
+            ffmpeg_path, _ = cached_ffmpeg_path(self.cfg.ffmpeg_path)
             if not ffmpeg_path:
                 raise RuntimeError("FFmpeg not found for segment merging")
             
             # Create file list for FFmpeg concat
-            concat_file = tempfile.mktemp(suffix='.txt')
-            with open(concat_file, 'w') as f:
-                for segment_path in self._segment_paths:
-                    f.write(f"file '{segment_path}'\n")
+            concat_file = self._write_concat_list()
             
             # Merge segments
             cmd = [
@@ -1322,37 +1831,37 @@ class ScreenRecorder:
                 '-safe', '0',
                 '-i', concat_file,
                 '-c', 'copy',  # Copy without re-encoding
-                self.cfg.output_path
+                output_path
             ]
             
-            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            if proc.returncode != 0:
-                raise RuntimeError(f"Segment merge failed: {proc.stderr}")
+            returncode, stderr_tail = run_ffmpeg(cmd, timeout=300)
+            if returncode != 0:
+                raise RuntimeError(f"Segment merge failed: {stderr_tail}")
             
             self._emit_status(f"Merged {len(self._segment_paths)} segments")
             
-            # Cleanup segment files
-            for segment_path in self._segment_paths:
-                try:
-                    if os.path.exists(segment_path):
-                        os.remove(segment_path)
-                except Exception:
-                    pass
-            
-            # Cleanup concat file
-            try:
-                if os.path.exists(concat_file):
-                    os.remove(concat_file)
-            except Exception:
-                pass
+            # Cleanup segment files and concat list in the background
+            self._remove_files_async([*self._segment_paths, concat_file])
                 
         except Exception as ex:
             self._emit_status(f"Segment merge failed: {ex}")
             raise
 
+    def _remove_files_async(self, paths: list[str]) -> None:
+        """
+        Delete temporary files on the helper pool so finalization does not
+        wait on them (closing handles can be slow on Windows).
+        
+        Args:
+            paths: Files to delete; missing files are ignored
+        """
+        pool = self._get_thread_pool()
+        for path in paths:
+            pool.submit(_remove_quietly, path)
+
     def _cleanup(self) -> None:
-        """Cleanup all recording resources."""
-        # Close video writer
+        """Cleanup all recording resources (last step of finalization, on the recording thread)."""
+        # Close video writer (must finish before the file is reported saved)
         if self._writer:
             try:
                 self._writer.release()
@@ -1368,95 +1877,174 @@ class ScreenRecorder:
                 pass
             self._sct = None
             
-        # Close webcam
-        if self._cam:
-            try:
-                self._cam.release()
-            except Exception:
-                pass
-            self._cam = None
-            
         # Close thread pool
-        if hasattr(self, '_thread_pool'):
-            try:
-                self._thread_pool.shutdown(wait=False)
-            except Exception:
-                pass
-            
-        # Close preview windows
         try:
-            cv2.destroyAllWindows()
+            self._shutdown_thread_pool(wait=False)
         except Exception:
             pass
-        """Cleanup all recording resources."""
-        # Close video writer
-        if self._writer:
-            try:
-                self._writer.release()
-            except Exception:
-                pass
-            self._writer = None
-            
-        # Close screen capture
-        if self._sct:
-            try:
-                self._sct.close()
-            except Exception:
-                pass
-            self._sct = None
-            
-        # Close webcam
-        if self._cam:
-            try:
-                self._cam.release()
-            except Exception:
-                pass
-            self._cam = None
             
-        # Close preview windows
+        # Webcam and preview window teardown can block for hundreds of ms on
+        # Windows; nothing waits on it, so it runs off the stopping thread
+        cam, self._cam = self._cam, None
+        self._teardown_pool().submit(_release_display_resources, cam)
+
+    @classmethod
+    def _teardown_pool(cls) -> ThreadPoolExecutor:
+        """Get the single worker shared by all recorders for teardown."""
+        if cls._teardown_executor is None:
+            cls._teardown_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="recorder-teardown"
+            )
+        return cls._teardown_executor
+
+
+def _release_display_resources(cam: Optional[Any]) -> None:
+    """
+    Release the webcam and close OpenCV preview windows.
+    
+    Args:
+        cam: cv2.VideoCapture to release, or None
+    """
+    if cam is not None:
         try:
-            cv2.destroyAllWindows()
+            cam.release()
         except Exception:
             pass
+    try:
+        cv2.destroyAllWindows()
+    except Exception:
+        pass
+
+def _camera_backends() -> tuple[int, ...]:
+    """
+    Get the capture backend for this platform.
+    
+    Cascading through backends makes every missing index pay for several slow
+    failed opens (and CAP_ANY enumerates devices twice on Linux), so only the
+    native backend is used. Set RECORDER_CAMERA_FALLBACK=1 to also try CAP_ANY.
+    
+    Returns:
+        Backends to try, in order
+    """
+    if os.name == 'nt':
+        native = cv2.CAP_MSMF
+    elif sys.platform == 'darwin':
+        native = cv2.CAP_AVFOUNDATION
+    elif sys.platform.startswith('linux'):
+        native = cv2.CAP_V4L2
+    else:
+        return (cv2.CAP_ANY,)
+    if os.environ.get("RECORDER_CAMERA_FALLBACK") == "1":
+        return (native, cv2.CAP_ANY)
+    return (native,)
 
 
-def probe_cameras(max_index: int = 6) -> list[int]:
+# Resolved once; probes and webcam setup run the same backends for every index
+_CAMERA_BACKENDS = _camera_backends()
+
+
+def _probe_camera(index: int) -> Optional[int]:
     """
-    Probe for available camera devices.
+    Check whether a camera index can be opened.
     
     Args:
-        max_index: Maximum camera index to check
+        index: Camera index
         
     Returns:
-        List of available camera indices
+        The index if a backend opened it, otherwise None
     """
-    available_cameras = []
-    
-    for i in range(max_index):
+    for backend in _CAMERA_BACKENDS:
+        cap = None
         try:
-            # Try multiple backends for better compatibility
-            backends = [cv2.CAP_DSHOW, cv2.CAP_MSMF, cv2.CAP_ANY] if os.name == 'nt' else [cv2.CAP_ANY]
-            
-            camera_found = False
-            for backend in backends:
+            cap = cv2.VideoCapture(index, backend)
+            if cap.isOpened():
+                return index
+        except Exception:
+            pass
+        finally:
+            if cap is not None:
                 try:
-                    cap = cv2.VideoCapture(i, backend)
-                    if cap.isOpened():
-                        available_cameras.append(i)
-                        camera_found = True
-                        cap.release()
-                        break
                     cap.release()
                 except Exception:
-                    try:
-                        cap.release()
-                    except Exception:
-                        pass
-                        
-            if camera_found:
-                break
-                
+                    pass
+    return None
+
+
+def _list_camera_devices() -> Optional[list[int]]:
+    """
+    Count capture devices from OS metadata without opening any of them.
+    
+    Linux reads sysfs and macOS uses pyobjc when it is installed; both list
+    devices in the index order of the native backend from _CAMERA_BACKENDS.
+    Windows has no such source: the cameras are opened with Media Foundation,
+    whose device order and count differ from DirectShow's (virtual cameras
+    are DirectShow-only), so its indices are found by probing instead.
+    
+    Returns:
+        Sorted camera indices, or None if no metadata source is available
+    """
+    if sys.platform.startswith('linux'):
+        sysfs = '/sys/class/video4linux'
+        if not os.path.isdir(sysfs):
+            # No video4linux class at all means no V4L2 cameras (unless sysfs is missing)
+            return [] if os.path.isdir('/sys/class') else None
+        indices = []
+        for name in os.listdir(sysfs):
+            if not name.startswith('video') or not name[5:].isdigit():
+                continue
+            # Each camera also exposes metadata nodes; only index 0 captures frames
+            try:
+                with open(os.path.join(sysfs, name, 'index')) as f:
+                    if f.read().strip() != '0':
+                        continue
+            except OSError:
+                pass
+            indices.append(int(name[5:]))
+        return sorted(indices)
+        
+    if sys.platform == 'darwin':
+        try:
+            from AVFoundation import AVCaptureDevice, AVMediaTypeVideo
+            return list(range(len(AVCaptureDevice.devicesWithMediaType_(AVMediaTypeVideo))))
         except Exception:
-            continue
+            return None
             
-    return available_cameras
+    return None
+
+
+# probe_cameras results by max_index: (monotonic time, camera indices)
+_PROBE_CACHE: dict[int, tuple[float, list[int]]] = {}
+_PROBE_CACHE_TTL = 5.0  # Seconds; short enough to notice hot-plugged cameras
+
+
+def probe_cameras(max_index: int = 6, force: bool = False) -> list[int]:
+    """
+    Probe for available camera devices.
+    Opening a capture device can take seconds, so results are reused for
+    a few seconds across repeated calls (UI refreshes, recorder start).
+    
+    Args:
+        max_index: Maximum camera index to check
+        force: Ignore cached results and probe again
+        
+    Returns:
+        List of available camera indices
+    """
+    cached = _PROBE_CACHE.get(max_index)
+    if cached and not force and time.monotonic() - cached[0] < _PROBE_CACHE_TTL:
+        return list(cached[1])
+        
+    # Device metadata is instant; opening devices is the fallback
+    listed = _list_camera_devices()
+    if listed is not None:
+        available_cameras = [i for i in listed if i < max_index]
+        _PROBE_CACHE[max_index] = (time.monotonic(), available_cameras)
+        return list(available_cameras)
+        
+    # Device opens are driver-bound and independent, so probe all indices at once
+    with ThreadPoolExecutor(max_workers=max(1, max_index), thread_name_prefix="camera-probe") as pool:
+        results = pool.map(_probe_camera, range(max_index))
+        available_cameras = [i for i in results if i is not None]
+        
+    _PROBE_CACHE[max_index] = (time.monotonic(), available_cameras)
+    return list(available_cameras)
@@ -1,5 +1,11 @@
 """User interface components."""
 
-from .main_window import RecorderApp, create_app
-
 __all__ = ["RecorderApp", "create_app"]
+
+
+def __getattr__(name):
+    """Import the main window on first access so other windows load without it."""
+    if name in __all__:
+        from . import main_window
+        return getattr(main_window, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,24 +5,42 @@ Minimal interface with essential features only.
 
 import os
 import sys
-import datetime as dt
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Optional
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 # Handle imports
 try:
-    from ..core.config import RecorderConfig
-    from ..core.video import ScreenRecorder
-    from ..core.audio import is_audio_available
-    from ..utils.helpers import find_ffmpeg_path
+    from ..core.config import RecorderConfig, VIDEO_QUALITIES
+    from ..utils.helpers import default_output_name, cached_ffmpeg_path, invalidate_ffmpeg_path
+    from .shutdown import close_after_recording, stop_recording_async
 except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from core.config import RecorderConfig
+    from core.config import RecorderConfig, VIDEO_QUALITIES
+    from utils.helpers import default_output_name, cached_ffmpeg_path, invalidate_ffmpeg_path
+    from ui.shutdown import close_after_recording, stop_recording_async
+
+if TYPE_CHECKING:
     from core.video import ScreenRecorder
-    from core.audio import is_audio_available
-    from utils.helpers import find_ffmpeg_path
+
+
+def _load_recording_backend():
+    """
+    Import the recorder on first use; OpenCV, NumPy, mss and the audio
+    libraries are only needed once recording starts.
+    
+    Returns:
+        Tuple of (ScreenRecorder, is_audio_available)
+    """
+    try:
+        from ..core.video import ScreenRecorder
+        from ..core.audio import is_audio_available
+    except ImportError:
+        from core.video import ScreenRecorder
+        from core.audio import is_audio_available
+    return ScreenRecorder, is_audio_available
 
 
 class SimpleRecorderApp(ttk.Frame):
@@ -31,6 +49,9 @@ class SimpleRecorderApp(ttk.Frame):
     Essential features only - no clutter.
     """
     
+    STATUS_POLL_MS = 100  # How often recorder status messages reach the UI
+    SHUTDOWN_TIMEOUT_S = 60  # Longest wait for a recording to finalize on close
+    
     def __init__(self, master: tk.Tk):
         super().__init__(master)
         self.master = master
@@ -39,7 +60,16 @@ class SimpleRecorderApp(ttk.Frame):
         
         # Application state
         self.recording = False
-        self.recorder: Optional[ScreenRecorder] = None
+        self._stopping = False  # Stop requested, recorder still finalizing
+        self.recorder: Optional["ScreenRecorder"] = None
+        self._shown_recording: Optional[bool] = None  # State the buttons last showed
+        
+        # Folders last picked in file dialogs, reused as their starting point
+        self._last_output_dir: Optional[str] = None
+        
+        # Latest status text; recorder threads only store it, the Tk thread shows it
+        self._pending_status: Optional[str] = None
+        self._shown_status: Optional[str] = None
         
         # Initialize variables
         self._init_variables()
@@ -50,6 +80,7 @@ class SimpleRecorderApp(ttk.Frame):
         
         # Setup event handlers
         self.master.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.master.after(self.STATUS_POLL_MS, self._poll_status)
         
         # Check dependencies
         self._check_dependencies()
@@ -115,7 +146,7 @@ class SimpleRecorderApp(ttk.Frame):
         # Video quality
         ttk.Label(settings_frame, text="Quality:").grid(row=1, column=0, sticky="w", pady=5)
         quality_combo = ttk.Combobox(settings_frame, textvariable=self.var_video_quality,
-                                   values=["low", "medium", "high", "ultra"], width=8, state="readonly")
+                                   values=VIDEO_QUALITIES, width=8, state="readonly")
         quality_combo.grid(row=1, column=1, sticky="w", padx=(10, 0), pady=5)
         
         # Audio recording
@@ -151,9 +182,16 @@ class SimpleRecorderApp(ttk.Frame):
         status_label = ttk.Label(frame, textvariable=self.var_status, 
                                foreground="blue")
         status_label.pack(side="left", padx=(10, 0))
+        
+        ttk.Button(frame, text="Rescan", 
+                  command=self._rescan_dependencies).pack(side="right")
 
     def _update_button_states(self) -> None:
         """Update button states based on recording status."""
+        if self.recording == self._shown_recording:
+            return
+        self._shown_recording = self.recording
+        
         if self.recording:
             self.btn_start.state(["disabled"])
             self.btn_stop.state(["!disabled"])
@@ -165,26 +203,31 @@ class SimpleRecorderApp(ttk.Frame):
 
     def _browse_output(self) -> None:
         """Browse for output file location."""
-        default_name = dt.datetime.now().strftime("recording_%Y%m%d_%H%M%S.mp4")
+        default_name = default_output_name()
         path = filedialog.asksaveasfilename(
+            parent=self.master,
+            initialdir=self._last_output_dir,
             defaultextension=".mp4",
             filetypes=[("MP4 files", "*.mp4"), ("All files", "*.*")],
             initialfile=default_name,
             title="Save recording as..."
         )
         if path:
+            self._last_output_dir = os.path.dirname(path)
             self.var_output.set(path)
 
     def _make_output_path(self) -> str:
         """Generate output file path with default if not specified."""
         path = self.var_output.get().strip()
         if not path:
-            default_name = dt.datetime.now().strftime("recording_%Y%m%d_%H%M%S.mp4")
+            default_name = default_output_name()
             path = os.path.join(os.getcwd(), default_name)
             self.var_output.set(path)
         
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Ensure output directory exists (bare filenames have no directory part)
+        parent = os.path.dirname(path)
+        if parent and not os.path.isdir(parent):
+            os.makedirs(parent, exist_ok=True)
         return path
 
     def _create_config(self) -> RecorderConfig:
@@ -206,16 +249,42 @@ class SimpleRecorderApp(ttk.Frame):
         )
 
     def _set_status(self, message: str) -> None:
-        """Update status message."""
-        self.var_status.set(message)
+        """
+        Update status message.
+        The recorder calls this from its worker threads, which must not touch
+        Tk: their messages are stored and picked up by _poll_status, so a burst
+        of updates costs a single redraw. Redraws are left to the event loop;
+        use _show_status_now before blocking the Tk thread.
+        """
+        self._pending_status = message
+        if threading.current_thread() is threading.main_thread():
+            self._flush_status()
+
+    def _show_status_now(self, message: str) -> None:
+        """Show a status message immediately, ahead of a blocking call on the Tk thread."""
+        self._set_status(message)
         self.master.update_idletasks()
 
+    def _flush_status(self) -> None:
+        """Show the latest status message if it changed."""
+        message = self._pending_status
+        if message is not self._shown_status:
+            self._shown_status = message
+            self.var_status.set(message)
+
+    def _poll_status(self) -> None:
+        """Show status messages posted from recorder threads."""
+        self._flush_status()
+        self.master.after(self.STATUS_POLL_MS, self._poll_status)
+
     def _start_recording(self) -> None:
         """Start screen recording."""
         if self.recording:
             return
             
         try:
+            ScreenRecorder, is_audio_available = _load_recording_backend()
+            
             # Check audio dependencies if audio is enabled
             if self.var_record_audio.get() and not is_audio_available():
                 response = messagebox.askyesno(
@@ -244,33 +313,43 @@ class SimpleRecorderApp(ttk.Frame):
             self._set_status(f"Error: {ex}")
 
     def _stop_recording(self) -> None:
-        """Stop current recording."""
-        if not self.recording or not self.recorder:
+        """
+        Stop current recording.
+        The recorder finalizes on its own thread (writer release, mux); the
+        outcome is reported once it has finished, without blocking the UI.
+        """
+        if not self.recording or not self.recorder or self._stopping:
             return
-            
-        try:
-            self._set_status("Stopping recording...")
-            self.recorder.stop()
-            
-            # Check for errors
-            last_error = self.recorder.get_last_error()
-            if last_error:
-                self._set_status(f"Recording completed with warnings")
-                messagebox.showwarning("Warning", f"Recording completed with warnings:\n{last_error}")
-            else:
-                self._set_status("Recording saved successfully")
-                messagebox.showinfo("Success", f"Recording saved:\n{self.recorder.cfg.output_path}")
-                
-        except Exception as ex:
-            messagebox.showerror("Error", f"Failed to stop recording:\n{ex}")
-            self._set_status(f"Stop error: {ex}")
-        finally:
-            self.recording = False
-            self._update_button_states()
+        self._stopping = True
+        self._show_status_now("Stopping recording...")
+        self.btn_stop.state(["disabled"])
+        stop_recording_async(self.master, self.recorder, self.STATUS_POLL_MS, self._on_recording_stopped)
+
+    def _on_recording_stopped(self, finished: bool) -> None:
+        """
+        Report how the recording ended.
+        
+        Args:
+            finished: True if the recorder finished saving
+        """
+        self._stopping = False
+        self.recording = False
+        self._update_button_states()
+        
+        last_error = self.recorder.get_last_error() if self.recorder else None
+        if not finished:
+            self._set_status("Stop error: recording did not finish saving")
+            messagebox.showerror("Error", "Failed to stop recording:\nthe recording did not finish saving")
+        elif last_error:
+            self._set_status(f"Recording completed with warnings")
+            messagebox.showwarning("Warning", f"Recording completed with warnings:\n{last_error}")
+        else:
+            self._set_status("Recording saved successfully")
+            messagebox.showinfo("Success", f"Recording saved:\n{self.recorder.cfg.output_path}")
 
     def _check_dependencies(self) -> None:
         """Check for required dependencies."""
-        ffmpeg_path, source = find_ffmpeg_path("")
+        ffmpeg_path, source = cached_ffmpeg_path("")
         
         if ffmpeg_path:
             self._set_status("Ready to record")
@@ -278,20 +357,30 @@ class SimpleRecorderApp(ttk.Frame):
             self._set_status("Ready (audio disabled - FFmpeg not found)")
             self.var_record_audio.set(False)
 
+    def _rescan_dependencies(self) -> None:
+        """Search for FFmpeg again, picking up a newly installed copy."""
+        invalidate_ffmpeg_path()
+        self._check_dependencies()
+
     def _on_close(self) -> None:
-        """Handle application close."""
-        try:
-            if self.recorder and self.recording:
-                self.recorder.stop()
-        except Exception:
-            pass
-        self.master.destroy()
+        """
+        Handle application close.
+        A running recording is finalized on a worker thread while the window
+        is hidden, so closing does not freeze the UI during muxing.
+        """
+        if not (self.recorder and self.recording):
+            self.master.destroy()
+            return
+        close_after_recording(self.master, self.recorder, self.SHUTDOWN_TIMEOUT_S, self.STATUS_POLL_MS)
 
 
 def create_clean_app() -> tk.Tk:
     """Create clean, simple screen recorder app."""
     root = tk.Tk()
     
+    # Keep the window unmapped while widgets are packed so it is laid out once
+    root.withdraw()
+    
     # Configure window
     root.geometry("500x400")
     root.minsize(450, 350)
@@ -308,6 +397,9 @@ def create_clean_app() -> tk.Tk:
     # Create application
     app = SimpleRecorderApp(root)
     
+    root.update_idletasks()
+    root.deiconify()
+    
     return root
 
 
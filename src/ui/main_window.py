@@ -5,25 +5,55 @@ Provides Tkinter-based GUI for configuring and controlling recording.
 
 import os
 import sys
-import datetime as dt
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, colorchooser
 
 # Handle imports for both direct execution and module imports
 try:
-    from ..core.config import RecorderConfig
-    from ..core.video import ScreenRecorder, probe_cameras
-    from ..core.audio import get_audio_devices, is_audio_available
-    from ..utils.helpers import find_ffmpeg_path, test_ffmpeg
+    from ..core.config import RecorderConfig, VIDEO_QUALITIES, PIP_POSITIONS
+    from ..utils.helpers import default_output_name, cached_ffmpeg_path, cached_test_ffmpeg
+    from .shutdown import close_after_recording, stop_recording_async
 except ImportError:
     # Absolute imports fallback
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from core.config import RecorderConfig
-    from core.video import ScreenRecorder, probe_cameras
-    from core.audio import get_audio_devices, is_audio_available
-    from utils.helpers import find_ffmpeg_path, test_ffmpeg
+    from core.config import RecorderConfig, VIDEO_QUALITIES, PIP_POSITIONS
+    from utils.helpers import default_output_name, cached_ffmpeg_path, cached_test_ffmpeg
+    from ui.shutdown import close_after_recording, stop_recording_async
+
+if TYPE_CHECKING:
+    from core.video import ScreenRecorder
+
+
+def _video_backend():
+    """
+    Import the video module on first use; it pulls in OpenCV, NumPy and mss,
+    which the window does not need to appear.
+    
+    Returns:
+        The core.video module
+    """
+    try:
+        from ..core import video
+    except ImportError:
+        from core import video
+    return video
+
+
+def _audio_backend():
+    """
+    Import the audio module on first use (NumPy, sounddevice, soundfile).
+    
+    Returns:
+        The core.audio module
+    """
+    try:
+        from ..core import audio
+    except ImportError:
+        from core import audio
+    return audio
 
 
 class RecorderApp(ttk.Frame):
@@ -32,6 +62,10 @@ class RecorderApp(ttk.Frame):
     Provides comprehensive UI for all recording features and settings.
     """
     
+    STATUS_POLL_MS = 100  # How often recorder status messages reach the UI
+    SHUTDOWN_TIMEOUT_S = 60  # Longest wait for a recording to finalize on close
+    WORKER_POLL_MS = 50  # How often device/FFmpeg worker threads are checked
+    
     def __init__(self, master: tk.Tk):
         """
         Initialize the recorder application UI.
@@ -46,7 +80,17 @@ class RecorderApp(ttk.Frame):
         
         # Application state
         self.recording = False
-        self.recorder: Optional[ScreenRecorder] = None
+        self._stopping = False  # Stop requested, recorder still finalizing
+        self.recorder: Optional["ScreenRecorder"] = None
+        self._shown_recording: Optional[bool] = None  # State the buttons last showed
+        
+        # Folders last picked in file dialogs, reused as their starting point
+        self._last_output_dir: Optional[str] = None
+        self._last_ffmpeg_dir: Optional[str] = None
+        
+        # Latest status text; recorder threads only store it, the Tk thread shows it
+        self._pending_status: Optional[str] = None
+        self._shown_status: Optional[str] = None
         
         # Initialize UI variables
         self._init_variables()
@@ -57,13 +101,12 @@ class RecorderApp(ttk.Frame):
         
         # Setup event handlers
         self.master.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.master.after(self.STATUS_POLL_MS, self._poll_status)
         
-        # Initialize device lists
-        self._refresh_audio_devices()
-        self._refresh_cameras()
-        
-        # Check FFmpeg availability
-        self._check_ffmpeg_startup()
+        # Enumerate devices and look for FFmpeg off the Tk thread so the window
+        # appears immediately
+        self._set_status("Detecting devices...")
+        self._start_startup_probe()
 
     def _init_variables(self) -> None:
         """Initialize all Tkinter variables for UI controls."""
@@ -107,7 +150,8 @@ class RecorderApp(ttk.Frame):
         self.var_segment_duration = tk.IntVar(value=60)
         
         # Audio device list
-        self._audio_devices: list[tuple[str, Optional[int]]] = [("Default", None)]
+        self._audio_id_by_label: dict[str, Optional[int]] = {"Default": None}
+        self._audio_labels: tuple[str, ...] = ("Default",)
 
     def _build_ui(self) -> None:
         """Build the complete user interface."""
@@ -143,21 +187,25 @@ class RecorderApp(ttk.Frame):
         """Build output file configuration section."""
         section = ttk.Frame(parent)
         section.pack(fill="x", pady=(0, 8))
+        section.columnconfigure(1, weight=1)
         
         # Output path row
-        row = ttk.Frame(section)
-        row.pack(fill="x", pady=4)
-        ttk.Label(row, text="Output MP4:").pack(side="left")
-        ttk.Entry(row, textvariable=self.var_output, width=50).pack(
-            side="left", padx=6, fill="x", expand=True
+        ttk.Label(section, text="Output MP4:").grid(row=0, column=0, sticky="w", pady=4)
+        ttk.Entry(section, textvariable=self.var_output, width=50).grid(
+            row=0, column=1, sticky="ew", padx=6, pady=4
+        )
+        ttk.Button(section, text="Browse…", command=self._browse_output).grid(
+            row=0, column=2, pady=4
         )
-        ttk.Button(row, text="Browse…", command=self._browse_output).pack(side="left")
         
         # FPS row
-        row = ttk.Frame(section)
-        row.pack(fill="x", pady=4)
-        ttk.Label(row, text="FPS:").pack(side="left")
-        ttk.Entry(row, textvariable=self.var_fps, width=6).pack(side="left", padx=6)
+        ttk.Label(section, text="FPS:").grid(row=1, column=0, sticky="w", pady=4)
+        ttk.Entry(
+            section, textvariable=self.var_fps, width=6, validate="key",
+            validatecommand=(self.register(self._is_digits), "%P")
+        ).grid(
+            row=1, column=1, sticky="w", padx=6, pady=4
+        )
 
     def _build_screen_section(self, parent: ttk.Widget) -> None:
         """Build screen capture configuration section."""
@@ -213,22 +261,20 @@ class RecorderApp(ttk.Frame):
         section = ttk.LabelFrame(parent, text="Mouse Highlight")
         section.pack(fill="x", pady=6)
         
-        row = ttk.Frame(section)
-        row.pack(fill="x", pady=4)
-        
+        # Single row, packed straight into the section
         ttk.Checkbutton(
-            row, 
+            section, 
             text="Show mouse cursor", 
             variable=self.var_mouse_highlight
-        ).pack(side="left")
+        ).pack(side="left", pady=4)
         
-        ttk.Label(row, text="Radius").pack(side="left", padx=(10, 2))
-        ttk.Entry(row, textvariable=self.var_mouse_radius, width=6).pack(side="left")
+        ttk.Label(section, text="Radius").pack(side="left", padx=(10, 2))
+        ttk.Entry(section, textvariable=self.var_mouse_radius, width=6).pack(side="left")
         
-        ttk.Label(row, text="Opacity").pack(side="left", padx=(10, 2))
-        ttk.Entry(row, textvariable=self.var_mouse_alpha, width=6).pack(side="left")
+        ttk.Label(section, text="Opacity").pack(side="left", padx=(10, 2))
+        ttk.Entry(section, textvariable=self.var_mouse_alpha, width=6).pack(side="left")
         
-        ttk.Button(row, text="Pick Color", command=self._pick_mouse_color).pack(
+        ttk.Button(section, text="Pick Color", command=self._pick_mouse_color).pack(
             side="left", padx=6
         )
 
@@ -236,10 +282,11 @@ class RecorderApp(ttk.Frame):
         """Build audio recording configuration section."""
         section = ttk.LabelFrame(parent, text="Audio Recording")
         section.pack(fill="x", pady=6)
+        section.columnconfigure(1, weight=1)
         
         # Audio enable controls
         row1 = ttk.Frame(section)
-        row1.pack(fill="x", pady=4)
+        row1.grid(row=0, column=0, columnspan=4, sticky="ew", pady=4)
         ttk.Checkbutton(
             row1, 
             text="Record audio", 
@@ -260,41 +307,39 @@ class RecorderApp(ttk.Frame):
         ).pack(side="left", padx=(10, 0))
         
         # Device selection
-        row2 = ttk.Frame(section)
-        row2.pack(fill="x", pady=4)
-        ttk.Label(row2, text="Device:").pack(side="left")
+        ttk.Label(section, text="Device:").grid(row=1, column=0, sticky="w", pady=4)
         
         self.cmb_audio = ttk.Combobox(
-            row2, 
+            section, 
             textvariable=self.var_audio_device, 
             width=50, 
             state="readonly",
-            values=[label for label, _ in self._audio_devices]
+            values=self._audio_labels
         )
-        self.cmb_audio.pack(side="left", padx=6, fill="x", expand=True)
+        self.cmb_audio.grid(row=1, column=1, sticky="ew", padx=6, pady=4)
         
-        ttk.Button(row2, text="Refresh", command=self._refresh_audio_devices).pack(
-            side="left", padx=6
-        )
+        # Disabled while recording: rescanning re-initializes PortAudio
+        self.btn_refresh_audio = ttk.Button(section, text="Refresh", command=self._rescan_audio_devices)
+        self.btn_refresh_audio.grid(row=1, column=2, columnspan=2, sticky="w", padx=6, pady=4)
         
         # FFmpeg path configuration
         ttk.Label(
             section, 
             text="FFmpeg is required for audio merging. Set path below or add to system PATH."
-        ).pack(anchor="w", padx=2, pady=(4, 0))
+        ).grid(row=2, column=0, columnspan=4, sticky="w", padx=2, pady=(4, 0))
         
-        row3 = ttk.Frame(section)
-        row3.pack(fill="x", pady=4)
-        ttk.Label(row3, text="FFmpeg path:").pack(side="left")
+        ttk.Label(section, text="FFmpeg path:").grid(row=3, column=0, sticky="w", pady=4)
         
-        ttk.Entry(row3, textvariable=self.var_ffmpeg_path, width=40).pack(
-            side="left", padx=6, fill="x", expand=True
+        ttk.Entry(section, textvariable=self.var_ffmpeg_path, width=40).grid(
+            row=3, column=1, sticky="ew", padx=6, pady=4
         )
         
-        ttk.Button(row3, text="Browse…", command=self._browse_ffmpeg).pack(
-            side="left", padx=2
+        ttk.Button(section, text="Browse…", command=self._browse_ffmpeg).grid(
+            row=3, column=2, padx=2, pady=4
+        )
+        ttk.Button(section, text="Test", command=self._test_ffmpeg).grid(
+            row=3, column=3, pady=4
         )
-        ttk.Button(row3, text="Test", command=self._test_ffmpeg).pack(side="left")
 
     def _build_webcam_section(self, parent: ttk.Widget) -> None:
         """Build webcam picture-in-picture configuration section."""
@@ -314,7 +359,7 @@ class RecorderApp(ttk.Frame):
         ttk.Label(row1, text="Camera:").pack(side="left", padx=(10, 2))
         ttk.Entry(row1, textvariable=self.var_webcam_index, width=6).pack(side="left")
         
-        ttk.Button(row1, text="Detect", command=self._refresh_cameras).pack(
+        ttk.Button(row1, text="Detect", command=self._rescan_cameras).pack(
             side="left", padx=6
         )
         
@@ -327,7 +372,7 @@ class RecorderApp(ttk.Frame):
             row2, 
             textvariable=self.var_pip_position, 
             state="readonly",
-            values=["top-left", "top-right", "bottom-left", "bottom-right"]
+            values=PIP_POSITIONS
         ).pack(side="left", padx=6)
         
         ttk.Label(row2, text="Size %:").pack(side="left", padx=(10, 2))
@@ -347,7 +392,7 @@ class RecorderApp(ttk.Frame):
             row1, 
             textvariable=self.var_video_quality, 
             state="readonly",
-            values=["low", "medium", "high", "ultra"],
+            values=VIDEO_QUALITIES,
             width=8
         )
         quality_combo.pack(side="left", padx=6)
@@ -405,12 +450,18 @@ class RecorderApp(ttk.Frame):
 
     def _update_button_states(self) -> None:
         """Update start/stop button states based on recording status."""
+        if self.recording == self._shown_recording:
+            return
+        self._shown_recording = self.recording
+        
         if self.recording:
             self.btn_start.state(["disabled"])
             self.btn_stop.state(["!disabled"])
+            self.btn_refresh_audio.state(["disabled"])
         else:
             self.btn_start.state(["!disabled"])
             self.btn_stop.state(["disabled"])
+            self.btn_refresh_audio.state(["!disabled"])
 
     def _pick_mouse_color(self) -> None:
         """Open color picker for mouse highlight color."""
@@ -421,82 +472,167 @@ class RecorderApp(ttk.Frame):
 
     def _browse_output(self) -> None:
         """Browse for output file location."""
-        default_name = dt.datetime.now().strftime("recording_%Y%m%d_%H%M%S.mp4")
+        default_name = default_output_name()
         path = filedialog.asksaveasfilename(
+            parent=self.master,
+            initialdir=self._last_output_dir,
             defaultextension=".mp4",
             filetypes=[("MP4 files", "*.mp4"), ("All files", "*.*")],
             initialfile=default_name,
             title="Choose output file"
         )
         if path:
+            self._last_output_dir = os.path.dirname(path)
             self.var_output.set(path)
 
     def _browse_ffmpeg(self) -> None:
         """Browse for FFmpeg executable."""
-        initial_dir = self.var_ffmpeg_path.get() or os.environ.get('ProgramFiles', 'C:/')
+        initial_dir = (self._last_ffmpeg_dir or self.var_ffmpeg_path.get()
+                       or os.environ.get('ProgramFiles', 'C:/'))
         
         if os.name == 'nt':
             path = filedialog.askopenfilename(
+                parent=self.master,
                 title="Select ffmpeg.exe",
                 initialdir=initial_dir,
                 filetypes=[("FFmpeg executable", "ffmpeg.exe"), ("All files", "*.*")]
             )
         else:
             path = filedialog.askopenfilename(
+                parent=self.master,
                 title="Select ffmpeg binary", 
                 initialdir=initial_dir
             )
             
         if path:
+            self._last_ffmpeg_dir = os.path.dirname(path)
             self.var_ffmpeg_path.set(path)
             # Test the selected FFmpeg
-            success, message = test_ffmpeg(path)
+            success, message = cached_test_ffmpeg(path)
             if success:
                 self._set_status(f"FFmpeg selected: {os.path.basename(path)}")
             else:
                 self._set_status(f"Warning: FFmpeg test failed - {message}")
 
+    def _start_startup_probe(self) -> None:
+        """Run the slow device and FFmpeg lookups on a worker thread."""
+        # Tk variables are read here; the worker must not touch Tk
+        probe = threading.Thread(
+            target=self._startup_probe_worker,
+            args=(self.var_system_audio.get(), self.var_ffmpeg_path.get()),
+            daemon=True
+        )
+        probe.start()
+        self.master.after(self.WORKER_POLL_MS, self._poll_startup_probe, probe)
+
+    @staticmethod
+    def _startup_probe_worker(loopback_mode: bool, ffmpeg_hint: str) -> None:
+        """
+        Fill the audio device, camera and FFmpeg caches.
+        
+        Args:
+            loopback_mode: Audio device list to enumerate
+            ffmpeg_hint: FFmpeg path from the settings field
+        """
+        _audio_backend().get_audio_devices(loopback=loopback_mode)
+        _video_backend().probe_cameras()
+        cached_ffmpeg_path(ffmpeg_hint)
+
+    def _poll_startup_probe(self, probe: threading.Thread) -> None:
+        """Populate the device lists once the startup probe has finished."""
+        if probe.is_alive():
+            self.master.after(self.WORKER_POLL_MS, self._poll_startup_probe, probe)
+            return
+        # These now read the caches the worker filled
+        self._refresh_audio_devices()
+        self._refresh_cameras()
+        self._check_ffmpeg_startup()
+
     def _refresh_audio_devices(self) -> None:
         """Refresh the list of available audio devices."""
         loopback_mode = self.var_system_audio.get()
-        self._audio_devices = get_audio_devices(loopback=loopback_mode)
-        
-        if hasattr(self, 'cmb_audio'):
-            device_labels = [label for label, _ in self._audio_devices]
-            self.cmb_audio['values'] = device_labels
-            
-            current_selection = self.var_audio_device.get()
-            if current_selection not in device_labels:
-                self.var_audio_device.set(device_labels[0])
+        devices = _audio_backend().get_audio_devices(loopback=loopback_mode)
+        self._audio_id_by_label = dict(devices)
+        
+        # The combobox already shows _audio_labels; only push a changed list
+        labels = tuple(self._audio_id_by_label)
+        if labels != self._audio_labels:
+            self._audio_labels = labels
+            self.cmb_audio['values'] = labels
+        if self.var_audio_device.get() not in self._audio_id_by_label:
+            self.var_audio_device.set(self._audio_labels[0])
+
+    def _rescan_audio_devices(self) -> None:
+        """Re-enumerate audio devices, picking up newly connected hardware."""
+        _audio_backend().invalidate_audio_devices()
+        self._refresh_audio_devices()
+
+    def _rescan_cameras(self) -> None:
+        """Probe cameras again on a worker thread, picking up newly connected devices."""
+        self._set_status("Probing cameras...")
+        self._run_in_background(lambda: _video_backend().probe_cameras(force=True),
+                                self._show_cameras)
 
     def _refresh_cameras(self) -> None:
-        """Detect available cameras."""
-        cameras = probe_cameras()
+        """Show the cameras found by the last probe (the startup probe fills the cache)."""
+        self._show_cameras(_video_backend().probe_cameras())
+
+    def _show_cameras(self, cameras: Optional[list[int]]) -> None:
+        """
+        Select the first detected camera and report what was found.
+        
+        Args:
+            cameras: Available camera indices (None if probing failed)
+        """
         if cameras:
             self.var_webcam_index.set(cameras[0])
             self._set_status(f"Cameras detected: {cameras}")
         else:
             self._set_status("No cameras detected")
 
+    def _run_in_background(self, work: Callable[[], Any], on_done: Callable[[Any], None]) -> None:
+        """
+        Run a slow call on a worker thread and hand its result back to the Tk thread.
+        
+        Args:
+            work: Call to run; it must not touch Tk
+            on_done: Called on the Tk thread with the result (None if work raised)
+        """
+        result = []
+        worker = threading.Thread(target=lambda: result.append(work()), daemon=True)
+        worker.start()
+        self.master.after(self.WORKER_POLL_MS, self._poll_background, worker, result, on_done)
+
+    def _poll_background(self, worker: threading.Thread, result: list,
+                         on_done: Callable[[Any], None]) -> None:
+        """Deliver a background call's result once its thread has finished."""
+        if worker.is_alive():
+            self.master.after(self.WORKER_POLL_MS, self._poll_background, worker, result, on_done)
+            return
+        on_done(result[0] if result else None)
+
     def _get_selected_audio_device_id(self) -> Optional[int]:
         """Get the device ID for the currently selected audio device."""
-        selected_label = self.var_audio_device.get()
-        for label, device_id in self._audio_devices:
-            if label == selected_label:
-                return device_id
-        return None
+        return self._audio_id_by_label.get(self.var_audio_device.get())
 
     def _make_output_path(self) -> str:
         """Generate output file path with default if not specified."""
         path = self.var_output.get().strip()
         if not path:
-            default_name = dt.datetime.now().strftime("recording_%Y%m%d_%H%M%S.mp4")
+            default_name = default_output_name()
             path = os.path.join(os.getcwd(), default_name)
             
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Ensure output directory exists (bare filenames have no directory part)
+        parent = os.path.dirname(path)
+        if parent and not os.path.isdir(parent):
+            os.makedirs(parent, exist_ok=True)
         return path
 
+    @staticmethod
+    def _is_digits(text: str) -> bool:
+        """Entry validator: accept only digits (empty is allowed while editing)."""
+        return text == "" or text.isdigit()
+
     def _parse_fps(self) -> int:
         """Parse and validate FPS setting."""
         try:
@@ -513,10 +649,10 @@ class RecorderApp(ttk.Frame):
             return None
             
         try:
-            left = int(self.var_region_left.get())
-            top = int(self.var_region_top.get())
-            width = int(self.var_region_width.get())
-            height = int(self.var_region_height.get())
+            left, top, width, height = self._get_ints(
+                self.var_region_left, self.var_region_top,
+                self.var_region_width, self.var_region_height
+            )
             
             if left < 0 or top < 0 or width <= 0 or height <= 0:
                 raise ValueError("Invalid region coordinates")
@@ -525,19 +661,49 @@ class RecorderApp(ttk.Frame):
         except ValueError:
             raise ValueError("Region coordinates must be valid positive integers")
 
+    @staticmethod
+    def _get_ints(*variables: tk.Variable) -> list[int]:
+        """
+        Read several whole-number settings in one pass.
+        
+        Args:
+            variables: Tk variables bound to numeric entries
+            
+        Returns:
+            Their values, in order
+            
+        Raises:
+            ValueError: If any field is empty or not a number
+        """
+        try:
+            return [int(var.get()) for var in variables]
+        except (ValueError, tk.TclError):
+            # IntVar.get() raises TclError for empty or non-numeric text
+            raise ValueError("Expected a whole number")
+
     def _create_config(self) -> RecorderConfig:
         """Create recording configuration from UI settings."""
+        try:
+            (monitor_index, mouse_radius, webcam_index,
+             pip_width_pct, segment_minutes) = self._get_ints(
+                self.var_monitor_index, self.var_mouse_radius, self.var_webcam_index,
+                self.var_pip_width_pct, self.var_segment_duration
+            )
+            mouse_alpha = float(self.var_mouse_alpha.get())
+        except (ValueError, tk.TclError):
+            raise ValueError("Monitor, mouse, webcam and segment settings must be valid numbers")
+            
         return RecorderConfig(
             fps=self._parse_fps(),
             output_path=self._make_output_path(),
-            monitor_index=int(self.var_monitor_index.get()),
+            monitor_index=monitor_index,
             region=self._validate_region(),
             show_preview=self.var_preview.get(),
             # Mouse highlight
             mouse_highlight=self.var_mouse_highlight.get(),
             mouse_color=self.var_mouse_color,
-            mouse_radius=int(self.var_mouse_radius.get()),
-            mouse_alpha=float(self.var_mouse_alpha.get()),
+            mouse_radius=mouse_radius,
+            mouse_alpha=mouse_alpha,
             # Audio
             record_audio=self.var_record_audio.get(),
             audio_device=self._get_selected_audio_device_id(),
@@ -545,23 +711,47 @@ class RecorderApp(ttk.Frame):
             save_audio_separately=self.var_save_audio_separately.get(),
             # Webcam
             use_webcam=self.var_use_webcam.get(),
-            webcam_index=int(self.var_webcam_index.get()),
+            webcam_index=webcam_index,
             pip_position=self.var_pip_position.get(),
-            pip_width_pct=int(self.var_pip_width_pct.get()),
+            pip_width_pct=pip_width_pct,
             # Quality and performance
             video_quality=self.var_video_quality.get(),
             hardware_acceleration=self.var_hardware_acceleration.get(),
             use_segments=self.var_use_segments.get(),
-            segment_duration_minutes=int(self.var_segment_duration.get()),
+            segment_duration_minutes=segment_minutes,
             # FFmpeg
             ffmpeg_path=self.var_ffmpeg_path.get().strip() or None,
         )
 
     def _set_status(self, message: str) -> None:
-        """Update status message and refresh UI."""
-        self.var_status.set(message)
+        """
+        Update status message.
+        The recorder calls this from its worker threads, which must not touch
+        Tk: their messages are stored and picked up by _poll_status, so a burst
+        of updates costs a single redraw. Redraws are left to the event loop;
+        use _show_status_now before blocking the Tk thread.
+        """
+        self._pending_status = message
+        if threading.current_thread() is threading.main_thread():
+            self._flush_status()
+
+    def _show_status_now(self, message: str) -> None:
+        """Show a status message immediately, ahead of a blocking call on the Tk thread."""
+        self._set_status(message)
         self.master.update_idletasks()
 
+    def _flush_status(self) -> None:
+        """Show the latest status message if it changed."""
+        message = self._pending_status
+        if message is not self._shown_status:
+            self._shown_status = message
+            self.var_status.set(message)
+
+    def _poll_status(self) -> None:
+        """Show status messages posted from recorder threads."""
+        self._flush_status()
+        self.master.after(self.STATUS_POLL_MS, self._poll_status)
+
     def _start_recording(self) -> None:
         """Start screen recording with current configuration."""
         if self.recording:
@@ -569,7 +759,7 @@ class RecorderApp(ttk.Frame):
             
         try:
             # Validate audio dependencies
-            if self.var_record_audio.get() and not is_audio_available():
+            if self.var_record_audio.get() and not _audio_backend().is_audio_available():
                 response = messagebox.askyesno(
                     "Audio Dependencies Missing",
                     "Audio recording requires sounddevice and soundfile packages.\n"
@@ -583,7 +773,7 @@ class RecorderApp(ttk.Frame):
             config = self._create_config()
             
             # Create and start recorder
-            self.recorder = ScreenRecorder(config, status_callback=self._set_status)
+            self.recorder = _video_backend().ScreenRecorder(config, status_callback=self._set_status)
             self.recorder.start()
             
             # Update UI state
@@ -595,31 +785,69 @@ class RecorderApp(ttk.Frame):
             self._set_status(f"Error: {ex}")
 
     def _stop_recording(self) -> None:
-        """Stop current recording."""
-        if not self.recording or not self.recorder:
+        """
+        Stop current recording.
+        The recorder finalizes on its own thread (writer release, mux); the
+        outcome is reported once it has finished, without blocking the UI.
+        """
+        if not self.recording or not self.recorder or self._stopping:
             return
-            
-        try:
-            self._set_status("Stopping recording...")
-            self.recorder.stop()
-            
-            # Check for errors
-            last_error = self.recorder.get_last_error()
-            if last_error:
-                self._set_status(f"Recording completed with warnings: {last_error}")
-            else:
-                self._set_status(f"Recording saved: {self.recorder.cfg.output_path}")
-                
-        except Exception as ex:
-            messagebox.showerror("Stop Error", str(ex))
-            self._set_status(f"Stop error: {ex}")
-        finally:
-            self.recording = False
-            self._update_button_states()
+        self._stopping = True
+        self._show_status_now("Stopping recording...")
+        self.btn_stop.state(["disabled"])
+        stop_recording_async(self.master, self.recorder, self.STATUS_POLL_MS, self._on_recording_stopped)
+
+    def _on_recording_stopped(self, finished: bool) -> None:
+        """
+        Report how the recording ended.
+        
+        Args:
+            finished: True if the recorder finished saving
+        """
+        self._stopping = False
+        self.recording = False
+        self._update_button_states()
+        
+        last_error = self.recorder.get_last_error() if self.recorder else None
+        if not finished:
+            self._set_status("Stop error: recording did not finish saving")
+        elif last_error:
+            self._set_status(f"Recording completed with warnings: {last_error}")
+        else:
+            self._set_status(f"Recording saved: {self.recorder.cfg.output_path}")
 
     def _test_ffmpeg(self) -> None:
-        """Test FFmpeg functionality and show results."""
-        ffmpeg_path, source = find_ffmpeg_path(self.var_ffmpeg_path.get())
+        """Test FFmpeg on a worker thread and show the results."""
+        self._set_status("Testing FFmpeg...")
+        ffmpeg_hint = self.var_ffmpeg_path.get()
+        self._run_in_background(lambda: self._ffmpeg_test_worker(ffmpeg_hint),
+                                self._show_ffmpeg_test)
+
+    @staticmethod
+    def _ffmpeg_test_worker(ffmpeg_hint: str) -> tuple[Optional[str], str, bool, str]:
+        """
+        Locate FFmpeg and run a version check.
+        
+        Args:
+            ffmpeg_hint: FFmpeg path from the settings field
+            
+        Returns:
+            Tuple of (FFmpeg path or None, source, success, message)
+        """
+        ffmpeg_path, source = cached_ffmpeg_path(ffmpeg_hint)
+        if not ffmpeg_path:
+            return None, source, False, "FFmpeg not found"
+        success, message = cached_test_ffmpeg(ffmpeg_path)
+        return ffmpeg_path, source, success, message
+
+    def _show_ffmpeg_test(self, outcome: Optional[tuple[Optional[str], str, bool, str]]) -> None:
+        """
+        Report an FFmpeg test result.
+        
+        Args:
+            outcome: Result of _ffmpeg_test_worker (None if it raised)
+        """
+        ffmpeg_path, source, success, message = outcome or (None, "", False, "")
         
         if not ffmpeg_path:
             messagebox.showerror(
@@ -631,8 +859,6 @@ class RecorderApp(ttk.Frame):
             self._set_status("FFmpeg not found")
             return
             
-        success, message = test_ffmpeg(ffmpeg_path)
-        
         if success:
             messagebox.showinfo(
                 "FFmpeg Test Successful",
@@ -652,7 +878,7 @@ class RecorderApp(ttk.Frame):
 
     def _check_ffmpeg_startup(self) -> None:
         """Check FFmpeg availability on startup."""
-        ffmpeg_path, source = find_ffmpeg_path(self.var_ffmpeg_path.get())
+        ffmpeg_path, source = cached_ffmpeg_path(self.var_ffmpeg_path.get())
         
         if ffmpeg_path:
             self._set_status(f"Ready. FFmpeg found: {source}")
@@ -660,13 +886,15 @@ class RecorderApp(ttk.Frame):
             self._set_status("Ready. Note: FFmpeg not found - audio merging disabled")
 
     def _on_close(self) -> None:
-        """Handle application close event."""
-        try:
-            if self.recorder and self.recording:
-                self.recorder.stop()
-        except Exception:
-            pass
-        self.master.destroy()
+        """
+        Handle application close event.
+        A running recording is finalized on a worker thread while the window
+        is hidden, so closing does not freeze the UI during muxing.
+        """
+        if not (self.recorder and self.recording):
+            self.master.destroy()
+            return
+        close_after_recording(self.master, self.recorder, self.SHUTDOWN_TIMEOUT_S, self.STATUS_POLL_MS)
 
 
 def create_app() -> tk.Tk:
@@ -678,6 +906,9 @@ def create_app() -> tk.Tk:
     """
     root = tk.Tk()
     
+    # Keep the window unmapped while widgets are packed so it is laid out once
+    root.withdraw()
+    
     # Configure theme
     try:
         style = ttk.Style(root)
@@ -692,4 +923,7 @@ def create_app() -> tk.Tk:
     # Configure window
     root.minsize(600, 700)
     
+    root.update_idletasks()
+    root.deiconify()
+    
     return root
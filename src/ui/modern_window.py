@@ -4,26 +4,117 @@ Modern tabbed interface with attractive colors and professional design.
 """
 
 import os
+import platform
 import sys
-import datetime as dt
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, colorchooser
+import tkinter.font as tkfont
+
+# Optional dependencies
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 # Handle imports for both direct execution and module imports
 try:
-    from ..core.config import RecorderConfig
-    from ..core.video import ScreenRecorder, probe_cameras
-    from ..core.audio import get_audio_devices, is_audio_available
-    from ..utils.helpers import find_ffmpeg_path, test_ffmpeg
+    from ..core.config import RecorderConfig, PIP_POSITIONS, VIDEO_QUALITIES
+    from ..utils.helpers import default_output_name, cached_ffmpeg_path, cached_test_ffmpeg
+    from .shutdown import close_after_recording, stop_recording_async
 except ImportError:
     # Absolute imports fallback
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from core.config import RecorderConfig
-    from core.video import ScreenRecorder, probe_cameras
-    from core.audio import get_audio_devices, is_audio_available
-    from utils.helpers import find_ffmpeg_path, test_ffmpeg
+    from core.config import RecorderConfig, PIP_POSITIONS, VIDEO_QUALITIES
+    from utils.helpers import default_output_name, cached_ffmpeg_path, cached_test_ffmpeg
+    from ui.shutdown import close_after_recording, stop_recording_async
+
+if TYPE_CHECKING:
+    from core.video import ScreenRecorder
+
+
+# Palette used when the themes module is unavailable
+_FALLBACK_COLORS = {
+    'bg_primary': '#1B2B3A',      # Calm dark blue
+    'bg_secondary': '#223546',
+    'bg_tertiary': '#2C3E50',
+    'accent_blue': '#3498DB',
+    'accent_purple': '#9B59B6',
+    'accent_green': '#27AE60',
+    'accent_orange': '#F39C12',
+    'accent_red': '#E74C3C',
+    'text_primary': '#ECF0F1',
+    'text_secondary': '#BDC3C7',
+    'border': '#34495E',
+}
+
+# Colour options of classic tk widgets that take palette colours
+_PALETTE_OPTIONS = ('bg', 'fg', 'insertbackground')
+
+# Radiobutton (label, value) pairs for the video quality setting
+_QUALITY_OPTIONS = tuple((quality.capitalize(), quality) for quality in VIDEO_QUALITIES)
+
+# Region coordinate field labels, in var_region_* order
+_REGION_COORD_LABELS = ("Left", "Top", "Width", "Height")
+
+
+@lru_cache(maxsize=1)
+def _documents_folder() -> str:
+    """Return the user's Documents folder, falling back to home (resolved once)."""
+    # Try HOME/Documents
+    docs = os.path.join(os.path.expanduser("~"), "Documents")
+    if os.path.isdir(docs):
+        return docs
+    # Fallback to home
+    return os.path.expanduser("~")
+
+
+@lru_cache(maxsize=1)
+def _system_info() -> tuple[tuple[str, str], ...]:
+    """
+    Describe the machine for the System tab (queried once per process).
+    
+    Returns:
+        (label, value) rows
+    """
+    ram = f"{psutil.virtual_memory().total // (1024**3)} GB" if psutil else "Unknown"
+    return (
+        ("💻 Operating System:", f"{platform.system()} {platform.release()}"),
+        ("🔧 CPU Cores:", f"{os.cpu_count() or '?'} cores"),
+        ("💾 RAM:", ram),
+    )
+
+
+def _video_backend():
+    """
+    Import the video module on first use; it pulls in OpenCV, NumPy and mss,
+    which the window does not need to appear.
+    
+    Returns:
+        The core.video module
+    """
+    try:
+        from ..core import video
+    except ImportError:
+        from core import video
+    return video
+
+
+def _audio_backend():
+    """
+    Import the audio module on first use (NumPy, sounddevice, soundfile).
+    
+    Returns:
+        The core.audio module
+    """
+    try:
+        from ..core import audio
+    except ImportError:
+        from core import audio
+    return audio
 
 
 class ModernRecorderApp(ttk.Frame):
@@ -32,17 +123,36 @@ class ModernRecorderApp(ttk.Frame):
     Features tabbed interface, attractive colors, and comprehensive controls.
     """
     
+    STATUS_POLL_MS = 100  # How often recorder status messages reach the UI
+    SHUTDOWN_TIMEOUT_S = 60  # Longest wait for a recording to finalize on close
+    WORKER_POLL_MS = 50  # How often device/FFmpeg worker threads are checked
+    PERF_POLL_MS = 2000  # How often the System tab CPU/memory readout refreshes
+    PERF_HIDDEN_POLL_MS = 10000  # Slower check while the readout is not on screen
+    
     def __init__(self, master: tk.Tk):
         """Initialize the modern recorder application."""
         super().__init__(master)
         self.master = master
         
+        # Shared fonts, keyed by (size, weight)
+        self._fonts: dict[tuple[int, str], tkfont.Font] = {}
+        
         # Configure modern styling
         self._setup_modern_style()
         
         # Application state
         self.recording = False
-        self.recorder: Optional[ScreenRecorder] = None
+        self._stopping = False  # Stop requested, recorder still finalizing
+        self.recorder: Optional["ScreenRecorder"] = None
+        self._shown_recording: Optional[bool] = None  # State the buttons last showed
+        
+        # Folders last picked in file dialogs, reused as their starting point
+        self._last_output_dir: Optional[str] = None
+        self._last_ffmpeg_dir: Optional[str] = None
+        
+        # Latest status text; recorder threads only store it, the Tk thread shows it
+        self._pending_status: Optional[str] = None
+        self._shown_status: Optional[str] = None
         
         # Initialize UI variables
         self._init_variables()
@@ -53,13 +163,33 @@ class ModernRecorderApp(ttk.Frame):
         
         # Setup event handlers
         self.master.protocol("WM_DELETE_WINDOW", self._on_close)
-        
-        # Initialize device lists
-        self._refresh_audio_devices()
-        self._refresh_cameras()
-        
-        # Check FFmpeg availability
-        self._check_ffmpeg_startup()
+        self.master.after(self.STATUS_POLL_MS, self._poll_status)
+        
+        # Enumerate devices and look for FFmpeg off the Tk thread so the window
+        # appears immediately
+        self._set_status("🔍 Detecting devices...")
+        self._start_startup_probe()
+
+    def _font(self, size: int, weight: str = "normal") -> tkfont.Font:
+        """
+        Get the shared UI font for a size and weight, creating it on first use.
+        Widgets then reference one named Tk font instead of each parsing a
+        font description.
+        
+        Args:
+            size: Point size
+            weight: "normal" or "bold"
+            
+        Returns:
+            Named Tk font
+        """
+        key = (size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = tkfont.Font(
+                root=self.master, family="Segoe UI", size=size, weight=weight
+            )
+        return font
 
     def _setup_modern_style(self) -> None:
         """Setup modern AI-style theme and colors."""
@@ -80,19 +210,7 @@ class ModernRecorderApp(ttk.Frame):
             self.available_themes = get_available_themes()
         except ImportError:
             # Fallback to a calm dark palette
-            self.colors = {
-                'bg_primary': '#1B2B3A',      # Calm dark blue
-                'bg_secondary': '#223546',
-                'bg_tertiary': '#2C3E50',
-                'accent_blue': '#3498DB',
-                'accent_purple': '#9B59B6',
-                'accent_green': '#27AE60',
-                'accent_orange': '#F39C12',
-                'accent_red': '#E74C3C',
-                'text_primary': '#ECF0F1',
-                'text_secondary': '#BDC3C7',
-                'border': '#34495E',
-            }
+            self.colors = dict(_FALLBACK_COLORS)
         
         # Apply background based on theme
         self.master.configure(bg=self.colors['bg_primary'])
@@ -100,98 +218,117 @@ class ModernRecorderApp(ttk.Frame):
         # Configure ttk styles
         style.theme_use('clam')
         
-        # Configure Notebook (tabs)
-        style.configure('Modern.TNotebook', 
-                       background=self.colors['bg_primary'],
-                       borderwidth=0,
-                       tabmargins=[0, 0, 0, 0])
-        
-        style.configure('Modern.TNotebook.Tab',
-                       background=self.colors['bg_secondary'],
-                       foreground=self.colors['text_secondary'],
-                       padding=[20, 10],
-                       borderwidth=1,
-                       focuscolor='none')
-        
-        style.map('Modern.TNotebook.Tab',
-                 background=[('selected', self.colors['bg_tertiary']),
-                           ('active', self.colors['accent_blue'])],
-                 foreground=[('selected', self.colors['text_primary']),
-                           ('active', self.colors['text_primary'])])
-        
-        # Configure Frames
-        style.configure('Modern.TFrame', 
-                       background=self.colors['bg_tertiary'],
-                       relief='flat',
-                       borderwidth=1)
-        
-        style.configure('Card.TFrame',
-                       background=self.colors['bg_tertiary'],
-                       relief='solid',
-                       borderwidth=1)
-        
-        # Configure Labels
-        style.configure('Modern.TLabel',
-                       background=self.colors['bg_tertiary'],
-                       foreground=self.colors['text_primary'],
-                       font=('Segoe UI', 10))
-        
-        style.configure('Title.TLabel',
-                       background=self.colors['bg_tertiary'],
-                       foreground=self.colors['accent_blue'],
-                       font=('Segoe UI', 12, 'bold'))
-        
-        style.configure('Subtitle.TLabel',
-                       background=self.colors['bg_tertiary'],
-                       foreground=self.colors['text_secondary'],
-                       font=('Segoe UI', 9))
-        
-        # Configure Buttons
-        style.configure('Primary.TButton',
-                       background=self.colors['accent_blue'],
-                       foreground='white',
-                       font=('Segoe UI', 10, 'bold'),
-                       borderwidth=0,
-                       focuscolor='none')
-        
-        style.map('Primary.TButton',
-                 background=[('active', '#4493E1'),
-                           ('pressed', '#3D7FC4')])
-        
-        style.configure('Success.TButton',
-                       background=self.colors['accent_green'],
-                       foreground='white',
-                       font=('Segoe UI', 10, 'bold'),
-                       borderwidth=0,
-                       focuscolor='none')
-        
-        style.map('Success.TButton',
-                 background=[('active', '#46C759'),
-                           ('pressed', '#3DB84C')])
-        
-        style.configure('Danger.TButton',
-                       background=self.colors['accent_red'],
-                       foreground='white',
-                       font=('Segoe UI', 10, 'bold'),
-                       borderwidth=0,
-                       focuscolor='none')
-        
-        style.map('Danger.TButton',
-                 background=[('active', '#E55A5A'),
-                           ('pressed', '#CC5151')])
-        
-        # Configure Entry
-        style.configure('Modern.TEntry',
-                       fieldbackground=self.colors['bg_secondary'],
-                       foreground=self.colors['text_primary'],
-                       borderwidth=1,
-                       insertcolor=self.colors['text_primary'])
-        
-        # Configure Combobox
-        style.configure('Modern.TCombobox',
-                       fieldbackground=self.colors['bg_secondary'],
-                       foreground=self.colors['text_primary'],
-                       borderwidth=1)
+        # App frame carries the outer padding and primary background
+        self.configure(style='App.TFrame')
+        
+        self._apply_styles(style)
+
+    def _apply_styles(self, style: ttk.Style) -> None:
+        """Configure every ttk style from the current palette."""
+        configures, maps = self._style_specs()
+        configure = style.configure
+        for name, options in configures:
+            configure(name, **options)
+        style_map = style.map
+        for name, options in maps:
+            style_map(name, **options)
+
+    def _style_specs(self) -> tuple[list[tuple[str, dict]], list[tuple[str, dict]]]:
+        """
+        Build the ttk style table for the current palette.
+        
+        Returns:
+            Tuple of ((style, configure options), (style, map options)) lists
+        """
+        c = self.colors
+        card_bg = c['bg_secondary']
+        
+        # Card body toggles share everything except the font
+        toggle = dict(background=card_bg,
+                      foreground=c['text_primary'],
+                      indicatorbackground=c['bg_primary'],
+                      focuscolor=card_bg)
+        
+        def action_button(color: str) -> dict:
+            return dict(background=color, foreground='white',
+                        font=self._font(10, 'bold'), borderwidth=0, focuscolor='none')
+        
+        configures = [
+            # Notebook (tabs)
+            ('Modern.TNotebook', dict(background=c['bg_primary'],
+                                      borderwidth=0,
+                                      tabmargins=[0, 0, 0, 0])),
+            ('Modern.TNotebook.Tab', dict(background=c['bg_secondary'],
+                                          foreground=c['text_secondary'],
+                                          padding=[20, 10],
+                                          borderwidth=1,
+                                          focuscolor='none')),
+            
+            # Frames
+            ('App.TFrame', dict(background=c['bg_primary'], padding=10)),
+            ('Modern.TFrame', dict(background=c['bg_tertiary'], relief='flat', borderwidth=1)),
+            ('Card.TFrame', dict(background=c['bg_tertiary'], relief='solid', borderwidth=1)),
+            
+            # Labels
+            ('Modern.TLabel', dict(background=c['bg_tertiary'],
+                                   foreground=c['text_primary'],
+                                   font=self._font(10))),
+            ('Title.TLabel', dict(background=c['bg_tertiary'],
+                                  foreground=c['accent_blue'],
+                                  font=self._font(12, 'bold'))),
+            ('Subtitle.TLabel', dict(background=c['bg_tertiary'],
+                                     foreground=c['text_secondary'],
+                                     font=self._font(9))),
+            
+            # Card body widgets (labels and toggles inside the settings cards)
+            ('CardBody.TLabel', dict(background=card_bg,
+                                     foreground=c['text_primary'],
+                                     font=self._font(10))),
+            ('CardSmall.TLabel', dict(background=card_bg,
+                                      foreground=c['text_primary'],
+                                      font=self._font(9))),
+            ('CardHint.TLabel', dict(background=card_bg,
+                                     foreground=c['text_secondary'],
+                                     font=self._font(9))),
+            ('CardKey.TLabel', dict(background=card_bg,
+                                    foreground=c['text_primary'],
+                                    font=self._font(10, 'bold'))),
+            ('CardValue.TLabel', dict(background=card_bg,
+                                      foreground=c['accent_blue'],
+                                      font=self._font(10))),
+            ('CardBody.TCheckbutton', dict(toggle, font=self._font(10))),
+            ('CardHeading.TCheckbutton', dict(toggle, font=self._font(10, 'bold'))),
+            ('CardBody.TRadiobutton', dict(toggle, font=self._font(9))),
+            
+            # Buttons
+            ('Primary.TButton', action_button(c['accent_blue'])),
+            ('Success.TButton', action_button(c['accent_green'])),
+            ('Danger.TButton', action_button(c['accent_red'])),
+            
+            # Entry and Combobox
+            ('Modern.TEntry', dict(fieldbackground=c['bg_secondary'],
+                                   foreground=c['text_primary'],
+                                   borderwidth=1,
+                                   insertcolor=c['text_primary'])),
+            ('Modern.TCombobox', dict(fieldbackground=c['bg_secondary'],
+                                      foreground=c['text_primary'],
+                                      borderwidth=1)),
+        ]
+        
+        toggle_map = dict(background=[('active', card_bg)])
+        maps = [
+            ('Modern.TNotebook.Tab', dict(background=[('selected', c['bg_tertiary']),
+                                                      ('active', c['accent_blue'])],
+                                          foreground=[('selected', c['text_primary']),
+                                                      ('active', c['text_primary'])])),
+            ('CardBody.TCheckbutton', toggle_map),
+            ('CardHeading.TCheckbutton', toggle_map),
+            ('CardBody.TRadiobutton', toggle_map),
+            ('Primary.TButton', dict(background=[('active', '#4493E1'), ('pressed', '#3D7FC4')])),
+            ('Success.TButton', dict(background=[('active', '#46C759'), ('pressed', '#3DB84C')])),
+            ('Danger.TButton', dict(background=[('active', '#E55A5A'), ('pressed', '#CC5151')])),
+        ]
+        return configures, maps
 
     def _init_variables(self) -> None:
         """Initialize all Tkinter variables for UI controls."""
@@ -235,48 +372,55 @@ class ModernRecorderApp(ttk.Frame):
         self.var_show_preview = tk.BooleanVar(value=False)
 
         # Audio device list
-        self._audio_devices = [("Default", None)]
+        self._audio_id_by_label: dict[str, Optional[int]] = {"Default": None}
+        self._audio_labels: tuple[str, ...] = ("Default",)
+        
+        # Transient notification overlay and its dismiss timer
+        self._toast: Optional[tk.Label] = None
+        self._toast_job: Optional[str] = None
+        
+        # Performance monitor readout last shown: name -> (value, colour bucket)
+        self._perf_shown: dict[str, tuple[float, int]] = {}
+        
+        # Region coordinate entries, enabled only while region capture is on
+        self.region_entries: list[tk.Entry] = []
 
     def _build_modern_ui(self) -> None:
         """Build the modern tabbed interface."""
-        # Main container with gradient effect
-        main_container = tk.Frame(self, bg=self.colors['bg_primary'])
-        main_container.pack(fill="both", expand=True, padx=10, pady=10)
-        
         # Header section
-        self._build_header(main_container)
+        self._build_header(self)
         
         # Tabbed interface
-        self._build_tabbed_interface(main_container)
+        self._build_tabbed_interface(self)
         
         # Control section
-        self._build_control_section(main_container)
+        self._build_control_section(self)
         
         # Status section
-        self._build_status_section(main_container)
+        self._build_status_section(self)
 
     def _build_header(self, parent) -> None:
         """Build the modern header section."""
-        header_frame = tk.Frame(parent, bg=self.colors['bg_primary'], height=64)
+        # Height follows the labels, so the header needs a single layout pass
+        header_frame = tk.Frame(parent, bg=self.colors['bg_primary'])
         header_frame.pack(fill="x", pady=(0, 20))
-        header_frame.pack_propagate(False)
 
         # Title and icon
         title_frame = tk.Frame(header_frame, bg=self.colors['bg_primary'])
-        title_frame.pack(side="left", fill="y")
+        title_frame.pack(side="left", fill="y", pady=6)
 
         title_label = tk.Label(title_frame,
                               text="AI Screen Recorder Pro",
                               bg=self.colors['bg_primary'],
                               fg=self.colors['accent_blue'],
-                              font=('Segoe UI', 18, 'bold'))
+                              font=self._font(18, 'bold'))
         title_label.pack(anchor="w")
 
         subtitle_label = tk.Label(title_frame,
                                  text="Clean, professional recording with friendly colors",
                                  bg=self.colors['bg_primary'],
                                  fg=self.colors['text_secondary'],
-                                 font=('Segoe UI', 10))
+                                 font=self._font(10))
         subtitle_label.pack(anchor="w")
 
         # Quick stats
@@ -288,7 +432,7 @@ class ModernRecorderApp(ttk.Frame):
                                           text="Standby",
                                           bg=self.colors['bg_primary'],
                                           fg=self.colors['text_secondary'],
-                                          font=('Segoe UI', 11, 'bold'))
+                                          font=self._font(11, 'bold'))
         self.recording_indicator.pack(anchor="e", pady=(10, 0))
 
     def _build_tabbed_interface(self, parent) -> None:
@@ -303,32 +447,87 @@ class ModernRecorderApp(ttk.Frame):
         # Tab 2: Audio & Effects
         self._build_audio_effects_tab()
         
+        # Tabs 3-4 are only built when first selected; the System tab also
+        # starts the performance monitor, which need not run unseen
+        self._lazy_tabs: dict[str, Callable[[ttk.Frame], None]] = {}
+        
         # Tab 3: Advanced Settings
-        self._build_advanced_tab()
+        self._add_lazy_tab("🔧 Advanced", self._build_advanced_tab)
         
         # Tab 4: System & Performance
-        self._build_system_tab()
+        self._add_lazy_tab("🖥️ System", self._build_system_tab)
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
-    def _build_recording_tab(self) -> None:
-        """Build the main recording settings tab."""
-        tab_frame = ttk.Frame(self.notebook, style='Modern.TFrame')
-        self.notebook.add(tab_frame, text="📹 Recording")
+    def _add_tab(self, title: str) -> ttk.Frame:
+        """
+        Add an empty notebook tab.
         
-        # Create scrollable content
+        Args:
+            title: Tab label
+            
+        Returns:
+            The tab's frame
+        """
+        tab_frame = ttk.Frame(self.notebook, style='Modern.TFrame')
+        self.notebook.add(tab_frame, text=title)
+        return tab_frame
+
+    def _add_lazy_tab(self, title: str, builder: Callable[[ttk.Frame], None]) -> None:
+        """
+        Add a notebook tab whose content is built when it is first selected.
+        
+        Args:
+            title: Tab label
+            builder: Called once with the tab's frame
+        """
+        tab_frame = self._add_tab(title)
+        self._lazy_tabs[str(tab_frame)] = builder
+
+    def _on_tab_changed(self, event=None) -> None:
+        """Build a lazily created tab the first time it is shown."""
+        tab = self.notebook.select()
+        builder = self._lazy_tabs.pop(tab, None)
+        if builder is not None:
+            builder(self.notebook.nametowidget(tab))
+
+    def _make_scrollable_tab(self, tab_frame: ttk.Frame) -> ttk.Frame:
+        """
+        Fill a notebook tab with vertically scrolling content.
+        
+        Args:
+            tab_frame: Tab to fill
+            
+        Returns:
+            Frame to build the tab's cards into
+        """
         canvas = tk.Canvas(tab_frame, bg=self.colors['bg_tertiary'], highlightthickness=0)
         scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas, style='Modern.TFrame')
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Resizes during a build burst collapse into one scrollregion update
+        pending_update = []
+        
+        def update_scrollregion() -> None:
+            pending_update.clear()
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def schedule_scrollregion(event=None) -> None:
+            if not pending_update:
+                pending_update.append(canvas.after_idle(update_scrollregion))
+        
+        scrollable_frame.bind("<Configure>", schedule_scrollregion)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        return scrollable_frame
+
+    def _build_recording_tab(self) -> None:
+        """Build the main recording settings tab."""
+        scrollable_frame = self._make_scrollable_tab(self._add_tab("📹 Recording"))
         
         # Output Settings Card
         self._build_card(scrollable_frame, "📁 Output Settings", self._build_output_controls)
@@ -341,24 +540,7 @@ class ModernRecorderApp(ttk.Frame):
 
     def _build_audio_effects_tab(self) -> None:
         """Build the audio and effects tab."""
-        tab_frame = ttk.Frame(self.notebook, style='Modern.TFrame')
-        self.notebook.add(tab_frame, text="🎵 Audio & Effects")
-        
-        # Create scrollable content
-        canvas = tk.Canvas(tab_frame, bg=self.colors['bg_tertiary'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style='Modern.TFrame')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        scrollable_frame = self._make_scrollable_tab(self._add_tab("🎵 Audio & Effects"))
         
         # Audio Settings Card
         self._build_card(scrollable_frame, "🎤 Audio Recording", self._build_audio_controls)
@@ -369,26 +551,9 @@ class ModernRecorderApp(ttk.Frame):
         # Webcam Card
         self._build_card(scrollable_frame, "📷 Webcam Overlay", self._build_webcam_controls)
 
-    def _build_advanced_tab(self) -> None:
+    def _build_advanced_tab(self, tab_frame: ttk.Frame) -> None:
         """Build the advanced settings tab."""
-        tab_frame = ttk.Frame(self.notebook, style='Modern.TFrame')
-        self.notebook.add(tab_frame, text="🔧 Advanced")
-        
-        # Create scrollable content
-        canvas = tk.Canvas(tab_frame, bg=self.colors['bg_tertiary'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style='Modern.TFrame')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        scrollable_frame = self._make_scrollable_tab(tab_frame)
         
         # Advanced Recording Card
         self._build_card(scrollable_frame, "⚙️ Advanced Recording", self._build_advanced_controls)
@@ -396,26 +561,9 @@ class ModernRecorderApp(ttk.Frame):
         # FFmpeg Configuration Card
         self._build_card(scrollable_frame, "🛠️ FFmpeg Configuration", self._build_ffmpeg_controls)
 
-    def _build_system_tab(self) -> None:
+    def _build_system_tab(self, tab_frame: ttk.Frame) -> None:
         """Build the system and performance tab."""
-        tab_frame = ttk.Frame(self.notebook, style='Modern.TFrame')
-        self.notebook.add(tab_frame, text="🖥️ System")
-        
-        # Create scrollable content
-        canvas = tk.Canvas(tab_frame, bg=self.colors['bg_tertiary'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style='Modern.TFrame')
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        scrollable_frame = self._make_scrollable_tab(tab_frame)
         
         # Theme Selection Card
         self._build_card(scrollable_frame, "🎨 Theme Selection", self._build_theme_selector)
@@ -433,15 +581,14 @@ class ModernRecorderApp(ttk.Frame):
         card_frame.pack(fill="x", padx=10, pady=10)
         
         # Card header
-        header_frame = tk.Frame(card_frame, bg=self.colors['accent_blue'], height=40)
+        header_frame = tk.Frame(card_frame, bg=self.colors['accent_blue'])
         header_frame.pack(fill="x")
-        header_frame.pack_propagate(False)
         
         title_label = tk.Label(header_frame,
                               text=title,
                               bg=self.colors['accent_blue'],
                               fg='white',
-                              font=('Segoe UI', 12, 'bold'))
+                              font=self._font(12, 'bold'))
         title_label.pack(side="left", padx=15, pady=10)
         
         # Card content
@@ -457,19 +604,17 @@ class ModernRecorderApp(ttk.Frame):
         path_row = tk.Frame(parent, bg=self.colors['bg_secondary'])
         path_row.pack(fill="x", pady=(0, 10))
 
-        tk.Label(path_row, text="📁 Output File:",
-                 bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                 font=('Segoe UI', 10)).pack(side="left")
+        ttk.Label(path_row, text="📁 Output File:", style='CardBody.TLabel').pack(side="left")
 
         self.output_entry = tk.Entry(path_row, textvariable=self.var_output,
                                      bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                                      insertbackground=self.colors['text_primary'],
-                                     font=('Segoe UI', 10), relief='flat', borderwidth=5)
+                                     font=self._font(10), relief='flat', borderwidth=5)
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(10, 5))
 
         browse_btn = tk.Button(path_row, text="Browse", command=self._browse_output,
                                 bg=self.colors['accent_purple'], fg='white',
-                                font=('Segoe UI', 9, 'bold'), relief='flat', borderwidth=0,
+                                font=self._font(9, 'bold'), relief='flat', borderwidth=0,
                                 padx=15, cursor='hand2')
         browse_btn.pack(side="right")
 
@@ -477,19 +622,17 @@ class ModernRecorderApp(ttk.Frame):
         fps_row = tk.Frame(parent, bg=self.colors['bg_secondary'])
         fps_row.pack(fill="x")
 
-        tk.Label(fps_row, text="🎬 Frame Rate (FPS):",
-                 bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                 font=('Segoe UI', 10)).pack(side="left")
+        ttk.Label(fps_row, text="🎬 Frame Rate (FPS):", style='CardBody.TLabel').pack(side="left")
 
         fps_entry = tk.Entry(fps_row, textvariable=self.var_fps, width=10,
+                             validate="key", validatecommand=(self.register(self._is_digits), "%P"),
                              bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                              insertbackground=self.colors['text_primary'],
-                             font=('Segoe UI', 10), relief='flat', borderwidth=5)
+                             font=self._font(10), relief='flat', borderwidth=5)
         fps_entry.pack(side="left", padx=(10, 0))
 
-        tk.Label(fps_row, text="(Recommended: 30 for quality, 15-20 for long sessions)",
-                 bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                 font=('Segoe UI', 9)).pack(side="left", padx=(10, 0))
+        ttk.Label(fps_row, text="(Recommended: 30 for quality, 15-20 for long sessions)",
+                  style='CardHint.TLabel').pack(side="left", padx=(10, 0))
 
     def _build_screen_controls(self, parent) -> None:
         """Build screen capture controls."""
@@ -497,53 +640,43 @@ class ModernRecorderApp(ttk.Frame):
         monitor_row = tk.Frame(parent, bg=self.colors['bg_secondary'])
         monitor_row.pack(fill="x", pady=(0, 10))
         
-        tk.Label(monitor_row, text="🖥️ Monitor:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 10)).pack(side="left")
+        ttk.Label(monitor_row, text="🖥️ Monitor:", style='CardBody.TLabel').pack(side="left")
         
         monitor_entry = tk.Entry(monitor_row, textvariable=self.var_monitor_index, width=5,
                                bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                                insertbackground=self.colors['text_primary'],
-                               font=('Segoe UI', 10), relief='flat', borderwidth=5)
+                               font=self._font(10), relief='flat', borderwidth=5)
         monitor_entry.pack(side="left", padx=(10, 0))
         
-        tk.Label(monitor_row, text="(0 = all monitors)",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                font=('Segoe UI', 9)).pack(side="left", padx=(10, 0))
+        ttk.Label(monitor_row, text="(0 = all monitors)", style='CardHint.TLabel').pack(side="left", padx=(10, 0))
         
         # Region capture
-        region_check = tk.Checkbutton(parent, text="📐 Capture specific region",
-                                    variable=self.var_use_region,
-                                    command=self._toggle_region_controls,
-                                    bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                                    selectcolor=self.colors['bg_primary'],
-                                    font=('Segoe UI', 10), relief='flat')
+        region_check = ttk.Checkbutton(parent, text="📐 Capture specific region",
+                                     variable=self.var_use_region,
+                                     command=self._toggle_region_controls,
+                                     style='CardBody.TCheckbutton')
         region_check.pack(anchor="w", pady=(0, 10))
         
         # Region coordinates
         self.region_frame = tk.Frame(parent, bg=self.colors['bg_secondary'])
         self.region_frame.pack(fill="x")
         
-        coords = [("Left", self.var_region_left), ("Top", self.var_region_top),
-                 ("Width", self.var_region_width), ("Height", self.var_region_height)]
+        coord_vars = (self.var_region_left, self.var_region_top,
+                      self.var_region_width, self.var_region_height)
         
-        for i, (label, var) in enumerate(coords):
-            coord_frame = tk.Frame(self.region_frame, bg=self.colors['bg_secondary'])
-            coord_frame.pack(side="left", padx=(0, 15))
-            
-            tk.Label(coord_frame, text=f"{label}:",
-                    bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                    font=('Segoe UI', 9)).pack()
+        # One grid for all four fields: labels on row 0, entries below
+        self.region_frame.grid_anchor("w")
+        for col, (label, var) in enumerate(zip(_REGION_COORD_LABELS, coord_vars)):
+            ttk.Label(self.region_frame, text=f"{label}:",
+                      style='CardSmall.TLabel').grid(row=0, column=col, padx=(0, 15))
             
-            entry = tk.Entry(coord_frame, textvariable=var, width=8,
+            entry = tk.Entry(self.region_frame, textvariable=var, width=8,
                            bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                            insertbackground=self.colors['text_primary'],
-                           font=('Segoe UI', 9), relief='flat', borderwidth=3)
-            entry.pack()
+                           font=self._font(9), relief='flat', borderwidth=3)
+            entry.grid(row=1, column=col, padx=(0, 15))
             
             # Store entries for enable/disable
-            if not hasattr(self, 'region_entries'):
-                self.region_entries = []
             self.region_entries.append(entry)
 
     def _build_quality_controls(self, parent) -> None:
@@ -552,82 +685,67 @@ class ModernRecorderApp(ttk.Frame):
         quality_row = tk.Frame(parent, bg=self.colors['bg_secondary'])
         quality_row.pack(fill="x", pady=(0, 10))
         
-        tk.Label(quality_row, text="⭐ Video Quality:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 10)).pack(side="left")
+        ttk.Label(quality_row, text="⭐ Video Quality:", style='CardBody.TLabel').pack(side="left")
         
         quality_frame = tk.Frame(quality_row, bg=self.colors['bg_secondary'])
         quality_frame.pack(side="left", padx=(10, 0))
         
-        qualities = [("Low", "low"), ("Medium", "medium"), ("High", "high"), ("Ultra", "ultra")]
-        for text, value in qualities:
-            rb = tk.Radiobutton(quality_frame, text=text, variable=self.var_video_quality, value=value,
-                              bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                              selectcolor=self.colors['accent_blue'],
-                              font=('Segoe UI', 9), relief='flat')
+        for text, value in _QUALITY_OPTIONS:
+            rb = ttk.Radiobutton(quality_frame, text=text, variable=self.var_video_quality, value=value,
+                                 style='CardBody.TRadiobutton')
             rb.pack(side="left", padx=(0, 10))
         
         # Hardware acceleration
-        hw_check = tk.Checkbutton(parent, text="🚀 Hardware Acceleration (GPU)",
-                                variable=self.var_hardware_acceleration,
-                                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                                selectcolor=self.colors['bg_primary'],
-                                font=('Segoe UI', 10), relief='flat')
+        hw_check = ttk.Checkbutton(parent, text="🚀 Hardware Acceleration (GPU)",
+                                 variable=self.var_hardware_acceleration,
+                                 style='CardBody.TCheckbutton')
         hw_check.pack(anchor="w")
 
     def _build_audio_controls(self, parent) -> None:
         """Build audio recording controls."""
         # Audio enable
-        audio_check = tk.Checkbutton(parent, text="🎤 Record Audio",
-                                   variable=self.var_record_audio,
-                                   bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                                   selectcolor=self.colors['bg_primary'],
-                                   font=('Segoe UI', 10, 'bold'), relief='flat')
+        audio_check = ttk.Checkbutton(parent, text="🎤 Record Audio",
+                                    variable=self.var_record_audio,
+                                    style='CardHeading.TCheckbutton')
         audio_check.pack(anchor="w", pady=(0, 10))
         
         # System audio
-        system_check = tk.Checkbutton(parent, text="🔊 System Audio (Windows)",
-                                    variable=self.var_system_audio,
-                                    command=self._refresh_audio_devices,
-                                    bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                                    selectcolor=self.colors['bg_primary'],
-                                    font=('Segoe UI', 10), relief='flat')
+        system_check = ttk.Checkbutton(parent, text="🔊 System Audio (Windows)",
+                                     variable=self.var_system_audio,
+                                     command=self._refresh_audio_devices,
+                                     style='CardBody.TCheckbutton')
         system_check.pack(anchor="w", pady=(0, 10))
         
         # Separate audio save
-        separate_check = tk.Checkbutton(parent, text="💾 Save Audio Separately",
-                                      variable=self.var_save_audio_separately,
-                                      bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                                      selectcolor=self.colors['bg_primary'],
-                                      font=('Segoe UI', 10), relief='flat')
+        separate_check = ttk.Checkbutton(parent, text="💾 Save Audio Separately",
+                                       variable=self.var_save_audio_separately,
+                                       style='CardBody.TCheckbutton')
         separate_check.pack(anchor="w", pady=(0, 10))
         
         # Device selection
         device_row = tk.Frame(parent, bg=self.colors['bg_secondary'])
         device_row.pack(fill="x")
         
-        tk.Label(device_row, text="🎧 Audio Device:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 10)).pack(side="left")
+        ttk.Label(device_row, text="🎧 Audio Device:", style='CardBody.TLabel').pack(side="left")
         
         self.audio_combo = ttk.Combobox(device_row, textvariable=self.var_audio_device,
-                                       style='Modern.TCombobox', state="readonly")
+                                       style='Modern.TCombobox', state="readonly",
+                                       values=self._audio_labels)
         self.audio_combo.pack(side="left", fill="x", expand=True, padx=(10, 5))
         
-        refresh_btn = tk.Button(device_row, text="🔄", command=self._refresh_audio_devices,
-                              bg=self.colors['accent_green'], fg='white',
-                              font=('Segoe UI', 9, 'bold'), relief='flat', borderwidth=0,
-                              width=3, cursor='hand2')
-        refresh_btn.pack(side="right")
+        # Disabled while recording: rescanning re-initializes PortAudio
+        self.btn_refresh_audio = tk.Button(device_row, text="🔄", command=self._rescan_audio_devices,
+                                           bg=self.colors['accent_green'], fg='white',
+                                           font=self._font(9, 'bold'), relief='flat', borderwidth=0,
+                                           width=3, cursor='hand2')
+        self.btn_refresh_audio.pack(side="right")
 
     def _build_effects_controls(self, parent) -> None:
         """Build visual effects controls."""
         # Mouse highlighting
-        mouse_check = tk.Checkbutton(parent, text="🖱️ Mouse Highlighting",
-                                   variable=self.var_mouse_highlight,
-                                   bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                                   selectcolor=self.colors['bg_primary'],
-                                   font=('Segoe UI', 10, 'bold'), relief='flat')
+        mouse_check = ttk.Checkbutton(parent, text="🖱️ Mouse Highlighting",
+                                    variable=self.var_mouse_highlight,
+                                    style='CardHeading.TCheckbutton')
         mouse_check.pack(anchor="w", pady=(0, 10))
         
         # Mouse settings
@@ -635,170 +753,144 @@ class ModernRecorderApp(ttk.Frame):
         mouse_frame.pack(fill="x")
         
         # Radius
-        tk.Label(mouse_frame, text="Radius:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 9)).pack(side="left")
+        ttk.Label(mouse_frame, text="Radius:", style='CardSmall.TLabel').pack(side="left")
         
         radius_entry = tk.Entry(mouse_frame, textvariable=self.var_mouse_radius, width=8,
                               bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                               insertbackground=self.colors['text_primary'],
-                              font=('Segoe UI', 9), relief='flat', borderwidth=3)
+                              font=self._font(9), relief='flat', borderwidth=3)
         radius_entry.pack(side="left", padx=(5, 15))
         
         # Opacity
-        tk.Label(mouse_frame, text="Opacity:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 9)).pack(side="left")
+        ttk.Label(mouse_frame, text="Opacity:", style='CardSmall.TLabel').pack(side="left")
         
         opacity_entry = tk.Entry(mouse_frame, textvariable=self.var_mouse_alpha, width=8,
                                bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                                insertbackground=self.colors['text_primary'],
-                               font=('Segoe UI', 9), relief='flat', borderwidth=3)
+                               font=self._font(9), relief='flat', borderwidth=3)
         opacity_entry.pack(side="left", padx=(5, 15))
         
         # Color picker
         color_btn = tk.Button(mouse_frame, text="🎨 Pick Color", command=self._pick_mouse_color,
                             bg=self.colors['accent_orange'], fg='white',
-                            font=('Segoe UI', 9, 'bold'), relief='flat', borderwidth=0,
+                            font=self._font(9, 'bold'), relief='flat', borderwidth=0,
                             padx=10, cursor='hand2')
         color_btn.pack(side="right")
 
     def _build_webcam_controls(self, parent) -> None:
         """Build webcam overlay controls."""
-        # Webcam enable
-        webcam_check = tk.Checkbutton(parent, text="📷 Webcam Overlay",
-                                    variable=self.var_use_webcam,
-                                    bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                                    selectcolor=self.colors['bg_primary'],
-                                    font=('Segoe UI', 10, 'bold'), relief='flat')
-        webcam_check.pack(anchor="w", pady=(0, 10))
+        # One grid on the card: the toggle spans row 0, settings fill row 1
+        # and the spacer column pushes Detect to the right edge
+        parent.columnconfigure(6, weight=1)
         
-        # Webcam settings
-        webcam_frame = tk.Frame(parent, bg=self.colors['bg_secondary'])
-        webcam_frame.pack(fill="x")
+        # Webcam enable
+        webcam_check = ttk.Checkbutton(parent, text="📷 Webcam Overlay",
+                                     variable=self.var_use_webcam,
+                                     style='CardHeading.TCheckbutton')
+        webcam_check.grid(row=0, column=0, columnspan=7, sticky="w", pady=(0, 10))
         
         # Camera index
-        tk.Label(webcam_frame, text="📹 Camera:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 9)).pack(side="left")
+        ttk.Label(parent, text="📹 Camera:", style='CardSmall.TLabel').grid(row=1, column=0)
         
-        cam_entry = tk.Entry(webcam_frame, textvariable=self.var_webcam_index, width=5,
+        cam_entry = tk.Entry(parent, textvariable=self.var_webcam_index, width=5,
                            bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                            insertbackground=self.colors['text_primary'],
-                           font=('Segoe UI', 9), relief='flat', borderwidth=3)
-        cam_entry.pack(side="left", padx=(5, 15))
+                           font=self._font(9), relief='flat', borderwidth=3)
+        cam_entry.grid(row=1, column=1, padx=(5, 15))
         
         # Position
-        tk.Label(webcam_frame, text="📍 Position:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 9)).pack(side="left")
+        ttk.Label(parent, text="📍 Position:", style='CardSmall.TLabel').grid(row=1, column=2)
         
-        pos_combo = ttk.Combobox(webcam_frame, textvariable=self.var_pip_position,
+        pos_combo = ttk.Combobox(parent, textvariable=self.var_pip_position,
                                style='Modern.TCombobox', state="readonly", width=12,
-                               values=["top-left", "top-right", "bottom-left", "bottom-right"])
-        pos_combo.pack(side="left", padx=(5, 15))
+                               values=PIP_POSITIONS)
+        pos_combo.grid(row=1, column=3, padx=(5, 15))
         
         # Size
-        tk.Label(webcam_frame, text="📏 Size %:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 9)).pack(side="left")
+        ttk.Label(parent, text="📏 Size %:", style='CardSmall.TLabel').grid(row=1, column=4)
         
-        size_entry = tk.Entry(webcam_frame, textvariable=self.var_pip_width_pct, width=5,
+        size_entry = tk.Entry(parent, textvariable=self.var_pip_width_pct, width=5,
                             bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                             insertbackground=self.colors['text_primary'],
-                            font=('Segoe UI', 9), relief='flat', borderwidth=3)
-        size_entry.pack(side="left", padx=(5, 0))
+                            font=self._font(9), relief='flat', borderwidth=3)
+        size_entry.grid(row=1, column=5, padx=(5, 0))
         
         # Detect cameras
-        detect_btn = tk.Button(webcam_frame, text="🔍 Detect", command=self._refresh_cameras,
+        detect_btn = tk.Button(parent, text="🔍 Detect", command=self._rescan_cameras,
                              bg=self.colors['accent_blue'], fg='white',
-                             font=('Segoe UI', 9, 'bold'), relief='flat', borderwidth=0,
+                             font=self._font(9, 'bold'), relief='flat', borderwidth=0,
                              padx=10, cursor='hand2')
-        detect_btn.pack(side="right")
+        detect_btn.grid(row=1, column=6, sticky="e")
 
     def _build_advanced_controls(self, parent) -> None:
         """Build advanced recording controls."""
         # Segment recording
-        segment_check = tk.Checkbutton(parent, text="📂 Split into Segments (for long recordings)",
-                                     variable=self.var_use_segments,
-                                     bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                                     selectcolor=self.colors['bg_primary'],
-                                     font=('Segoe UI', 10), relief='flat')
-        segment_check.pack(anchor="w", pady=(0, 10))
+        segment_check = ttk.Checkbutton(parent, text="📂 Split into Segments (for long recordings)",
+                                      variable=self.var_use_segments,
+                                      style='CardBody.TCheckbutton')
+        segment_check.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 10))
         
         # Segment duration
-        duration_row = tk.Frame(parent, bg=self.colors['bg_secondary'])
-        duration_row.pack(fill="x", pady=(0, 10))
+        ttk.Label(parent, text="⏱️ Segment Duration (minutes):",
+                  style='CardBody.TLabel').grid(row=1, column=0, sticky="w", pady=(0, 10))
         
-        tk.Label(duration_row, text="⏱️ Segment Duration (minutes):",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 10)).pack(side="left")
-        
-        duration_entry = tk.Entry(duration_row, textvariable=self.var_segment_duration, width=8,
+        duration_entry = tk.Entry(parent, textvariable=self.var_segment_duration, width=8,
                                 bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                                 insertbackground=self.colors['text_primary'],
-                                font=('Segoe UI', 10), relief='flat', borderwidth=5)
-        duration_entry.pack(side="left", padx=(10, 0))
+                                font=self._font(10), relief='flat', borderwidth=5)
+        duration_entry.grid(row=1, column=1, sticky="w", padx=(10, 0), pady=(0, 10))
         
         # Preview mode
-        preview_check = tk.Checkbutton(parent, text="👁️ Show Preview Window",
-                                     variable=self.var_show_preview,
-                                     bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                                     selectcolor=self.colors['bg_primary'],
-                                     font=('Segoe UI', 10), relief='flat')
-        preview_check.pack(anchor="w")
+        preview_check = ttk.Checkbutton(parent, text="👁️ Show Preview Window",
+                                      variable=self.var_show_preview,
+                                      style='CardBody.TCheckbutton')
+        preview_check.grid(row=2, column=0, columnspan=2, sticky="w")
 
     def _build_ffmpeg_controls(self, parent) -> None:
         """Build FFmpeg configuration controls."""
+        # Path entry column takes the spare width
+        parent.columnconfigure(1, weight=1)
+        
         # Info text
-        info_label = tk.Label(parent,
-                            text="FFmpeg is required for audio merging. Set path below or add to system PATH.",
-                            bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                            font=('Segoe UI', 9), wraplength=400, justify="left")
-        info_label.pack(anchor="w", pady=(0, 10))
+        info_label = ttk.Label(parent,
+                             text="FFmpeg is required for audio merging. Set path below or add to system PATH.",
+                             style='CardHint.TLabel', wraplength=400, justify="left")
+        info_label.grid(row=0, column=0, columnspan=4, sticky="w", pady=(0, 10))
         
         # FFmpeg path
-        path_row = tk.Frame(parent, bg=self.colors['bg_secondary'])
-        path_row.pack(fill="x")
-        
-        tk.Label(path_row, text="🛠️ FFmpeg Path:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 10)).pack(side="left")
+        ttk.Label(parent, text="🛠️ FFmpeg Path:", style='CardBody.TLabel').grid(row=1, column=0)
         
-        ffmpeg_entry = tk.Entry(path_row, textvariable=self.var_ffmpeg_path,
+        ffmpeg_entry = tk.Entry(parent, textvariable=self.var_ffmpeg_path,
                               bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
                               insertbackground=self.colors['text_primary'],
-                              font=('Segoe UI', 10), relief='flat', borderwidth=5)
-        ffmpeg_entry.pack(side="left", fill="x", expand=True, padx=(10, 5))
-        
-        browse_btn = tk.Button(path_row, text="Browse", command=self._browse_ffmpeg,
-                             bg=self.colors['accent_purple'], fg='white',
-                             font=('Segoe UI', 9, 'bold'), relief='flat', borderwidth=0,
-                             padx=10, cursor='hand2')
-        browse_btn.pack(side="right", padx=(0, 5))
+                              font=self._font(10), relief='flat', borderwidth=5)
+        ffmpeg_entry.grid(row=1, column=1, sticky="ew", padx=(10, 5))
         
-        test_btn = tk.Button(path_row, text="Test", command=self._test_ffmpeg,
+        test_btn = tk.Button(parent, text="Test", command=self._test_ffmpeg,
                            bg=self.colors['accent_green'], fg='white',
-                           font=('Segoe UI', 9, 'bold'), relief='flat', borderwidth=0,
+                           font=self._font(9, 'bold'), relief='flat', borderwidth=0,
                            padx=10, cursor='hand2')
-        test_btn.pack(side="right")
+        test_btn.grid(row=1, column=2)
+        
+        browse_btn = tk.Button(parent, text="Browse", command=self._browse_ffmpeg,
+                             bg=self.colors['accent_purple'], fg='white',
+                             font=self._font(9, 'bold'), relief='flat', borderwidth=0,
+                             padx=10, cursor='hand2')
+        browse_btn.grid(row=1, column=3, padx=(0, 5))
 
     def _build_theme_selector(self, parent) -> None:
         """Build theme selection controls."""
         # Theme info
-        info_label = tk.Label(parent,
-                            text="Choose your preferred AI-style color theme for the interface.",
-                            bg=self.colors['bg_secondary'], fg=self.colors['text_secondary'],
-                            font=('Segoe UI', 9), wraplength=400, justify="left")
+        info_label = ttk.Label(parent,
+                             text="Choose your preferred AI-style color theme for the interface.",
+                             style='CardHint.TLabel', wraplength=400, justify="left")
         info_label.pack(anchor="w", pady=(0, 10))
         
         # Theme selection
         theme_row = tk.Frame(parent, bg=self.colors['bg_secondary'])
         theme_row.pack(fill="x")
         
-        tk.Label(theme_row, text="🎨 Color Theme:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 10)).pack(side="left")
+        ttk.Label(theme_row, text="🎨 Color Theme:", style='CardBody.TLabel').pack(side="left")
         
         # Theme dropdown
         if hasattr(self, 'available_themes'):
@@ -811,36 +903,36 @@ class ModernRecorderApp(ttk.Frame):
                                  style='Modern.TCombobox', state="readonly",
                                  values=theme_values)
         theme_combo.pack(side="left", fill="x", expand=True, padx=(10, 5))
-        theme_combo.bind('<<ComboboxSelected>>', self._change_theme)
         
         # Apply button
         apply_btn = tk.Button(theme_row, text="Apply Theme", command=self._apply_theme,
                             bg=self.colors['accent_purple'], fg='white',
-                            font=('Segoe UI', 9, 'bold'), relief='flat', borderwidth=0,
+                            font=self._font(9, 'bold'), relief='flat', borderwidth=0,
                             padx=15, cursor='hand2')
         apply_btn.pack(side="right")
 
-    def _change_theme(self, event=None) -> None:
-        """Handle theme selection change."""
-        # This will be called when the combobox selection changes
-        pass
-
     def _apply_theme(self) -> None:
         """Apply the selected theme to the interface."""
         try:
             from .themes import get_theme
             new_theme = self.var_theme.get()
+            if new_theme == getattr(self, 'current_theme', None):
+                self._set_status(f"🎨 Theme '{new_theme}' is already active")
+                return
+            old_colors = self.colors
             self.colors = get_theme(new_theme)
             self.current_theme = new_theme
             
-            # Show success message
-            self._set_status(f"🎨 Theme '{new_theme}' applied! Restart app for full effect.")
+            # ttk widgets follow their styles; classic tk widgets are recoloured
+            self._apply_styles(ttk.Style())
+            self._recolor_widgets(old_colors, self.colors)
             
-            messagebox.showinfo(
-                "Theme Applied", 
-                f"✨ Theme '{new_theme}' has been applied!\n\n"
-                "Some changes may require restarting the application for full effect."
-            )
+            # Palette-derived state used by the periodic updates
+            self._set_usage_colors()
+            self._shown_recording = None
+            self._update_button_states()
+            
+            self._set_status(f"🎨 Theme '{new_theme}' applied!")
             
         except ImportError:
             messagebox.showwarning(
@@ -850,45 +942,45 @@ class ModernRecorderApp(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Theme Error", f"Failed to apply theme: {e}")
 
+    def _recolor_widgets(self, old_colors: Mapping[str, str], new_colors: Mapping[str, str]) -> None:
+        """
+        Swap palette colours on classic tk widgets in one pass over the widget tree.
+        
+        Args:
+            old_colors: Palette the widgets were built with
+            new_colors: Palette to switch to
+        """
+        remap = {old_colors[key]: new_colors[key] for key in new_colors if key in old_colors}
+        pending = [self.master]
+        while pending:
+            widget = pending.pop()
+            pending.extend(widget.winfo_children())
+            if isinstance(widget, ttk.Widget):
+                continue  # Styled through ttk.Style
+                
+            changes = {}
+            for option in _PALETTE_OPTIONS:
+                try:
+                    color = remap.get(str(widget.cget(option)))
+                except tk.TclError:
+                    continue  # Widget has no such option
+                if color is not None:
+                    changes[option] = color
+            if changes:
+                widget.configure(**changes)
+
     def _build_system_info(self, parent) -> None:
         """Build system information display."""
-        import platform
-        import psutil
+        rows = _system_info()
         
-        # System info
+        # One grid for all rows: names in column 0, values in column 1
         info_frame = tk.Frame(parent, bg=self.colors['bg_secondary'])
         info_frame.pack(fill="x")
-        
-        # OS Info
-        os_row = tk.Frame(info_frame, bg=self.colors['bg_secondary'])
-        os_row.pack(fill="x", pady=2)
-        tk.Label(os_row, text="💻 Operating System:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 10, 'bold')).pack(side="left")
-        tk.Label(os_row, text=f"{platform.system()} {platform.release()}",
-                bg=self.colors['bg_secondary'], fg=self.colors['accent_blue'],
-                font=('Segoe UI', 10)).pack(side="left", padx=(10, 0))
-        
-        # CPU Info
-        cpu_row = tk.Frame(info_frame, bg=self.colors['bg_secondary'])
-        cpu_row.pack(fill="x", pady=2)
-        tk.Label(cpu_row, text="🔧 CPU Cores:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 10, 'bold')).pack(side="left")
-        tk.Label(cpu_row, text=f"{psutil.cpu_count()} cores",
-                bg=self.colors['bg_secondary'], fg=self.colors['accent_blue'],
-                font=('Segoe UI', 10)).pack(side="left", padx=(10, 0))
-        
-        # Memory Info
-        memory = psutil.virtual_memory()
-        mem_row = tk.Frame(info_frame, bg=self.colors['bg_secondary'])
-        mem_row.pack(fill="x", pady=2)
-        tk.Label(mem_row, text="💾 RAM:",
-                bg=self.colors['bg_secondary'], fg=self.colors['text_primary'],
-                font=('Segoe UI', 10, 'bold')).pack(side="left")
-        tk.Label(mem_row, text=f"{memory.total // (1024**3)} GB",
-                bg=self.colors['bg_secondary'], fg=self.colors['accent_blue'],
-                font=('Segoe UI', 10)).pack(side="left", padx=(10, 0))
+        for row, (name, value) in enumerate(rows):
+            ttk.Label(info_frame, text=name, style='CardKey.TLabel').grid(
+                row=row, column=0, sticky="w", pady=2)
+            ttk.Label(info_frame, text=value, style='CardValue.TLabel').grid(
+                row=row, column=1, sticky="w", padx=(10, 0), pady=2)
 
     def _build_performance_monitor(self, parent) -> None:
         """Build performance monitoring display."""
@@ -899,23 +991,27 @@ class ModernRecorderApp(ttk.Frame):
         # CPU Usage
         self.cpu_label = tk.Label(self.perf_frame, text="⚡ CPU: 0%",
                                  bg=self.colors['bg_secondary'], fg=self.colors['accent_green'],
-                                 font=('Segoe UI', 10, 'bold'))
+                                 font=self._font(10, 'bold'))
         self.cpu_label.pack(side="left", padx=(0, 20))
         
         # Memory Usage
         self.mem_label = tk.Label(self.perf_frame, text="💾 Memory: 0%",
                                  bg=self.colors['bg_secondary'], fg=self.colors['accent_blue'],
-                                 font=('Segoe UI', 10, 'bold'))
+                                 font=self._font(10, 'bold'))
         self.mem_label.pack(side="left", padx=(0, 20))
         
         # Recording Stats
         self.stats_label = tk.Label(self.perf_frame, text="📊 Frames: 0",
                                    bg=self.colors['bg_secondary'], fg=self.colors['accent_purple'],
-                                   font=('Segoe UI', 10, 'bold'))
+                                   font=self._font(10, 'bold'))
         self.stats_label.pack(side="left")
         
-        # Start performance monitoring
-        self._update_performance_monitor()
+        # Start performance monitoring; the first non-blocking CPU sample only
+        # sets psutil's reference point, so prime it here
+        self._set_usage_colors()
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)
+        self.master.after(self.PERF_POLL_MS, self._update_performance_monitor)
 
     def _build_control_section(self, parent) -> None:
         """Build the main control buttons section."""
@@ -932,7 +1028,7 @@ class ModernRecorderApp(ttk.Frame):
                                   command=self._start_recording,
                                   bg=self.colors['accent_green'],
                                   fg='white',
-                                  font=('Segoe UI', 14, 'bold'),
+                                  font=self._font(14, 'bold'),
                                   relief='flat',
                                   borderwidth=0,
                                   padx=30,
@@ -946,7 +1042,7 @@ class ModernRecorderApp(ttk.Frame):
                                  command=self._stop_recording,
                                  bg=self.colors['accent_red'],
                                  fg='white',
-                                 font=('Segoe UI', 14, 'bold'),
+                                 font=self._font(14, 'bold'),
                                  relief='flat',
                                  borderwidth=0,
                                  padx=30,
@@ -966,7 +1062,7 @@ class ModernRecorderApp(ttk.Frame):
         
         tk.Label(header_frame, text="📊 Status",
                 bg=self.colors['accent_blue'], fg='white',
-                font=('Segoe UI', 11, 'bold')).pack(side="left", padx=10, pady=5)
+                font=self._font(11, 'bold')).pack(side="left", padx=10, pady=5)
         
         # Status content
         content_frame = tk.Frame(status_frame, bg=self.colors['bg_secondary'])
@@ -976,7 +1072,7 @@ class ModernRecorderApp(ttk.Frame):
                                    textvariable=self.var_status,
                                    bg=self.colors['bg_secondary'],
                                    fg=self.colors['text_primary'],
-                                   font=('Segoe UI', 11),
+                                   font=self._font(11),
                                    anchor="w")
         self.status_label.pack(fill="x")
 
@@ -984,54 +1080,77 @@ class ModernRecorderApp(ttk.Frame):
     def _toggle_region_controls(self) -> None:
         """Enable/disable region coordinate controls."""
         state = tk.NORMAL if self.var_use_region.get() else tk.DISABLED
-        for entry in getattr(self, 'region_entries', []):
+        for entry in self.region_entries:
             entry.configure(state=state)
 
     def _update_button_states(self) -> None:
         """Update button states based on recording status."""
+        if self.recording == self._shown_recording:
+            return
+        self._shown_recording = self.recording
+        
         if self.recording:
             self.btn_start.configure(state=tk.DISABLED)
             self.btn_stop.configure(state=tk.NORMAL)
+            self.btn_refresh_audio.configure(state=tk.DISABLED)
             self.recording_indicator.configure(text="🔴 Recording", fg=self.colors['accent_red'])
         else:
             self.btn_start.configure(state=tk.NORMAL)
             self.btn_stop.configure(state=tk.DISABLED)
+            self.btn_refresh_audio.configure(state=tk.NORMAL)
             self.recording_indicator.configure(text="⚫ Standby", fg=self.colors['text_secondary'])
 
     def _update_performance_monitor(self) -> None:
         """Update performance monitoring display."""
-        try:
-            import psutil
-            
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            self.cpu_label.configure(text=f"⚡ CPU: {cpu_percent:.1f}%")
+        if psutil is None:
+            return
             
-            # Memory usage
-            memory = psutil.virtual_memory()
-            mem_percent = memory.percent
-            self.mem_label.configure(text=f"💾 Memory: {mem_percent:.1f}%")
+        # Nobody sees the readout while minimized or on another tab
+        if self.master.state() in ('iconic', 'withdrawn') or not self.perf_frame.winfo_viewable():
+            self.master.after(self.PERF_HIDDEN_POLL_MS, self._update_performance_monitor)
+            return
             
-            # Update colors based on usage
-            if cpu_percent > 80:
-                self.cpu_label.configure(fg=self.colors['accent_red'])
-            elif cpu_percent > 60:
-                self.cpu_label.configure(fg=self.colors['accent_orange'])
-            else:
-                self.cpu_label.configure(fg=self.colors['accent_green'])
-                
-            if mem_percent > 80:
-                self.mem_label.configure(fg=self.colors['accent_red'])
-            elif mem_percent > 60:
-                self.mem_label.configure(fg=self.colors['accent_orange'])
-            else:
-                self.mem_label.configure(fg=self.colors['accent_blue'])
-                
-        except ImportError:
-            pass
+        # Non-blocking: CPU usage since the previous call
+        cpu_percent = psutil.cpu_percent(interval=None)
+        mem_percent = psutil.virtual_memory().percent
+        
+        self._show_usage(self.cpu_label, "⚡ CPU", cpu_percent, self._cpu_colors)
+        self._show_usage(self.mem_label, "💾 Memory", mem_percent, self._mem_colors)
         
         # Schedule next update
-        self.master.after(2000, self._update_performance_monitor)
+        self.master.after(self.PERF_POLL_MS, self._update_performance_monitor)
+
+    def _set_usage_colors(self) -> None:
+        """Build the usage colour tables from the palette and force a full redraw."""
+        warn, high = self.colors['accent_orange'], self.colors['accent_red']
+        self._cpu_colors = (self.colors['accent_green'], warn, high)
+        self._mem_colors = (self.colors['accent_blue'], warn, high)
+        self._perf_shown.clear()
+
+    def _show_usage(self, label: tk.Label, name: str, percent: float,
+                    colors: tuple[str, str, str]) -> None:
+        """
+        Show a usage percentage, reconfiguring only the label options that changed.
+        
+        Args:
+            label: Label to update
+            name: Text prefix, e.g. "⚡ CPU"
+            percent: Usage in percent
+            colors: Normal, above-60% and above-80% colours
+        """
+        value = round(percent, 1)
+        bucket = (percent > 60) + (percent > 80)
+        last_value, last_bucket = self._perf_shown.get(name, (None, None))
+        if value == last_value and bucket == last_bucket:
+            return
+        self._perf_shown[name] = (value, bucket)
+        
+        options = {}
+        if value != last_value:
+            options['text'] = f"{name}: {value:.1f}%"
+        if bucket != last_bucket:
+            options['fg'] = colors[bucket]
+        label.configure(**options)
 
     def _pick_mouse_color(self) -> None:
         """Open color picker for mouse highlight color."""
@@ -1042,9 +1161,10 @@ class ModernRecorderApp(ttk.Frame):
 
     def _browse_output(self) -> None:
         """Browse for output file location."""
-        default_name = dt.datetime.now().strftime("recording_%Y%m%d_%H%M%S.mp4")
-        initial_dir = self._get_documents_folder()
+        default_name = default_output_name()
+        initial_dir = self._last_output_dir or _documents_folder()
         path = filedialog.asksaveasfilename(
+            parent=self.master,
             defaultextension=".mp4",
             filetypes=[("MP4 files", "*.mp4"), ("All files", "*.*")],
             initialfile=default_name,
@@ -1052,67 +1172,167 @@ class ModernRecorderApp(ttk.Frame):
             title="Choose output file"
         )
         if path:
+            self._last_output_dir = os.path.dirname(path)
             self.var_output.set(path)
 
-    def _get_documents_folder(self) -> str:
-        """Return the user's Documents folder (Windows) or home/Documents fallback."""
-        # Try HOME/Documents
-        docs = os.path.join(os.path.expanduser("~"), "Documents")
-        if os.path.isdir(docs):
-            return docs
-        # Fallback to home
-        return os.path.expanduser("~")
-
     def _default_output_path(self) -> str:
         """Default output path under Documents with a timestamped filename."""
-        base = self._get_documents_folder()
-        name = dt.datetime.now().strftime("recording_%Y%m%d_%H%M%S.mp4")
+        base = _documents_folder()
+        name = default_output_name()
         return os.path.join(base, name)
 
     def _browse_ffmpeg(self) -> None:
         """Browse for FFmpeg executable."""
-        initial_dir = self.var_ffmpeg_path.get() or os.environ.get('ProgramFiles', 'C:/')
+        initial_dir = (self._last_ffmpeg_dir or self.var_ffmpeg_path.get()
+                       or os.environ.get('ProgramFiles', 'C:/'))
         
         if os.name == 'nt':
             path = filedialog.askopenfilename(
+                parent=self.master,
                 title="Select ffmpeg.exe",
                 initialdir=initial_dir,
                 filetypes=[("FFmpeg executable", "ffmpeg.exe"), ("All files", "*.*")]
             )
         else:
             path = filedialog.askopenfilename(
+                parent=self.master,
                 title="Select ffmpeg binary", 
                 initialdir=initial_dir
             )
             
         if path:
+            self._last_ffmpeg_dir = os.path.dirname(path)
             self.var_ffmpeg_path.set(path)
 
+    def _start_startup_probe(self) -> None:
+        """Run the slow device and FFmpeg lookups on a worker thread."""
+        # Tk variables are read here; the worker must not touch Tk
+        probe = threading.Thread(
+            target=self._startup_probe_worker,
+            args=(self.var_system_audio.get(), self.var_ffmpeg_path.get()),
+            daemon=True
+        )
+        probe.start()
+        self.master.after(self.WORKER_POLL_MS, self._poll_startup_probe, probe)
+
+    @staticmethod
+    def _startup_probe_worker(loopback_mode: bool, ffmpeg_hint: str) -> None:
+        """
+        Fill the audio device, camera and FFmpeg caches.
+        
+        Args:
+            loopback_mode: Audio device list to enumerate
+            ffmpeg_hint: FFmpeg path from the settings field
+        """
+        _audio_backend().get_audio_devices(loopback=loopback_mode)
+        _video_backend().probe_cameras()
+        cached_ffmpeg_path(ffmpeg_hint)
+
+    def _poll_startup_probe(self, probe: threading.Thread) -> None:
+        """Populate the device lists once the startup probe has finished."""
+        if probe.is_alive():
+            self.master.after(self.WORKER_POLL_MS, self._poll_startup_probe, probe)
+            return
+        # These now read the caches the worker filled
+        self._refresh_audio_devices()
+        self._refresh_cameras()
+        self._check_ffmpeg_startup()
+
     def _refresh_audio_devices(self) -> None:
         """Refresh the list of available audio devices."""
         loopback_mode = self.var_system_audio.get()
-        self._audio_devices = get_audio_devices(loopback=loopback_mode)
-        
-        if hasattr(self, 'audio_combo'):
-            device_labels = [label for label, _ in self._audio_devices]
-            self.audio_combo['values'] = device_labels
-            
-            current_selection = self.var_audio_device.get()
-            if current_selection not in device_labels:
-                self.var_audio_device.set(device_labels[0])
+        devices = _audio_backend().get_audio_devices(loopback=loopback_mode)
+        self._audio_id_by_label = dict(devices)
+        
+        # The combobox already shows _audio_labels; only push a changed list
+        labels = tuple(self._audio_id_by_label)
+        if labels != self._audio_labels:
+            self._audio_labels = labels
+            self.audio_combo['values'] = labels
+        if self.var_audio_device.get() not in self._audio_id_by_label:
+            self.var_audio_device.set(self._audio_labels[0])
+
+    def _rescan_audio_devices(self) -> None:
+        """Re-enumerate audio devices, picking up newly connected hardware."""
+        _audio_backend().invalidate_audio_devices()
+        self._refresh_audio_devices()
+
+    def _rescan_cameras(self) -> None:
+        """Probe cameras again on a worker thread, picking up newly connected devices."""
+        self._set_status("🔍 Probing cameras...")
+        self._run_in_background(lambda: _video_backend().probe_cameras(force=True),
+                                self._show_cameras)
 
     def _refresh_cameras(self) -> None:
-        """Detect available cameras."""
-        cameras = probe_cameras()
+        """Show the cameras found by the last probe (the startup probe fills the cache)."""
+        self._show_cameras(_video_backend().probe_cameras())
+
+    def _show_cameras(self, cameras: Optional[list[int]]) -> None:
+        """
+        Select the first detected camera and report what was found.
+        
+        Args:
+            cameras: Available camera indices (None if probing failed)
+        """
         if cameras:
             self.var_webcam_index.set(cameras[0])
             self._set_status(f"🎥 Cameras detected: {cameras}")
         else:
             self._set_status("⚠️ No cameras detected")
 
+    def _run_in_background(self, work: Callable[[], Any], on_done: Callable[[Any], None]) -> None:
+        """
+        Run a slow call on a worker thread and hand its result back to the Tk thread.
+        
+        Args:
+            work: Call to run; it must not touch Tk
+            on_done: Called on the Tk thread with the result (None if work raised)
+        """
+        result = []
+        worker = threading.Thread(target=lambda: result.append(work()), daemon=True)
+        worker.start()
+        self.master.after(self.WORKER_POLL_MS, self._poll_background, worker, result, on_done)
+
+    def _poll_background(self, worker: threading.Thread, result: list,
+                         on_done: Callable[[Any], None]) -> None:
+        """Deliver a background call's result once its thread has finished."""
+        if worker.is_alive():
+            self.master.after(self.WORKER_POLL_MS, self._poll_background, worker, result, on_done)
+            return
+        on_done(result[0] if result else None)
+
     def _test_ffmpeg(self) -> None:
-        """Test FFmpeg functionality."""
-        ffmpeg_path, source = find_ffmpeg_path(self.var_ffmpeg_path.get())
+        """Test FFmpeg on a worker thread and show the results."""
+        self._set_status("🛠️ Testing FFmpeg...")
+        ffmpeg_hint = self.var_ffmpeg_path.get()
+        self._run_in_background(lambda: self._ffmpeg_test_worker(ffmpeg_hint),
+                                self._show_ffmpeg_test)
+
+    @staticmethod
+    def _ffmpeg_test_worker(ffmpeg_hint: str) -> tuple[Optional[str], str, bool, str]:
+        """
+        Locate FFmpeg and run a version check.
+        
+        Args:
+            ffmpeg_hint: FFmpeg path from the settings field
+            
+        Returns:
+            Tuple of (FFmpeg path or None, source, success, message)
+        """
+        ffmpeg_path, source = cached_ffmpeg_path(ffmpeg_hint)
+        if not ffmpeg_path:
+            return None, source, False, "FFmpeg not found"
+        success, message = cached_test_ffmpeg(ffmpeg_path)
+        return ffmpeg_path, source, success, message
+
+    def _show_ffmpeg_test(self, outcome: Optional[tuple[Optional[str], str, bool, str]]) -> None:
+        """
+        Report an FFmpeg test result.
+        
+        Args:
+            outcome: Result of _ffmpeg_test_worker (None if it raised)
+        """
+        ffmpeg_path, source, success, message = outcome or (None, "", False, "")
         
         if not ffmpeg_path:
             messagebox.showerror(
@@ -1121,28 +1341,22 @@ class ModernRecorderApp(ttk.Frame):
                 "Please download FFmpeg from https://ffmpeg.org/download.html\n"
                 "and set the path using the Browse button."
             )
+            self._set_status("⚠️ FFmpeg not found")
             return
             
-        success, message = test_ffmpeg(ffmpeg_path)
-        
         if success:
-            messagebox.showinfo(
-                "FFmpeg Test Successful",
-                f"✅ FFmpeg is working!\n\n"
-                f"Source: {source}\n"
-                f"Path: {ffmpeg_path}\n"
-                f"Version: {message}"
-            )
+            self._show_toast(f"✅ FFmpeg is working ({source})\n{message}", kind="success")
             self._set_status(f"✅ FFmpeg OK: {message}")
         else:
             messagebox.showerror(
                 "FFmpeg Test Failed",
                 f"❌ FFmpeg test failed:\n{message}"
             )
+            self._set_status(f"❌ FFmpeg test failed: {message}")
 
     def _check_ffmpeg_startup(self) -> None:
         """Check FFmpeg availability on startup."""
-        ffmpeg_path, source = find_ffmpeg_path(self.var_ffmpeg_path.get())
+        ffmpeg_path, source = cached_ffmpeg_path(self.var_ffmpeg_path.get())
         
         if ffmpeg_path:
             self._set_status(f"🟢 Ready to record. FFmpeg found: {source}")
@@ -1151,22 +1365,26 @@ class ModernRecorderApp(ttk.Frame):
 
     def _get_selected_audio_device_id(self) -> Optional[int]:
         """Get the device ID for the currently selected audio device."""
-        selected_label = self.var_audio_device.get()
-        for label, device_id in self._audio_devices:
-            if label == selected_label:
-                return device_id
-        return None
+        return self._audio_id_by_label.get(self.var_audio_device.get())
 
     def _make_output_path(self) -> str:
         """Generate output file path with default if not specified."""
         path = self.var_output.get().strip()
         if not path:
-            default_name = dt.datetime.now().strftime("recording_%Y%m%d_%H%M%S.mp4")
+            default_name = default_output_name()
             path = os.path.join(os.getcwd(), default_name)
             
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Bare filenames have no directory part to create
+        parent = os.path.dirname(path)
+        if parent and not os.path.isdir(parent):
+            os.makedirs(parent, exist_ok=True)
         return path
 
+    @staticmethod
+    def _is_digits(text: str) -> bool:
+        """Entry validator: accept only digits (empty is allowed while editing)."""
+        return text == "" or text.isdigit()
+
     def _parse_fps(self) -> int:
         """Parse and validate FPS setting."""
         try:
@@ -1183,10 +1401,10 @@ class ModernRecorderApp(ttk.Frame):
             return None
             
         try:
-            left = int(self.var_region_left.get())
-            top = int(self.var_region_top.get())
-            width = int(self.var_region_width.get())
-            height = int(self.var_region_height.get())
+            left, top, width, height = self._get_ints(
+                self.var_region_left, self.var_region_top,
+                self.var_region_width, self.var_region_height
+            )
             
             if left < 0 or top < 0 or width <= 0 or height <= 0:
                 raise ValueError("Invalid region coordinates")
@@ -1195,19 +1413,49 @@ class ModernRecorderApp(ttk.Frame):
         except ValueError:
             raise ValueError("Region coordinates must be valid positive integers")
 
+    @staticmethod
+    def _get_ints(*variables: tk.Variable) -> list[int]:
+        """
+        Read several whole-number settings in one pass.
+        
+        Args:
+            variables: Tk variables bound to numeric entries
+            
+        Returns:
+            Their values, in order
+            
+        Raises:
+            ValueError: If any field is empty or not a number
+        """
+        try:
+            return [int(var.get()) for var in variables]
+        except (ValueError, tk.TclError):
+            # IntVar.get() raises TclError for empty or non-numeric text
+            raise ValueError("Expected a whole number")
+
     def _create_config(self) -> RecorderConfig:
         """Create recording configuration from UI settings."""
+        try:
+            (monitor_index, mouse_radius, webcam_index,
+             pip_width_pct, segment_minutes) = self._get_ints(
+                self.var_monitor_index, self.var_mouse_radius, self.var_webcam_index,
+                self.var_pip_width_pct, self.var_segment_duration
+            )
+            mouse_alpha = float(self.var_mouse_alpha.get())
+        except (ValueError, tk.TclError):
+            raise ValueError("Monitor, mouse, webcam and segment settings must be valid numbers")
+            
         return RecorderConfig(
             fps=self._parse_fps(),
             output_path=self._make_output_path(),
-            monitor_index=int(self.var_monitor_index.get()),
+            monitor_index=monitor_index,
             region=self._validate_region(),
             show_preview=self.var_show_preview.get(),
             # Mouse highlight
             mouse_highlight=self.var_mouse_highlight.get(),
             mouse_color=self.var_mouse_color,
-            mouse_radius=int(self.var_mouse_radius.get()),
-            mouse_alpha=float(self.var_mouse_alpha.get()),
+            mouse_radius=mouse_radius,
+            mouse_alpha=mouse_alpha,
             # Audio
             record_audio=self.var_record_audio.get(),
             audio_device=self._get_selected_audio_device_id(),
@@ -1215,23 +1463,75 @@ class ModernRecorderApp(ttk.Frame):
             save_audio_separately=self.var_save_audio_separately.get(),
             # Webcam
             use_webcam=self.var_use_webcam.get(),
-            webcam_index=int(self.var_webcam_index.get()),
+            webcam_index=webcam_index,
             pip_position=self.var_pip_position.get(),
-            pip_width_pct=int(self.var_pip_width_pct.get()),
+            pip_width_pct=pip_width_pct,
             # Quality and performance
             video_quality=self.var_video_quality.get(),
             hardware_acceleration=self.var_hardware_acceleration.get(),
             use_segments=self.var_use_segments.get(),
-            segment_duration_minutes=int(self.var_segment_duration.get()),
+            segment_duration_minutes=segment_minutes,
             # FFmpeg
             ffmpeg_path=self.var_ffmpeg_path.get().strip() or None,
         )
 
+    def _show_toast(self, message: str, kind: str = "info", duration_ms: int = 3000) -> None:
+        """
+        Show a short notification over the window's top-right corner.
+        Unlike a messagebox it does not block; it replaces any toast still
+        showing and dismisses itself.
+        
+        Args:
+            message: Text to show
+            kind: "info", "success" or "warning"
+            duration_ms: How long the toast stays up
+        """
+        self._dismiss_toast()
+        accent = {"success": 'accent_green', "warning": 'accent_orange'}.get(kind, 'accent_blue')
+        self._toast = tk.Label(self, text=message, justify="left",
+                               bg=self.colors[accent], fg='white',
+                               font=self._font(10, 'bold'), padx=14, pady=8)
+        self._toast.place(relx=1.0, rely=0.0, anchor="ne", x=-10, y=10)
+        self._toast_job = self.master.after(duration_ms, self._dismiss_toast)
+
+    def _dismiss_toast(self) -> None:
+        """Remove the current toast, if any."""
+        if self._toast_job is not None:
+            self.master.after_cancel(self._toast_job)
+            self._toast_job = None
+        if self._toast is not None:
+            self._toast.destroy()
+            self._toast = None
+
     def _set_status(self, message: str) -> None:
-        """Update status message."""
-        self.var_status.set(message)
+        """
+        Update status message.
+        The recorder calls this from its worker threads, which must not touch
+        Tk: their messages are stored and picked up by _poll_status, so a burst
+        of updates costs a single redraw. Redraws are left to the event loop;
+        use _show_status_now before blocking the Tk thread.
+        """
+        self._pending_status = message
+        if threading.current_thread() is threading.main_thread():
+            self._flush_status()
+
+    def _show_status_now(self, message: str) -> None:
+        """Show a status message immediately, ahead of a blocking call on the Tk thread."""
+        self._set_status(message)
         self.master.update_idletasks()
 
+    def _flush_status(self) -> None:
+        """Show the latest status message if it changed."""
+        message = self._pending_status
+        if message is not self._shown_status:
+            self._shown_status = message
+            self.var_status.set(message)
+
+    def _poll_status(self) -> None:
+        """Show status messages posted from recorder threads."""
+        self._flush_status()
+        self.master.after(self.STATUS_POLL_MS, self._poll_status)
+
     def _start_recording(self) -> None:
         """Start screen recording with current configuration."""
         if self.recording:
@@ -1239,7 +1539,7 @@ class ModernRecorderApp(ttk.Frame):
             
         try:
             # Validate audio dependencies
-            if self.var_record_audio.get() and not is_audio_available():
+            if self.var_record_audio.get() and not _audio_backend().is_audio_available():
                 response = messagebox.askyesno(
                     "Audio Dependencies Missing",
                     "Audio recording requires sounddevice and soundfile packages.\n"
@@ -1253,7 +1553,7 @@ class ModernRecorderApp(ttk.Frame):
             config = self._create_config()
             
             # Create and start recorder
-            self.recorder = ScreenRecorder(config, status_callback=self._set_status)
+            self.recorder = _video_backend().ScreenRecorder(config, status_callback=self._set_status)
             self.recorder.start()
             
             # Update UI state
@@ -1265,42 +1565,56 @@ class ModernRecorderApp(ttk.Frame):
             self._set_status(f"❌ Error: {ex}")
 
     def _stop_recording(self) -> None:
-        """Stop current recording."""
-        if not self.recording or not self.recorder:
+        """
+        Stop current recording.
+        The recorder finalizes on its own thread (writer release, mux); the
+        outcome is reported once it has finished, without blocking the UI.
+        """
+        if not self.recording or not self.recorder or self._stopping:
             return
-            
-        try:
-            self._set_status("⏹️ Stopping recording...")
-            self.recorder.stop()
-            
-            # Check for errors
-            last_error = self.recorder.get_last_error()
-            if last_error:
-                self._set_status(f"⚠️ Recording completed with warnings: {last_error}")
-            else:
-                self._set_status(f"✅ Recording saved: {self.recorder.cfg.output_path}")
-                
-        except Exception as ex:
-            messagebox.showerror("Stop Error", str(ex))
-            self._set_status(f"❌ Stop error: {ex}")
-        finally:
-            self.recording = False
-            self._update_button_states()
+        self._stopping = True
+        self._show_status_now("⏹️ Stopping recording...")
+        self.btn_stop.configure(state=tk.DISABLED)
+        stop_recording_async(self.master, self.recorder, self.STATUS_POLL_MS, self._on_recording_stopped)
+
+    def _on_recording_stopped(self, finished: bool) -> None:
+        """
+        Report how the recording ended.
+        
+        Args:
+            finished: True if the recorder finished saving
+        """
+        self._stopping = False
+        self.recording = False
+        self._update_button_states()
+        
+        last_error = self.recorder.get_last_error() if self.recorder else None
+        if not finished:
+            self._set_status("❌ Stop error: recording did not finish saving")
+        elif last_error:
+            self._set_status(f"⚠️ Recording completed with warnings: {last_error}")
+        else:
+            self._set_status(f"✅ Recording saved: {self.recorder.cfg.output_path}")
 
     def _on_close(self) -> None:
-        """Handle application close event."""
-        try:
-            if self.recorder and self.recording:
-                self.recorder.stop()
-        except Exception:
-            pass
-        self.master.destroy()
+        """
+        Handle application close event.
+        A running recording is finalized on a worker thread while the window
+        is hidden, so closing does not freeze the UI during muxing.
+        """
+        if not (self.recorder and self.recording):
+            self.master.destroy()
+            return
+        close_after_recording(self.master, self.recorder, self.SHUTDOWN_TIMEOUT_S, self.STATUS_POLL_MS)
 
 
 def create_modern_app() -> tk.Tk:
     """Create and configure the modern application window."""
     root = tk.Tk()
     
+    # Keep the window unmapped while widgets are packed so it is laid out once
+    root.withdraw()
+    
     # Create modern application
     app = ModernRecorderApp(root)
     
@@ -1312,4 +1626,7 @@ def create_modern_app() -> tk.Tk:
     except Exception:
         pass
     
+    root.update_idletasks()
+    root.deiconify()
+    
     return root
@@ -0,0 +1,74 @@
+"""
+Recording stop and application shutdown shared by the Screen Recorder windows.
+Finalization runs on the recorder's own thread; the Tk thread only polls it.
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+import tkinter as tk
+
+if TYPE_CHECKING:
+    from core.video import ScreenRecorder
+
+
+def stop_recording_async(master: tk.Misc, recorder: "ScreenRecorder", poll_ms: int,
+                         on_done: Callable[[bool], None],
+                         timeout_s: Optional[float] = None) -> None:
+    """
+    Stop the recorder and call back on the Tk thread once it is finalized.
+
+    Args:
+        master: Any widget of the application (used for after() polling)
+        recorder: Recorder that is currently recording
+        poll_ms: How often the Tk thread checks on the worker
+        on_done: Called with True once the file is saved, or False if
+            finalization was still running when the timeout expired
+        timeout_s: Longest wait for finalization, or None to wait until done
+    """
+    result: list[bool] = []
+    deadline = None if timeout_s is None else time.monotonic() + timeout_s
+    waiter = threading.Thread(target=_stop_and_wait, args=(recorder, deadline, result), daemon=True)
+    waiter.start()
+    master.after(poll_ms, _poll_waiter, master, waiter, result, poll_ms, on_done)
+
+
+def close_after_recording(master: tk.Tk, recorder: "ScreenRecorder",
+                          timeout_s: float, poll_ms: int) -> None:
+    """
+    Hide the window, stop the recorder and destroy the root once the
+    recording is finalized (or the timeout expires).
+
+    The recording thread is a daemon, so destroying the root early would
+    end the process while it is still muxing.
+
+    Args:
+        master: Root window to destroy
+        recorder: Recorder that is currently recording
+        timeout_s: Longest wait for the recording to finalize
+        poll_ms: How often the Tk thread checks on the worker
+    """
+    master.withdraw()
+    stop_recording_async(master, recorder, poll_ms, lambda finished: master.destroy(), timeout_s)
+
+
+def _stop_and_wait(recorder: "ScreenRecorder", deadline: Optional[float], result: list[bool]) -> None:
+    """Stop the recorder and wait for its thread to finish finalizing."""
+    finished = False
+    try:
+        recorder.stop()
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        finished = recorder.wait_finished(timeout)
+    except Exception:
+        pass
+    result.append(finished)
+
+
+def _poll_waiter(master: tk.Misc, waiter: threading.Thread, result: list[bool],
+                 poll_ms: int, on_done: Callable[[bool], None]) -> None:
+    """Hand the outcome to on_done once the waiter thread has finished."""
+    if waiter.is_alive():
+        master.after(poll_ms, _poll_waiter, master, waiter, result, poll_ms, on_done)
+        return
+    on_done(bool(result and result[0]))
@@ -3,6 +3,9 @@ AI-Style Color Themes for the Modern Screen Recorder
 Additional color schemes and styling options.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 # AI-Inspired Color Palettes
 THEMES = {
     "default": {
@@ -104,13 +107,17 @@ THEMES = {
     }
 }
 
+# Theme names in display order
+_AVAILABLE_THEMES = tuple(THEMES)
+
+@lru_cache(maxsize=16)
 def get_theme(theme_name: str = "default"):
-    """Get color theme by name."""
-    return THEMES.get(theme_name, THEMES["default"])
+    """Get color theme by name (a shared read-only view of the palette)."""
+    return MappingProxyType(THEMES.get(theme_name, THEMES["default"]))
 
 def get_available_themes():
-    """Get list of available theme names."""
-    return list(THEMES.keys())
+    """Get the available theme names."""
+    return _AVAILABLE_THEMES
 
 # Gradient definitions for advanced styling
 GRADIENTS = {
@@ -1,5 +1,13 @@
 """Utility functions and helpers."""
 
-from .helpers import fourcc_code, find_ffmpeg_path, test_ffmpeg, get_ffmpeg_error_message
+from .helpers import (
+    fourcc_code, default_output_name,
+    find_ffmpeg_path, cached_ffmpeg_path, invalidate_ffmpeg_path,
+    test_ffmpeg, cached_test_ffmpeg, get_ffmpeg_error_message,
+)
 
-__all__ = ["fourcc_code", "find_ffmpeg_path", "test_ffmpeg", "get_ffmpeg_error_message"]
+__all__ = [
+    "fourcc_code", "default_output_name",
+    "find_ffmpeg_path", "cached_ffmpeg_path", "invalidate_ffmpeg_path",
+    "test_ffmpeg", "cached_test_ffmpeg", "get_ffmpeg_error_message",
+]
@@ -4,29 +4,57 @@ Contains helper functions and common utilities.
 """
 
 import os
-import shutil
-import subprocess
-from typing import Optional, Tuple
+import time
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 
 
-def fourcc_code(code: str) -> int:
+def fourcc_code(code: Union[str, bytes, bytearray]) -> int:
     """
     Compute FOURCC integer code from a 4-char string without using cv2 helper.
     
     Args:
-        code: 4-character string representing the codec
+        code: 4-character string (or 4 bytes) representing the codec
         
     Returns:
-        Integer FOURCC code
+        Integer FOURCC code (0 for anything but 4 ASCII characters or 4 bytes)
     """
-    if not isinstance(code, str) or len(code) != 4:
+    # Checked before the cache lookup, which would reject unhashable arguments
+    if isinstance(code, bytearray):
+        code = bytes(code)
+    elif not isinstance(code, (str, bytes)):
         return 0
-    c1, c2, c3, c4 = code[0], code[1], code[2], code[3]
+    return _packed_fourcc(code)
+
+
+@lru_cache(maxsize=16)
+def _packed_fourcc(code: Union[str, bytes]) -> int:
+    """Pack a FOURCC tag (cached, since callers only use a handful of codecs)."""
+    if isinstance(code, str):
+        try:
+            code = code.encode('ascii')
+        except UnicodeEncodeError:
+            return 0
+    if len(code) != 4:
+        return 0
+    return int.from_bytes(code, 'little')
+
+
+def default_output_name() -> str:
+    """Get the timestamped default file name for a new recording."""
+    return time.strftime("recording_%Y%m%d_%H%M%S.mp4")
+
+
+@lru_cache(maxsize=1)
+def _common_ffmpeg_paths() -> Tuple[str, ...]:
+    """Get the usual Windows FFmpeg install locations (home folder expanded once)."""
+    home = os.path.expanduser("~")
     return (
-        (ord(c1) & 255)
-        | ((ord(c2) & 255) << 8)
-        | ((ord(c3) & 255) << 16)
-        | ((ord(c4) & 255) << 24)
+        r"C:\ffmpeg\bin\ffmpeg.exe",
+        r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
+        r"C:\Program Files (x86)\ffmpeg\bin\ffmpeg.exe",
+        os.path.join(home, "ffmpeg", "bin", "ffmpeg.exe"),
+        os.path.join(home, "Downloads", "ffmpeg", "bin", "ffmpeg.exe"),
     )
 
 
@@ -65,6 +93,7 @@ def find_ffmpeg_path(config_path: Optional[str] = None) -> Tuple[Optional[str],
             return cand, f"FFMPEG_PATH environment: {env_path}"
     
     # 3. Check system PATH
+    import shutil  # Deferred: only needed when searching
     ffmpeg = shutil.which('ffmpeg')
     if ffmpeg:
         search_paths.append(f"System PATH: {ffmpeg}")
@@ -72,14 +101,7 @@ def find_ffmpeg_path(config_path: Optional[str] = None) -> Tuple[Optional[str],
     
     # 4. Check common Windows locations
     if os.name == 'nt':
-        common_paths = [
-            r"C:\ffmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files\ffmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files (x86)\ffmpeg\bin\ffmpeg.exe",
-            os.path.expanduser(r"~\ffmpeg\bin\ffmpeg.exe"),
-            os.path.expanduser(r"~\Downloads\ffmpeg\bin\ffmpeg.exe")
-        ]
-        for path in common_paths:
+        for path in _common_ffmpeg_paths():
             search_paths.append(f"Common location: {path}")
             if os.path.isfile(path):
                 return path, f"Common location: {path}"
@@ -89,6 +111,46 @@ def find_ffmpeg_path(config_path: Optional[str] = None) -> Tuple[Optional[str],
     return None, f"Not found. Searched:\n{search_summary}"
 
 
+# FFmpeg lookup cache keyed by (configured path, FFMPEG_PATH, PATH)
+_FFMPEG_CACHE: dict[Tuple[str, str, str], Tuple[Optional[str], str]] = {}
+
+# Successful `ffmpeg -version` results keyed by (path, mtime, size)
+_FFMPEG_TEST_CACHE: dict[Tuple[str, int, int], Tuple[bool, str]] = {}
+
+
+def cached_ffmpeg_path(config_path: Optional[str] = None) -> Tuple[Optional[str], str]:
+    """
+    Find FFmpeg like find_ffmpeg_path(), remembering the result.
+    
+    The search stats every PATH entry, while installs change rarely; call
+    invalidate_ffmpeg_path() to search again. The FFMPEG_PATH and PATH
+    variables are part of the key, so changing either searches again.
+    Failed searches are not cached, so a newly installed FFmpeg is picked
+    up on the next call.
+    
+    Args:
+        config_path: User-provided FFmpeg path from configuration
+        
+    Returns:
+        Tuple of (ffmpeg_path, source_description)
+    """
+    config_path = (config_path or "").strip()
+    environ = os.environ
+    key = (config_path, environ.get('FFMPEG_PATH', ''), environ.get('PATH', ''))
+    cached = _FFMPEG_CACHE.get(key)
+    if cached is None:
+        cached = find_ffmpeg_path(config_path)
+        if cached[0]:
+            _FFMPEG_CACHE[key] = cached
+    return cached
+
+
+def invalidate_ffmpeg_path() -> None:
+    """Drop cached FFmpeg lookups and test results so the next call searches again."""
+    _FFMPEG_CACHE.clear()
+    _FFMPEG_TEST_CACHE.clear()
+
+
 def test_ffmpeg(ffmpeg_path: str) -> Tuple[bool, str]:
     """
     Test if FFmpeg executable is working.
@@ -99,6 +161,8 @@ def test_ffmpeg(ffmpeg_path: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
+    import subprocess  # Deferred: most callers never test FFmpeg
+    
     try:
         proc = subprocess.run(
             [ffmpeg_path, '-version'], 
@@ -121,17 +185,48 @@ def test_ffmpeg(ffmpeg_path: str) -> Tuple[bool, str]:
         return False, f"FFmpeg test error: {ex}"
 
 
-def get_ffmpeg_error_message(config_path: Optional[str] = None) -> str:
+def cached_test_ffmpeg(ffmpeg_path: str) -> Tuple[bool, str]:
+    """
+    Test FFmpeg like test_ffmpeg(), reusing an earlier success.
+    
+    The binary's modification time and size are part of the key (one
+    stat call), so replacing the executable triggers a new test, even
+    when the copy preserved the timestamp. Failures are always re-tested.
+    
+    Args:
+        ffmpeg_path: Path to FFmpeg executable
+        
+    Returns:
+        Tuple of (success, message)
+    """
+    try:
+        st = os.stat(ffmpeg_path)
+        key = (ffmpeg_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return test_ffmpeg(ffmpeg_path)
+    cached = _FFMPEG_TEST_CACHE.get(key)
+    if cached is None:
+        cached = test_ffmpeg(ffmpeg_path)
+        if cached[0]:
+            _FFMPEG_TEST_CACHE[key] = cached
+    return cached
+
+
+def get_ffmpeg_error_message(config_path: Optional[str] = None,
+                             search_details: Optional[str] = None) -> str:
     """
     Generate comprehensive error message for missing FFmpeg.
     
     Args:
         config_path: User-provided FFmpeg path from configuration
+        search_details: Description returned by a failed lookup; when
+            omitted the search is run again to produce it
         
     Returns:
         Detailed error message with troubleshooting steps
     """
-    _, search_details = find_ffmpeg_path(config_path)
+    if search_details is None:
+        _, search_details = find_ffmpeg_path(config_path)
     
     error_msg = f"FFmpeg not found. {search_details}"
     error_msg += "\n\nTo fix this:"